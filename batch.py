@@ -0,0 +1,127 @@
+"""Headless batch runner for the cancer/cure Game of Life.
+
+Loads a grid CSV (as saved by the GUI), runs it for a number of generations
+and writes the final grid plus per-generation population counts. Only the
+simulation model and NumPy are imported; no customtkinter, tkinter,
+matplotlib or PIL. It runs on machines without a display and starts quickly.
+
+Example:
+    python batch.py start.csv -n 1000 --engine numpy --seed 42 \\
+        --boundary periodic periodic mirror mirror --output final.csv --counts counts.csv
+"""
+import argparse
+import csv
+import sys
+
+import numpy as np
+
+from simulation import (Grid, GameRunner, CELL_NAMES, CANCER, CURE, BASE_CANCER_WEIGHT, BASE_CURE_WEIGHT,
+                        read_grid_file, write_grid_file)
+
+BOUNDARY_MODES = ("normal", "periodic", "mirror")
+
+
+def load_grid(filename, engine="numpy", boundary_modes=None, cancer_weight=None, cure_weight=None):
+    """Build a Grid from a grid file, overriding the file's boundaries and weights where given
+
+    Returns (grid, settings) where settings holds the values actually used.
+    """
+    types, settings = read_grid_file(filename)
+    settings["grid_size"] = types.shape[0]
+    settings["boundary_modes"] = list(boundary_modes or settings.get("boundary_modes", ["normal"] * 4))
+    if cancer_weight is not None:
+        settings["cancer_weight"] = cancer_weight
+    if cure_weight is not None:
+        settings["cure_weight"] = cure_weight
+    settings.setdefault("cancer_weight", BASE_CANCER_WEIGHT)
+    settings.setdefault("cure_weight", BASE_CURE_WEIGHT)
+
+    storage = "array" if engine in GameRunner.array_engines else "objects"
+    grid = Grid.from_arrays(types,
+                            np.where(types == CANCER, settings["cancer_weight"], 0.0),
+                            np.where(types == CURE, settings["cure_weight"], 0.0),
+                            mode_list=settings["boundary_modes"], storage=storage)
+    return grid, settings
+
+
+def run_batch(grid, generations, engine="numpy", seed=None, counter_rng=False, active_set=False,
+              stop_on_steady_state=False, unbounded=False):
+    """Run a grid for a number of generations
+
+    Returns (runner, counts) where runner.grid is the final grid and counts
+    is a (generations + 1, 4) array of Dead/Alive/Cancer/Cure populations,
+    starting with the initial grid. With stop_on_steady_state the run ends
+    as soon as the board dies out or enters a cycle, and counts stops at
+    that generation. With unbounded the grid is a window onto an unbounded
+    universe (see GameRunner); counts and runner.grid cover that window.
+    """
+    runner = GameRunner(grid, engine, active_set=active_set, seed=seed, counter_rng=counter_rng,
+                        unbounded=unbounded)
+    counts = np.zeros((generations + 1, len(CELL_NAMES)), dtype=np.int64)
+    counts[0] = runner.grid.count_types()
+    for generation in range(1, generations + 1):
+        runner.update()
+        counts[generation] = runner.grid.count_types()
+        if stop_on_steady_state and runner.steady_state:
+            return runner, counts[:generation + 1]
+    return runner, counts
+
+
+def write_counts(counts, out):
+    """Write population counts as CSV rows: generation, then one column per cell type"""
+    writer = csv.writer(out)
+    writer.writerow(["generation"] + [CELL_NAMES[code] for code in sorted(CELL_NAMES)])
+    for generation, row in enumerate(counts):
+        writer.writerow([generation] + row.tolist())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Game of Life grid file headless.")
+    parser.add_argument("grid_file", help="grid CSV to start from (as saved by the GUI)")
+    parser.add_argument("-n", "--generations", type=int, default=100, help="generations to run (default 100)")
+    parser.add_argument("--engine", choices=GameRunner.engines, default="numpy",
+                        help="stepping engine (default numpy)")
+    parser.add_argument("--boundary", nargs=4, choices=BOUNDARY_MODES, metavar=("LEFT", "RIGHT", "TOP", "BOTTOM"),
+                        help="boundary modes; defaults to the grid file's")
+    parser.add_argument("--cancer-weight", type=float, help="weight of every Cancer cell; defaults to the file's")
+    parser.add_argument("--cure-weight", type=float, help="weight of every Cure cell; defaults to the file's")
+    parser.add_argument("--seed", type=int, help="random seed for cancer/cure transitions")
+    parser.add_argument("--counter-rng", action="store_true",
+                        help="derive draws from (seed, generation, row, col) with Philox")
+    parser.add_argument("--active-set", action="store_true", help="only evaluate regions near non-Dead cells")
+    parser.add_argument("--unbounded", action="store_true",
+                        help="let cells leave the grid and keep evolving outside it (boundaries are ignored)")
+    parser.add_argument("--stop-on-steady-state", action="store_true",
+                        help="stop early once the board dies out or repeats a cycle")
+    parser.add_argument("-o", "--output", help="write the final grid to this CSV")
+    parser.add_argument("--counts", default="-",
+                        help="write per-generation population counts to this CSV (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    grid, settings = load_grid(args.grid_file, args.engine, args.boundary, args.cancer_weight, args.cure_weight)
+    runner, counts = run_batch(grid, args.generations, args.engine, seed=args.seed,
+                               counter_rng=args.counter_rng, active_set=args.active_set,
+                               stop_on_steady_state=args.stop_on_steady_state, unbounded=args.unbounded)
+    if runner.extinct:
+        print(f"Every cell is Dead by generation {runner.generation}", file=sys.stderr)
+    elif runner.period is not None:
+        print(f"Period {runner.period} cycle from generation {runner.cycle_start}", file=sys.stderr)
+    if runner.universe is not None:
+        print(f"Occupied area: {runner.universe.bounding_box()} in {len(runner.universe.chunks)} chunks",
+              file=sys.stderr)
+
+    if args.output:
+        write_grid_file(args.output, runner.grid.to_arrays()[0], settings)
+    if args.counts == "-":
+        write_counts(counts, sys.stdout)
+    else:
+        with open(args.counts, 'w', newline='') as out:
+            write_counts(counts, out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Bit-packed stepping engine for boards that only hold Alive and Dead cells.
+
+Each board row is packed into uint64 words, 64 cells per word, and B3/S23 is
+evaluated with bitwise full-adder logic on whole words. Boundary handling
+follows Grid.mode_list exactly like the other engines, including mirror
+probes that land on the cell itself.
+"""
+import numpy as np
+
+from vectorized_engine import boundary_indices
+
+WORD_BITS = 64
+
+
+def pack_rows(alive):
+    """Pack a (rows, cols) boolean board into a (rows, words) uint64 array"""
+    rows, cols = alive.shape
+    words = -(-cols // WORD_BITS)
+    packed_bytes = np.zeros((rows, words * 8), dtype=np.uint8)
+    packed_bytes[:, :-(-cols // 8)] = np.packbits(alive, axis=1, bitorder="little")
+    return packed_bytes.view("<u8").astype(np.uint64)
+
+
+def unpack_rows(packed, cols):
+    """Unpack a (rows, words) uint64 array back into a (rows, cols) boolean board"""
+    packed_bytes = packed.astype("<u8").view(np.uint8)
+    return np.unpackbits(packed_bytes, axis=1, count=cols, bitorder="little").astype(bool)
+
+
+def full_add(a, b, c):
+    """Bitwise full adder: return (sum, carry) words"""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (c & partial)
+
+
+class BitpackedEngine:
+    """Steps pure Conway boards one uint64 word (64 cells) per operation"""
+
+    def step(self, alive, mode_list):
+        """Return the next generation of a boolean Alive board"""
+        return self.run(alive, mode_list, 1)
+
+    def run(self, alive, mode_list, generations):
+        """Advance a boolean Alive board several generations without unpacking"""
+        rows, cols = alive.shape
+        packed = pack_rows(alive)
+        for _ in range(generations):
+            packed = self.step_packed(packed, cols, mode_list)
+        return unpack_rows(packed, cols)
+
+    def step_packed(self, packed, cols, mode_list):
+        """Advance a packed board one generation and return the new packed board"""
+        rows = packed.shape[0]
+        row_index, _ = boundary_indices(rows, cols, tuple(mode_list))
+        tail_mask = self.tail_mask(cols, packed.shape[1])
+
+        # Rows above and below each row; rows beyond a "normal" edge are empty
+        north = packed[row_index[:rows]]
+        north[row_index[:rows] < 0] = 0
+        south = packed[row_index[2:]]
+        south[row_index[2:] < 0] = 0
+
+        neighbors = [north, south]
+        for board in (north, packed, south):
+            neighbors.append(self.shift_west(board, cols, mode_list[0], tail_mask))
+            neighbors.append(self.shift_east(board, cols, mode_list[1]))
+
+        # Add the 8 neighbor bits per cell: ones plus four weight-two carries
+        sum_a, carry_a = full_add(neighbors[0], neighbors[1], neighbors[2])
+        sum_b, carry_b = full_add(neighbors[3], neighbors[4], neighbors[5])
+        sum_c, carry_c = neighbors[6] ^ neighbors[7], neighbors[6] & neighbors[7]
+        ones, carry_d = full_add(sum_a, sum_b, sum_c)
+
+        # A count of 2 or 3 means exactly one of the weight-two carries is set
+        any_pair = (((carry_a | carry_b) & (carry_c | carry_d))
+                    | (carry_a & carry_b) | (carry_c & carry_d))
+        exactly_one = (carry_a ^ carry_b ^ carry_c ^ carry_d) & ~any_pair
+
+        # Birth on 3 (ones set), survival on 2 or 3
+        return exactly_one & (ones | packed) & tail_mask
+
+    def tail_mask(self, cols, words):
+        """Return a per-word mask that keeps only the bits of real columns"""
+        mask = np.full(words, np.uint64(0xFFFFFFFFFFFFFFFF), dtype=np.uint64)
+        remainder = cols % WORD_BITS
+        if remainder:
+            mask[-1] = np.uint64((1 << remainder) - 1)
+        return mask
+
+    def shift_west(self, board, cols, left_mode, tail_mask):
+        """Return a board where each cell holds its left neighbor's value"""
+        shifted = board << np.uint64(1)
+        shifted[:, 1:] |= board[:, :-1] >> np.uint64(WORD_BITS - 1)
+        # Column 0 reads across the left boundary
+        if left_mode == "periodic":
+            shifted[:, 0] |= self.column_bit(board, cols - 1)
+        elif left_mode == "mirror":
+            shifted[:, 0] |= board[:, 0] & np.uint64(1)
+        return shifted & tail_mask
+
+    def shift_east(self, board, cols, right_mode):
+        """Return a board where each cell holds its right neighbor's value"""
+        shifted = board >> np.uint64(1)
+        shifted[:, :-1] |= board[:, 1:] << np.uint64(WORD_BITS - 1)
+        # The last column reads across the right boundary
+        last_word, last_bit = divmod(cols - 1, WORD_BITS)
+        if right_mode == "periodic":
+            shifted[:, last_word] |= self.column_bit(board, 0) << np.uint64(last_bit)
+        elif right_mode == "mirror":
+            shifted[:, last_word] |= self.column_bit(board, cols - 1) << np.uint64(last_bit)
+        return shifted
+
+    def column_bit(self, board, col):
+        """Return column col of a packed board as 0/1 words"""
+        word, bit = divmod(col, WORD_BITS)
+        return (board[:, word] >> np.uint64(bit)) & np.uint64(1)
@@ -0,0 +1,218 @@
+"""Unbounded sparse universe stored as a dictionary of fixed-size chunks.
+
+Cell (row, col) lives in chunk (row // chunk_size, col // chunk_size), and
+only chunks holding a non-Dead cell are stored. A chunk is allocated when
+activity spills into it and dropped again as soon as it is entirely Dead,
+so memory and step time follow the occupied area rather than its bounding
+box. There are no edges: every cell has all eight neighbors, and rows and
+columns may be negative.
+
+Each generation stacks the chunks that can change, each padded with a
+one-cell ring copied from its neighbors, and steps the whole stack with the
+NumPy engine's rules in one call.
+"""
+import numpy as np
+
+from vectorized_engine import (DEAD, ALIVE, CANCER, CURE, COUNT_CHANNELS, WEIGHT_CHANNELS, VectorizedEngine,
+                               assemble_histogram, random_candidates, zobrist_keys, xor_keys)
+
+# Default edge length of a chunk
+CHUNK_SIZE = 64
+
+# Neighbor chunk offset -> the edge cells of a chunk that border that neighbor
+EDGE_CELLS = {
+    (-1, -1): np.s_[0, 0], (-1, 0): np.s_[0, :], (-1, 1): np.s_[0, -1],
+    (0, -1): np.s_[:, 0], (0, 1): np.s_[:, -1],
+    (1, -1): np.s_[-1, 0], (1, 0): np.s_[-1, :], (1, 1): np.s_[-1, -1],
+}
+
+
+def padded_histogram(types, cancer_weighting, cure_weighting):
+    """Return the neighbor histogram of the interior of padded (..., n + 2, n + 2) blocks
+
+    The ring of each block holds the real neighboring cells, so every
+    neighbor is counted and every weight is in bounds.
+    """
+    counts = np.empty((len(COUNT_CHANNELS),) + types.shape, dtype=np.uint8)
+    for code in (DEAD, ALIVE, CANCER, CURE):
+        counts[code] = types == code
+    counts[4] = counts[CANCER]
+    counts[5] = counts[CURE]
+    weights = np.empty((len(WEIGHT_CHANNELS),) + types.shape)
+    weights[0] = np.where(counts[CANCER] > 0, cancer_weighting, 0.0)
+    weights[1] = np.where(counts[CURE] > 0, cure_weighting, 0.0)
+    return assemble_histogram(counts, weights)
+
+
+class ChunkedUniverse:
+    """Unbounded board of (types, cancer_weighting, cure_weighting) chunks
+
+    Chunks use the same uint8 type codes and float32 weights as an
+    array-backed Grid. The Zobrist hash and type counts of the universe
+    are kept up to date from the cells that change, like Grid's.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        # (chunk_row, chunk_col) -> (types, cancer_weighting, cure_weighting)
+        self.chunks = {}
+        self.rules = VectorizedEngine()
+        self._state_hash = 0
+        self._counts = np.zeros(4, dtype=np.int64)
+        n = chunk_size
+        # (neighbor offset, ring slice of a padded block, source slice of the neighbor chunk)
+        spans = {-1: (np.s_[0:1], np.s_[n - 1:n]), 0: (np.s_[1:n + 1], np.s_[0:n]), 1: (np.s_[n + 1:n + 2], np.s_[0:1])}
+        self.halo = [((dr, dc), (spans[dr][0], spans[dc][0]), (spans[dr][1], spans[dc][1]))
+                     for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+    @classmethod
+    def from_arrays(cls, types, cancer_weighting, cure_weighting, origin=(0, 0), chunk_size=CHUNK_SIZE):
+        """Build a universe holding a board whose top-left cell is at origin"""
+        universe = cls(chunk_size)
+        universe.set_window(origin[0], origin[1], types, cancer_weighting, cure_weighting)
+        return universe
+
+    def empty_chunk(self):
+        """Return a new all-Dead chunk"""
+        n = self.chunk_size
+        return (np.zeros((n, n), dtype=np.uint8), np.zeros((n, n), dtype=np.float32),
+                np.zeros((n, n), dtype=np.float32))
+
+    def overlaps(self, row, col, rows, cols):
+        """Yield (chunk key, chunk slice, window slice) for the chunks a block of cells covers"""
+        n = self.chunk_size
+        for chunk_row in range(row // n, (row + rows - 1) // n + 1):
+            for chunk_col in range(col // n, (col + cols - 1) // n + 1):
+                top, left = chunk_row * n, chunk_col * n
+                row_start, col_start = max(row, top), max(col, left)
+                row_stop, col_stop = min(row + rows, top + n), min(col + cols, left + n)
+                yield ((chunk_row, chunk_col),
+                       np.s_[row_start - top:row_stop - top, col_start - left:col_stop - left],
+                       np.s_[row_start - row:row_stop - row, col_start - col:col_stop - col])
+
+    def window(self, row, col, rows, cols):
+        """Return the (types, cancer, cure) arrays of the rows x cols block whose top-left cell is (row, col)"""
+        types = np.zeros((rows, cols), dtype=np.uint8)
+        cancer_weighting = np.zeros((rows, cols), dtype=np.float32)
+        cure_weighting = np.zeros((rows, cols), dtype=np.float32)
+        for key, inside, block in self.overlaps(row, col, rows, cols):
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                types[block], cancer_weighting[block], cure_weighting[block] = (array[inside] for array in chunk)
+        return types, cancer_weighting, cure_weighting
+
+    def set_window(self, row, col, types, cancer_weighting, cure_weighting):
+        """Overwrite the block of cells whose top-left cell is (row, col) with the given arrays"""
+        rows, cols = types.shape
+        for key, inside, block in self.overlaps(row, col, rows, cols):
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = self.empty_chunk()
+            new_types = types[block]
+            self.track_changes(chunk[0][inside], new_types, key, inside)
+            chunk[0][inside] = new_types
+            chunk[1][inside] = np.where(new_types == CANCER, cancer_weighting[block], 0.0)
+            chunk[2][inside] = np.where(new_types == CURE, cure_weighting[block], 0.0)
+            if chunk[0].any():
+                self.chunks[key] = chunk
+            else:
+                self.chunks.pop(key, None)
+
+    def track_changes(self, old, new, key, inside):
+        """Update the hash and counts for one chunk slice going from old to new type codes"""
+        changed = np.nonzero(old != new)
+        if not changed[0].size:
+            return
+        rows = changed[0] + key[0] * self.chunk_size + (inside[0].start or 0)
+        cols = changed[1] + key[1] * self.chunk_size + (inside[1].start or 0)
+        self.apply_changes(old[changed], new[changed], rows, cols)
+
+    def apply_changes(self, old, new, rows, cols):
+        """Fold changed cells (old and new codes at rows, cols) into the hash and counts"""
+        self._state_hash ^= xor_keys(zobrist_keys(old, rows, cols) ^ zobrist_keys(new, rows, cols))
+        self._counts += np.bincount(new, minlength=4) - np.bincount(old, minlength=4)
+
+    def state_hash(self):
+        """Return the Zobrist hash of every non-Dead cell (equal to a Grid's for the same cells)"""
+        return self._state_hash
+
+    def count_types(self):
+        """Return Dead/Alive/Cancer/Cure counts; Dead counts only the allocated chunks"""
+        counts = self._counts.copy()
+        counts[DEAD] = len(self.chunks) * self.chunk_size ** 2 - counts[ALIVE:].sum()
+        return counts
+
+    def bounding_box(self):
+        """Return (row_start, col_start, row_stop, col_stop) around every non-Dead cell, or None"""
+        n = self.chunk_size
+        bounds = None
+        for (chunk_row, chunk_col), (types, _, _) in self.chunks.items():
+            rows, cols = np.nonzero(types)
+            box = (chunk_row * n + rows.min(), chunk_col * n + cols.min(),
+                   chunk_row * n + rows.max() + 1, chunk_col * n + cols.max() + 1)
+            bounds = box if bounds is None else (min(bounds[0], box[0]), min(bounds[1], box[1]),
+                                                 max(bounds[2], box[2]), max(bounds[3], box[3]))
+        return None if bounds is None else tuple(int(value) for value in bounds)
+
+    def active_chunks(self):
+        """Return the sorted keys of the chunks that can change next generation
+
+        These are the stored chunks plus each neighbor that one of them has
+        a non-Dead cell bordering; any other chunk is Dead with no non-Dead
+        neighbor and stays Dead.
+        """
+        active = set(self.chunks)
+        for (chunk_row, chunk_col), (types, _, _) in self.chunks.items():
+            for (dr, dc), edge in EDGE_CELLS.items():
+                if np.any(types[edge]):
+                    active.add((chunk_row + dr, chunk_col + dc))
+        return sorted(active)
+
+    def step(self, stream):
+        """Advance one generation, drawing random pairs from stream; returns the chunks evaluated
+
+        stream is a UniformStream or CounterStream. Pairs are requested in
+        chunk order then row-major order within a chunk; a CounterStream
+        keys them on the cells' global positions (taken modulo 2**32).
+        """
+        keys = self.active_chunks()
+        if not keys:
+            return 0
+        n = self.chunk_size
+        shape = (len(keys), n + 2, n + 2)
+        padded = (np.zeros(shape, dtype=np.uint8), np.zeros(shape), np.zeros(shape))
+        for index, (chunk_row, chunk_col) in enumerate(keys):
+            for (dr, dc), ring, source in self.halo:
+                chunk = self.chunks.get((chunk_row + dr, chunk_col + dc))
+                if chunk is not None:
+                    for target, array in zip(padded, chunk):
+                        target[(index,) + ring] = array[source]
+
+        types, cancer_weighting, cure_weighting = padded
+        interior = np.s_[:, 1:-1, 1:-1]
+        histogram = padded_histogram(types, cancer_weighting, cure_weighting)
+        candidates = random_candidates(types[interior], histogram)
+        rand = np.zeros((2,) + candidates.shape)
+        origins = np.array(keys, dtype=np.int64) * n
+        index, rows, cols = np.nonzero(candidates)
+        if index.size:
+            pairs = stream.draw((origins[index, 0] + rows) % 2 ** 32, (origins[index, 1] + cols) % 2 ** 32)
+            rand[0, index, rows, cols] = pairs[:, 0]
+            rand[1, index, rows, cols] = pairs[:, 1]
+
+        out = (np.empty(candidates.shape, dtype=np.uint8), np.empty(candidates.shape, dtype=np.float32),
+               np.empty(candidates.shape, dtype=np.float32))
+        self.rules.apply_rules(types[interior], cancer_weighting[interior], cure_weighting[interior],
+                               histogram, rand, out)
+
+        old = types[interior]
+        index, rows, cols = np.nonzero(old != out[0])
+        if index.size:
+            self.apply_changes(old[index, rows, cols], out[0][index, rows, cols],
+                               origins[index, 0] + rows, origins[index, 1] + cols)
+        # Chunks that ended up entirely Dead are freed; the rest are copied out compactly
+        occupied = out[0].any(axis=(1, 2))
+        kept = [array[occupied] for array in out]
+        self.chunks = {keys[index]: (kept[0][position], kept[1][position], kept[2][position])
+                       for position, index in enumerate(np.flatnonzero(occupied).tolist())}
+        return len(keys)
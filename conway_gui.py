@@ -5,334 +5,91 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-import csv
 import threading
 import time
-from PIL import Image, ImageDraw
-# Import classes from main.py but avoid running the main code
+from collections import deque, namedtuple
+from PIL import Image, ImageDraw, ImageTk
+# Import the simulation model without running main.py's demo code
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from simulation import (Grid, GameRunner, DeadCell, AliveCell, CancerCell, CureCell, CELL_NAMES, CELL_NAME_CODES,
+                        DEAD, ALIVE, CANCER, CURE, BASE_CANCER_WEIGHT, BASE_CURE_WEIGHT, read_grid_file,
+                        write_grid_file)
+from render import (PYRAMID_TILE, DensityPyramid, color_table, composite, density_colors, flat_atlas, line_cells,
+                    merge_changes, sprite_atlas)
 
-# We need to import the classes without running the main code
-# Let's define them here to avoid the main.py execution
-import random
-
-class Location:
-    def __init__(self, i: int, j: int):
-        self.i = i
-        self.j = j
-
-class ImplCell:
-    def __init__(self, location, grid):
-        self.location = location
-        self.grid = grid
-
-    def process(self):
-        pass
-
-    def clone(self, grid):
-        pass
-
-    def __str__(self):
-        return " "
-
-class DeadCell(ImplCell):
-    def __init__(self, row, col, grid):
-        super().__init__(Location(row, col), grid)
-
-    def clone(self, grid):
-        return DeadCell(self.location.i, self.location.j, grid)
-
-    def process(self):
-        # Standard Conway's Game of Life rule
-        neighbors = self.grid.count_neighbors(self.location.i, self.location.j)
-        if neighbors == 3:
-            return AliveCell(self.location.i, self.location.j, self.grid)
-
-        # Cancer spread - use weight as probability multiplier
-        cancer_neighbors = self.grid.count_neighbors(self.location.i, self.location.j, CancerCell)
-        if cancer_neighbors >= 1:
-            # Get the average cancer weight from neighboring cancer cells
-            total_cancer_weight = 0
-            cancer_count = 0
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di == 0 and dj == 0:
-                        continue
-                    ni, nj = self.location.i + di, self.location.j + dj
-                    if 0 <= ni < self.grid.rows and 0 <= nj < self.grid.cols:
-                        cell = self.grid.cells[ni][nj]
-                        if isinstance(cell, CancerCell):
-                            total_cancer_weight += cell.cancer_weighting
-                            cancer_count += 1
-
-            if cancer_count > 0:
-                avg_cancer_weight = total_cancer_weight / cancer_count
-                # Original cancer_chance was 0.1, now scale by weight
-                cancer_chance = 0.1 * (avg_cancer_weight / 0.01)  # 0.01 is baseline
-                cancer_chance = min(1.0, cancer_chance)  # Cap at 100%
-                if random.random() < cancer_chance:
-                    new_cancer = CancerCell(self.location.i, self.location.j, self.grid)
-                    new_cancer.cancer_weighting = avg_cancer_weight
-                    return new_cancer
-
-        # Cure generation when many cancer cells present
-        if cancer_neighbors >= 5:
-            # Get average cure weight from nearby cure cells, or use default
-            total_cure_weight = 0
-            cure_count = 0
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di == 0 and dj == 0:
-                        continue
-                    ni, nj = self.location.i + di, self.location.j + dj
-                    if 0 <= ni < self.grid.rows and 0 <= nj < self.grid.cols:
-                        cell = self.grid.cells[ni][nj]
-                        if isinstance(cell, CureCell):
-                            total_cure_weight += cell.cure_weighting
-                            cure_count += 1
-
-            # Use cure weight for spontaneous cure generation
-            if cure_count > 0:
-                avg_cure_weight = total_cure_weight / cure_count
-            else:
-                avg_cure_weight = 0.1  # Default cure weight
-
-            # Original curechance was 0.5, now scale by weight
-            cure_chance = 0.5 * (avg_cure_weight / 0.1)  # 0.1 is baseline
-            cure_chance = min(1.0, cure_chance)  # Cap at 100%
-            if random.random() < cure_chance:
-                new_cure = CureCell(self.location.i, self.location.j, self.grid)
-                new_cure.cure_weighting = avg_cure_weight
-                return new_cure
-
-        return DeadCell(self.location.i, self.location.j, self.grid)
-
-    def __str__(self):
-        return "🟥"
-
-class AliveCell(ImplCell):
-    def __init__(self, row, col, grid):
-        super().__init__(Location(row, col), grid)
-
-    def process(self):
-        neighbors = self.grid.count_neighbors(self.location.i, self.location.j)
-        if neighbors in [2, 3]:
-            return AliveCell(self.location.i, self.location.j, self.grid)
-        return DeadCell(self.location.i, self.location.j, self.grid)
-
-    def clone(self, grid):
-        return AliveCell(self.location.i, self.location.j, grid)
-
-    def __str__(self):
-        return "🟩"
-
-class CancerCell(ImplCell):
-    def __init__(self, row, col, grid):
-        self.cancer_weighting = 0.01
-        super().__init__(Location(row, col), grid)
-
-    def process(self):
-        loc = self.location
-        cure_neighbors = self.grid.count_neighbors(loc.i, loc.j, CureCell)
-        cancer_neighbors = self.grid.count_neighbors(loc.i, loc.j, CancerCell)
-
-        # Original rule: die if cure_neighbors >= 1 OR cancer_neighbors >= 7
-        # Now make it weight-dependent
-
-        # Cure effectiveness vs cancer resistance
-        if cure_neighbors >= 1:
-            # Get average cure strength
-            total_cure_strength = 0
-            cure_count = 0
-            for di in [-1, 0, 1]:
-                for dj in [-1, 0, 1]:
-                    if di == 0 and dj == 0:
-                        continue
-                    ni, nj = loc.i + di, loc.j + dj
-                    if 0 <= ni < self.grid.rows and 0 <= nj < self.grid.cols:
-                        cell = self.grid.cells[ni][nj]
-                        if isinstance(cell, CureCell):
-                            total_cure_strength += cell.cure_weighting
-                            cure_count += 1
-
-            avg_cure_strength = total_cure_strength / cure_count if cure_count > 0 else 0.1
-
-            # Calculate cure effectiveness vs cancer resistance
-            # Higher cure weight = more likely to kill cancer
-            # Higher cancer weight = more resistant to cure
-            cure_kill_chance = (avg_cure_strength / 0.1) * 0.5  # Base 50% chance at weight 0.1
-            cancer_resistance = (self.cancer_weighting / 0.01) * 0.1  # Base 10% resistance at weight 0.01
-
-            effective_cure_chance = max(0.3, cure_kill_chance - cancer_resistance)
-            if random.random() < effective_cure_chance:
-                return AliveCell(loc.i, loc.j, self.grid)
-
-        # Overcrowding death - weight affects threshold
-        # Original threshold was 7, now make it weight-dependent
-        base_threshold = 7
-        weight_modifier = (self.cancer_weighting / 0.01) - 1  # How much above baseline weight
-        overcrowd_threshold = max(5, int(base_threshold - weight_modifier))  # Higher weight = lower threshold
-
-        if cancer_neighbors >= overcrowd_threshold:
-            return DeadCell(loc.i, loc.j, self.grid)
-
-        # Cancer persists
-        new_cancer = CancerCell(loc.i, loc.j, self.grid)
-        new_cancer.cancer_weighting = self.cancer_weighting
-        return new_cancer
-
-    def clone(self, grid):
-        new_cancer = CancerCell(self.location.i, self.location.j, grid)
-        new_cancer.cancer_weighting = self.cancer_weighting
-        return new_cancer
-
-    def __str__(self):
-        return "⬜"
-
-class CureCell(ImplCell):
-    def __init__(self, row, col, grid):
-        self.cure_weighting = 0.1
-        super().__init__(Location(row, col), grid)
-
-    def process(self):
-        loc = self.location
-        cure_neighbors = self.grid.count_neighbors(loc.i, loc.j, CureCell)
-        dead_neighbors = self.grid.count_neighbors(loc.i, loc.j, DeadCell)
-
-        # Original rules: die if dead_neighbors >= 6 OR cure_neighbors >= 3
-        # Now make it weight-dependent
-
-        # Death from isolation - weight affects threshold
-        # Original threshold was 6, now make it weight-dependent
-        base_dead_threshold = 6
-        weight_modifier = (self.cure_weighting / 0.1) - 1  # How much above baseline weight
-        dead_threshold = max(4, int(base_dead_threshold + weight_modifier))  # Higher weight = higher threshold (more resistant)
-
-        if dead_neighbors >= dead_threshold:
-            return DeadCell(loc.i, loc.j, self.grid)
-
-        # Death from overcrowding - weight affects threshold
-        # Original threshold was 3, now make it weight-dependent
-        base_cure_threshold = 3
-        cure_threshold = max(2, int(base_cure_threshold + weight_modifier))  # Higher weight = higher threshold (more resistant)
-
-        if cure_neighbors >= cure_threshold:
-            return DeadCell(loc.i, loc.j, self.grid)
-
-        # Cure persists
-        new_cure = CureCell(loc.i, loc.j, self.grid)
-        new_cure.cure_weighting = self.cure_weighting
-        return new_cure
-
-    def __str__(self):
-        return "🟦"
-
-    def clone(self, grid):
-        new_cure = CureCell(self.location.i, self.location.j, grid)
-        new_cure.cure_weighting = self.cure_weighting
-        return new_cure
-
-class Grid:
-    def __init__(self, rows, cols, mode_list=["normal", "normal", "normal", "normal"]):
-        self.rows = rows
-        self.cols = cols
-        self.mode_list = mode_list
-        self.cells = [[DeadCell(j, i, self) for i in range(cols)] for j in range(rows)]
-
-    def set_cell(self, cell):
-        self.cells[cell.location.i][cell.location.j] = cell
-
-    def clone(self):
-        new_grid = Grid(self.rows, self.cols, self.mode_list)
-        for i in range(len(self.cells)):
-            for j in range(len(self.cells[0])):
-                new_grid.cells[i][j] = self.cells[i][j].clone(new_grid)
-        return new_grid
-
-    def get_cell(self, row, col):
-        return self.cells[row][col]
-
-    def check_left(self, col, mode="normal"):
-        if mode == "periodic":
-            return col % len(self.cells[0])
-        elif mode == "mirror" and col < 0:
-            return 0
-        elif col < 0:
-            return None
-        return col
-
-    def check_right(self, col, mode="normal"):
-        if mode == "periodic":
-            return col % len(self.cells[0])
-        elif mode == "mirror" and col > len(self.cells[0]) - 1:
-            return len(self.cells[0]) - 1
-        elif col > len(self.cells[0]) - 1:
-            return None
-        return col
-
-    def check_up(self, row, mode="normal"):
-        if mode == "periodic":
-            return row % len(self.cells)
-        elif mode == "mirror" and row < 0:
-            return 0
-        elif row < 0:
-            return None
-        return row
-
-    def check_down(self, row, mode="normal"):
-        if mode == "periodic":
-            return row % len(self.cells)
-        elif mode == "mirror" and row > len(self.cells) - 1:
-            return len(self.cells) - 1
-        elif row > len(self.cells) - 1:
-            return None
-        return row
-
-    def row_processor(self, row, i, mode_list):
-        if i < row:
-            return self.check_up(i, mode_list[2])
-        elif i > row:
-            return self.check_down(i, mode_list[3])
-        else:
-            return i
+# Immutable copy of one generation, handed from the simulation thread to the Tk loop
+Frame = namedtuple("Frame", ["types", "iteration", "counts", "changed_tiles"])
 
-    def col_processor(self, col, j, mode_list):
-        if j < col:
-            return self.check_left(j, mode_list[0])
-        elif j > col:
-            return self.check_right(j, mode_list[1])
-        else:
-            return j
-
-    def count_neighbors(self, row, col, cell_type=AliveCell, mode_list=None):
-        if mode_list is None:
-            mode_list = self.mode_list
-        count_cells = 0
-        for i in range(row-1, row+2):
-            row_val = self.row_processor(row, i, mode_list)
-            for j in range(col-1, col+2):
-                col_val = self.col_processor(col, j, mode_list)
-                if row_val is not None and col_val is not None:
-                    if isinstance(self.cells[row_val][col_val], cell_type):
-                        count_cells += 1
-        if isinstance(self.cells[row][col], cell_type):
-            count_cells -= 1
-        return count_cells
-
-class GameRunner:
-    def __init__(self, grid):
-        self.grid = grid
-
-    def update(self):
-        temp_grid = self.grid.clone()
-        for row in self.grid.cells:
-            for cell in row:
-                next_cell = cell.process()
-                next_cell.grid = temp_grid
-                temp_grid.set_cell(next_cell)
-        self.grid = temp_grid
+class FrameMailbox:
+    """Single-slot, latest-frame-wins handoff between the simulation thread and Tk
+
+    publish() replaces a frame the UI has not taken yet and counts it as
+    dropped, so the UI never falls behind the simulation. The dropped
+    frame's changed tiles carry over into the frame that replaces it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frame = None
+        self.dropped = 0
+
+    def publish(self, frame):
+        with self.lock:
+            if self.frame is not None:
+                self.dropped += 1
+                frame = frame._replace(changed_tiles=merge_changes(self.frame.changed_tiles, frame.changed_tiles))
+            self.frame = frame
+
+    def take(self):
+        """Return the pending frame (None if there is none) and empty the slot"""
+        with self.lock:
+            frame, self.frame = self.frame, None
+            return frame
+
+class DeadlineScheduler:
+    """Paces the simulation thread to absolute deadlines at a target generation rate
+
+    Each batch moves the deadline forward by its share of the target rate,
+    so the time spent stepping comes out of the wait instead of adding to
+    it. A loop that falls behind runs without sleeping until it catches up;
+    more than max_lag seconds of backlog is forgiven rather than replayed
+    in a burst.
+    """
+
+    def __init__(self, max_lag=0.25, window=1.0):
+        self.max_lag = max_lag
+        self.window = window
+        self.deadline = time.perf_counter()
+        # (time, generation) samples over the last window seconds, for the achieved rate
+        self.samples = deque()
+        self.achieved_rate = 0.0
+
+    def advance(self, generations, rate):
+        """Move the deadline forward by generations at rate per second; return how late (seconds) the loop is"""
+        now = time.perf_counter()
+        self.deadline += generations / rate
+        lateness = now - self.deadline
+        if lateness > self.max_lag:
+            self.deadline = now
+        return lateness
+
+    def wait(self):
+        """Sleep until the current deadline, if it is still ahead"""
+        delay = self.deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self, generation):
+        """Note that generation was reached now and update the achieved rate"""
+        now = time.perf_counter()
+        self.samples.append((now, generation))
+        while now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+        start_time, start_generation = self.samples[0]
+        if now > start_time:
+            self.achieved_rate = (generation - start_generation) / (now - start_time)
 
 class ConwayGUI:
     def __init__(self):
@@ -349,11 +106,31 @@ class ConwayGUI:
         self.grid_size = 30
         self.cell_size = 15
         self.max_canvas_size = 500  # Reduced for better performance
-        self.max_grid_size = 60  # Reduced max grid size for better performance
-        self.speed = 100  # ms between iterations
+        self.max_grid_size = 4096  # Boards larger than the canvas are shown through a zoomable viewport
+        self.max_object_grid_size = 500  # Larger boards always use an array-backed engine
+        self.size_change_delay_ms = 250  # Rebuild the board once the size slider settles
+        self.size_change_job = None
+        self.max_cell_size = 32  # Largest zoom, in pixels per cell
+        self.max_vector_grid_size = 60  # Larger boards always use the image renderer
+        self.min_sprite_size = 4  # Smaller cells are drawn in flat colors
+        self.generations_per_second = 10  # Target simulation rate
+        self.unlimited_rate = False  # Step as fast as the engine allows instead
+        self.generations_per_frame = 1  # Generations stepped per published frame
+        self.frames_per_second = 30  # Render clock, independent of the simulation rate
         self.running = False
-        self.grid = Grid(self.grid_size, self.grid_size)
-        self.game_runner = GameRunner(self.grid)
+        self.engine = "object"  # Stepping engine used by the GameRunner
+        self.active_set = False  # Only evaluate regions near non-Dead cells
+        self.seed = None  # Random seed for cancer/cure transitions (None = unseeded)
+        self.counter_rng = False  # Derive draws from (seed, generation, row, col)
+        self.stop_on_steady_state = False  # Stop running once the board dies out or cycles
+        self.unbounded = False  # Show a window onto an unbounded universe instead of a bounded board
+        self.renderer = "image"  # "image": one PhotoImage per frame, "vector": one canvas item per cell
+
+        # Boundary conditions
+        self.boundary_modes = ["normal", "normal", "normal", "normal"]  # left, right, up, down
+
+        self.grid = self.create_grid()
+        self.game_runner = self.create_runner()
         
         # Cell types and colors
         self.cell_types = {
@@ -363,13 +140,56 @@ class ConwayGUI:
             "Cure": (CureCell, "#0000FF")
         }
         self.selected_cell_type = "Alive"
-        
-        # Boundary conditions
-        self.boundary_modes = ["normal", "normal", "normal", "normal"]  # left, right, up, down
-        
+        # Type code -> RGB lookup table used by the image renderer
+        self.color_table = color_table({code: self.cell_types[name][1] for code, name in CELL_NAMES.items()})
+
+        # Renderer state: which renderer and boundary strips are on the canvas, the image
+        # renderer's persistent image, and the vector renderer's items and the types they show
+        self.drawn_renderer = None
+        self.drawn_boundary = None
+        self.board_photo = None
+        self.board_item = None
+        self.vector_items = None
+        self.vector_layout = None
+        self.drawn_types = None
+        # Image renderer tile atlases, built once per (cell_size, grid lines shown)
+        self.sprite_atlases = {}
+        # Atlas tiles as Tk images, laid over the board image for cells painted since the last redraw
+        self.stroke_tiles = {}
+
+        # Viewport: top-left board cell shown on the canvas, the last board drawn (so zoom and
+        # pan can redraw it), and where a pan drag started
+        self.view_row = 0
+        self.view_col = 0
+        self.shown_types = None
+        self.pan_anchor = None
+        # Zoomed out past one pixel per cell, each pixel blends a cells_per_pixel square of cells
+        self.cells_per_pixel = 1
+        self.density_pyramid = DensityPyramid()
+
         # Statistics tracking
         self.iteration_count = 0
+        # (generation, {cell type name: count}) samples; every generation unless a jump skipped some
         self.cell_history = []
+        # The line graph plots every chart_stride-th generation, thinned to at most max_chart_points
+        self.max_chart_points = 2000
+        self.charted_history = None
+        self.chart_stride = 1
+        self.next_chart_index = 0
+        self.chart_iterations = []
+        self.chart_values = {}
+
+        # Frames published by the simulation thread; the Tk render clock takes one per tick
+        self.mailbox = FrameMailbox()
+        self.frames_shown = 0
+        # Frames the simulation thread did not publish because it was behind schedule
+        self.frames_skipped = 0
+        # Generation a running jump is heading for, and where it started
+        self.jump_target = None
+        self.jump_start = 0
+        # Boards that advance one generation at a time cannot jump further than this
+        self.max_stepped_jump = 1000
+        self.scheduler = DeadlineScheduler()
 
         # GIF recording
         self.recording_gif = False
@@ -378,8 +198,7 @@ class ConwayGUI:
         
         # UI state
         self.is_dragging = False
-        self.drag_throttle = 0  # For throttling drag events
-        self.last_painted_cell = None  # Prevent painting same cell multiple times
+        self.last_painted_cell = None  # Previous cell of a stroke, to interpolate from
         
         self.setup_ui()
         self.create_cell_sprites()
@@ -406,15 +225,15 @@ class ConwayGUI:
         # Create scrollable frame for canvas
         self.canvas_scroll_frame = ctk.CTkScrollableFrame(
             self.canvas_frame,
-            width=min(self.grid_size * self.cell_size + 40, self.max_canvas_size),
-            height=min(self.grid_size * self.cell_size + 40, self.max_canvas_size)
+            width=min(self.view_pixels() + 40, self.max_canvas_size),
+            height=min(self.view_pixels() + 40, self.max_canvas_size)
         )
         self.canvas_scroll_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        # Canvas with extra space for boundary indicators
+        # Canvas showing the viewport, with extra space for boundary indicators
         self.border_margin = 20  # Space for boundary indicators
-        canvas_width = self.grid_size * self.cell_size + (2 * self.border_margin)
-        canvas_height = self.grid_size * self.cell_size + (2 * self.border_margin)
+        canvas_width = self.view_pixels() + (2 * self.border_margin)
+        canvas_height = self.view_pixels() + (2 * self.border_margin)
 
         self.canvas = tk.Canvas(
             self.canvas_scroll_frame,
@@ -429,6 +248,15 @@ class ConwayGUI:
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+
+        # Zoom with the mouse wheel (<Button-4>/<Button-5> on X11), pan by dragging with the right or middle button
+        self.canvas.bind("<MouseWheel>", self.on_canvas_zoom)
+        self.canvas.bind("<Button-4>", self.on_canvas_zoom)
+        self.canvas.bind("<Button-5>", self.on_canvas_zoom)
+        for button in (2, 3):
+            self.canvas.bind(f"<ButtonPress-{button}>", self.on_pan_start)
+            self.canvas.bind(f"<B{button}-Motion>", self.on_pan_drag)
+            self.canvas.bind(f"<ButtonRelease-{button}>", self.on_pan_end)
         
         # Controls frame
         controls_frame = ctk.CTkFrame(left_panel)
@@ -461,6 +289,15 @@ class ConwayGUI:
         
         self.clear_btn = ctk.CTkButton(sim_frame, text="Clear", command=self.clear_grid)
         self.clear_btn.pack(side="left", padx=5)
+
+        # Jump to generation
+        self.jump_var = ctk.StringVar(value="1000")
+        self.jump_entry = ctk.CTkEntry(sim_frame, textvariable=self.jump_var, width=90)
+        self.jump_entry.pack(side="left", padx=5)
+        self.jump_entry.bind("<Return>", lambda e: self.jump_to_generation())
+
+        self.jump_btn = ctk.CTkButton(sim_frame, text="Jump to generation", command=self.jump_to_generation)
+        self.jump_btn.pack(side="left", padx=5)
         
         # Row 2: Cell type selection
         cell_frame = ctk.CTkFrame(parent)
@@ -476,29 +313,132 @@ class ConwayGUI:
             command=self.on_cell_type_change
         )
         self.cell_type_menu.pack(side="left", padx=5)
+
+        # Engine selection
+        ctk.CTkLabel(cell_frame, text="Engine:").pack(side="left", padx=5)
+
+        self.engine_var = ctk.StringVar(value=self.engine)
+        self.engine_menu = ctk.CTkOptionMenu(
+            cell_frame,
+            variable=self.engine_var,
+            values=list(GameRunner.engines),
+            command=self.on_engine_change
+        )
+        self.engine_menu.pack(side="left", padx=5)
+        self.update_engine_choices()
+
+        # Renderer selection
+        ctk.CTkLabel(cell_frame, text="Renderer:").pack(side="left", padx=5)
+
+        self.renderer_var = ctk.StringVar(value=self.renderer)
+        self.renderer_menu = ctk.CTkOptionMenu(
+            cell_frame,
+            variable=self.renderer_var,
+            values=["image", "vector"],
+            command=self.on_renderer_change
+        )
+        self.renderer_menu.pack(side="left", padx=5)
+
+        self.active_set_var = ctk.BooleanVar(value=self.active_set)
+        self.active_set_check = ctk.CTkCheckBox(
+            cell_frame,
+            text="Active regions only",
+            variable=self.active_set_var,
+            command=self.on_active_set_change
+        )
+        self.active_set_check.pack(side="left", padx=5)
+
+        # Random seed (blank for an unseeded run)
+        ctk.CTkLabel(cell_frame, text="Seed:").pack(side="left", padx=5)
+        self.seed_var = ctk.StringVar(value="")
+        self.seed_entry = ctk.CTkEntry(cell_frame, textvariable=self.seed_var, width=80)
+        self.seed_entry.pack(side="left", padx=5)
+        self.seed_entry.bind("<Return>", self.on_seed_change)
+
+        self.seed_btn = ctk.CTkButton(cell_frame, text="Apply Seed", width=90, command=self.on_seed_change)
+        self.seed_btn.pack(side="left", padx=5)
+
+        self.counter_rng_var = ctk.BooleanVar(value=self.counter_rng)
+        self.counter_rng_check = ctk.CTkCheckBox(
+            cell_frame,
+            text="Counter-based RNG",
+            variable=self.counter_rng_var,
+            command=self.on_counter_rng_change
+        )
+        self.counter_rng_check.pack(side="left", padx=5)
+
+        self.stop_on_steady_var = ctk.BooleanVar(value=self.stop_on_steady_state)
+        self.stop_on_steady_check = ctk.CTkCheckBox(
+            cell_frame,
+            text="Stop on cycle",
+            variable=self.stop_on_steady_var,
+            command=self.on_stop_on_steady_change
+        )
+        self.stop_on_steady_check.pack(side="left", padx=5)
         
         # Row 3: Sliders
         slider_frame = ctk.CTkFrame(parent)
         slider_frame.pack(fill="x", padx=5, pady=5)
         
-        # Speed slider
-        speed_frame = ctk.CTkFrame(slider_frame)
-        speed_frame.pack(side="left", fill="x", expand=True, padx=5)
-        
-        ctk.CTkLabel(speed_frame, text="Speed (ms):").pack()
-        self.speed_slider = ctk.CTkSlider(
-            speed_frame,
-            from_=10,
+        # Simulation rate slider
+        rate_frame = ctk.CTkFrame(slider_frame)
+        rate_frame.pack(side="left", fill="x", expand=True, padx=5)
+
+        ctk.CTkLabel(rate_frame, text="Generations/sec:").pack()
+        self.rate_slider = ctk.CTkSlider(
+            rate_frame,
+            from_=1,
             to=1000,
-            number_of_steps=99,
-            command=self.on_speed_change
+            number_of_steps=999,
+            command=self.on_rate_change
         )
-        self.speed_slider.set(self.speed)
-        self.speed_slider.pack(fill="x", padx=5)
-        
-        self.speed_label = ctk.CTkLabel(speed_frame, text=f"{self.speed}ms")
-        self.speed_label.pack()
-        
+        self.rate_slider.set(self.generations_per_second)
+        self.rate_slider.pack(fill="x", padx=5)
+
+        self.rate_label = ctk.CTkLabel(rate_frame, text=self.rate_text())
+        self.rate_label.pack()
+
+        self.unlimited_rate_var = ctk.BooleanVar(value=self.unlimited_rate)
+        self.unlimited_rate_check = ctk.CTkCheckBox(
+            rate_frame,
+            text="Unlimited",
+            variable=self.unlimited_rate_var,
+            command=self.on_unlimited_rate_change
+        )
+        self.unlimited_rate_check.pack(pady=2)
+
+        # Render rate slider and batch size
+        fps_frame = ctk.CTkFrame(slider_frame)
+        fps_frame.pack(side="left", fill="x", expand=True, padx=5)
+
+        ctk.CTkLabel(fps_frame, text="Frames/sec:").pack()
+        self.fps_slider = ctk.CTkSlider(
+            fps_frame,
+            from_=1,
+            to=60,
+            number_of_steps=59,
+            command=self.on_fps_change
+        )
+        self.fps_slider.set(self.frames_per_second)
+        self.fps_slider.pack(fill="x", padx=5)
+
+        self.fps_label = ctk.CTkLabel(fps_frame, text=f"{self.frames_per_second} FPS")
+        self.fps_label.pack()
+
+        batch_row = ctk.CTkFrame(fps_frame)
+        batch_row.pack(pady=2)
+        ctk.CTkLabel(batch_row, text="Gens/frame:").pack(side="left", padx=2)
+        self.batch_var = ctk.StringVar(value=str(self.generations_per_frame))
+        self.batch_menu = ctk.CTkOptionMenu(
+            batch_row,
+            values=["1", "2", "5", "10", "50", "100"],
+            variable=self.batch_var,
+            command=self.on_batch_change,
+            width=70
+        )
+        self.batch_menu.pack(side="left", padx=2)
+
+
         # Grid size slider
         size_frame = ctk.CTkFrame(slider_frame)
         size_frame.pack(side="left", fill="x", expand=True, padx=5)
@@ -518,7 +458,7 @@ class ConwayGUI:
         self.size_label.pack()
 
         # Cell size info
-        self.cell_size_label = ctk.CTkLabel(size_frame, text=f"Cell size: {self.cell_size}px", font=("Arial", 10))
+        self.cell_size_label = ctk.CTkLabel(size_frame, text=self.view_text(), font=("Arial", 10))
         self.cell_size_label.pack()
         
         # Row 4: File operations
@@ -560,6 +500,16 @@ class ConwayGUI:
         info_text = "Range: 0.0001 - 1.0 | Higher values = stronger effect"
         ctk.CTkLabel(header_frame, text=info_text, font=("Arial", 10), text_color="gray").pack(side="right", padx=5)
 
+        # Unbounded universe: the grid becomes a window and the edges are ignored
+        self.unbounded_var = ctk.BooleanVar(value=self.unbounded)
+        self.unbounded_check = ctk.CTkCheckBox(
+            header_frame,
+            text="Unbounded",
+            variable=self.unbounded_var,
+            command=self.on_unbounded_change
+        )
+        self.unbounded_check.pack(side="left", padx=10)
+
         # Controls frame
         controls_frame = ctk.CTkFrame(weight_frame)
         controls_frame.pack(fill="x", pady=5, padx=10)
@@ -700,6 +650,18 @@ class ConwayGUI:
 
         ctk.CTkLabel(charts_frame, text="Statistics", font=("Arial", 16, "bold")).pack(pady=5)
 
+        # Cycle / extinction status reported by the GameRunner
+        self.steady_state_label = ctk.CTkLabel(charts_frame, text="")
+        self.steady_state_label.pack()
+
+        # Frames drawn vs. superseded before the UI got to them
+        self.frame_label = ctk.CTkLabel(charts_frame, text="")
+        self.frame_label.pack()
+
+        # Achieved vs. requested generations per second
+        self.rate_stats_label = ctk.CTkLabel(charts_frame, text="")
+        self.rate_stats_label.pack()
+
         # Create matplotlib figure
         self.fig = Figure(figsize=(6, 8), facecolor='#2b2b2b')
 
@@ -707,9 +669,19 @@ class ConwayGUI:
         self.pie_ax = self.fig.add_subplot(2, 1, 1)
         self.pie_ax.set_facecolor('#2b2b2b')
 
-        # Line chart
+        # Line chart, one persistent line per cell type that each tick extends in place
         self.line_ax = self.fig.add_subplot(2, 1, 2)
         self.line_ax.set_facecolor('#2b2b2b')
+        self.history_lines = {}
+        for cell_type in CELL_NAMES.values():
+            color = self.cell_types[cell_type][1]
+            self.history_lines[cell_type], = self.line_ax.plot([], [], label=cell_type, color=color, linewidth=2)
+        self.line_ax.set_xlabel("Iteration", color='white')
+        self.line_ax.set_ylabel("Cell Count", color='white')
+        self.line_ax.set_title("Cell Population Over Time", color='white')
+        self.line_ax.legend()
+        self.line_ax.tick_params(colors='white')
+        self.line_ax.grid(True, alpha=0.3)
 
         # Embed in tkinter
         self.chart_canvas = FigureCanvasTkAgg(self.fig, charts_frame)
@@ -718,6 +690,11 @@ class ConwayGUI:
     def create_cell_sprites(self):
         """Create custom sprites for different cell types"""
         self.sprites = {}
+        # Atlases (and the stroke tiles cut from them) are built from the sprites, so rebuild them on demand
+        self.sprite_atlases = {}
+        self.stroke_tiles = {}
+        if self.cell_size < self.min_sprite_size:
+            return
 
         for cell_type, (_, color) in self.cell_types.items():
             try:
@@ -725,7 +702,7 @@ class ConwayGUI:
                 sprite_path = f"sprites/{cell_type.lower()}_sprite.png"
                 if os.path.exists(sprite_path):
                     # Load and resize custom sprite
-                    img = Image.open(sprite_path)
+                    img = Image.open(sprite_path).convert("RGB")
                     img = img.resize((self.cell_size-1, self.cell_size-1), Image.Resampling.LANCZOS)
                 else:
                     # Fallback to generated sprites
@@ -768,18 +745,14 @@ class ConwayGUI:
 
         self.is_dragging = True
         self.last_painted_cell = None
-        self.drag_throttle = 0
         self.paint_cell(event.x, event.y)
 
     def on_canvas_drag(self, event):
-        """Handle canvas drag events with throttling"""
+        """Handle canvas drag events; every motion event is painted"""
         if self.running or not self.is_dragging:
             return
 
-        # Throttle drag events to reduce lag
-        self.drag_throttle += 1
-        if self.drag_throttle % 3 == 0:  # Only process every 3rd drag event
-            self.paint_cell(event.x, event.y)
+        self.paint_cell(event.x, event.y)
 
     def on_canvas_release(self, event):
         """Handle canvas release events"""
@@ -787,27 +760,48 @@ class ConwayGUI:
         self.is_dragging = False
         self.last_painted_cell = None
 
-        # Update charts after dragging is complete
+        # One full redraw replaces the stroke's per-cell updates, then update charts
         if was_dragging:
+            self.update_canvas()
             self.update_charts()
 
-    def paint_cell(self, x, y):
-        """Paint a cell at the given canvas coordinates with optimization"""
-        # Adjust coordinates for border margin
+    def canvas_cell(self, x, y):
+        """Return the board (row, col) under canvas coordinates, or None outside the viewport"""
+        # Adjust coordinates for border margin and the viewport's position on the board
         adjusted_x = x - self.border_margin
         adjusted_y = y - self.border_margin
-        col = adjusted_x // self.cell_size
-        row = adjusted_y // self.cell_size
+        view_pixels = self.view_pixels()
+        col = adjusted_x // self.cell_size * self.cells_per_pixel + self.view_col
+        row = adjusted_y // self.cell_size * self.cells_per_pixel + self.view_row
+        if (0 <= adjusted_x < view_pixels and 0 <= adjusted_y < view_pixels
+                and row < self.grid_size and col < self.grid_size):
+            return row, col
+        return None
 
-        if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-            # Avoid painting the same cell multiple times during drag
-            current_cell = (row, col)
-            if self.last_painted_cell == current_cell:
-                return
+    def paint_cell(self, x, y):
+        """Paint the cell at the given canvas coordinates and every cell on the line from the stroke's previous cell
+
+        Only the painted cells are redrawn; on_canvas_release redraws the board.
+        """
+        current_cell = self.canvas_cell(x, y)
+        if current_cell is None:
+            # Leaving the viewport ends the line; re-entering starts a new one
+            self.last_painted_cell = None
+            return
 
-            self.last_painted_cell = current_cell
+        # Avoid painting the same cell multiple times during drag
+        if self.last_painted_cell == current_cell:
+            return
+
+        # Interpolate between motion events so fast strokes leave no gaps
+        cells = [current_cell]
+        if self.last_painted_cell is not None:
+            cells = line_cells(*self.last_painted_cell, *current_cell)[1:]
+        self.last_painted_cell = current_cell
 
-            cell_class, _ = self.cell_types[self.selected_cell_type]
+        cell_class, _ = self.cell_types[self.selected_cell_type]
+        code = CELL_NAME_CODES[self.selected_cell_type]
+        for row, col in cells:
             new_cell = cell_class(row, col, self.grid)
 
             # Apply current weight settings for special cells
@@ -822,61 +816,331 @@ class ConwayGUI:
                 except (ValueError, AttributeError):
                     new_cell.cure_weighting = 0.1  # Default
 
-            self.grid.cells[row][col] = new_cell
+            self.grid.set_cell(new_cell)
+            self.draw_painted_cell(row, col, code)
 
-            # Only update canvas, skip charts during drag for performance
-            self.update_canvas()
-            if not self.is_dragging:
-                self.update_charts()
+    def draw_painted_cell(self, row, col, code):
+        """Show one painted cell without redrawing the board
 
-    def update_canvas(self):
-        """Update the canvas display with optimizations"""
+        The vector renderer recolors the cell's items. The image renderer
+        writes the cell's atlas tile (or, zoomed out past one pixel per
+        cell, a pixel in its color) straight into the board image, so a
+        stroke adds no canvas items.
+        """
+        view_row, view_col = row - self.view_row, col - self.view_col
+        view_cells = self.view_cells()
+        if not (0 <= view_row < view_cells and 0 <= view_col < view_cells):
+            return
+        if self.drawn_renderer == "vector":
+            self.configure_vector_cell(view_row, view_col, code)
+            self.drawn_types[view_row, view_col] = code
+        elif self.board_photo is not None:
+            # The board image sits at the border margin, so its pixels are viewport coordinates
+            x1 = view_col // self.cells_per_pixel * self.cell_size
+            y1 = view_row // self.cells_per_pixel * self.cell_size
+            if self.cells_per_pixel == 1:
+                self.canvas.tk.call(str(self.board_photo), "put", self.stroke_tile(code), "-to", x1, y1)
+            else:
+                _, color = self.cell_types[CELL_NAMES[code]]
+                self.canvas.tk.call(str(self.board_photo), "put", color,
+                                    "-to", x1, y1, x1 + self.cell_size, y1 + self.cell_size)
+
+    def stroke_tile(self, code):
+        """Return the image renderer's atlas tile for a cell type as Tk photo data (rows of colors)"""
+        key = (self.cell_size, self.grid_size <= 40, code)
+        tile = self.stroke_tiles.get(key)
+        if tile is None:
+            rows = self.board_atlas()[code].tolist()
+            tile = self.stroke_tiles[key] = " ".join(
+                "{" + " ".join(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in row) + "}" for row in rows)
+        return tile
+
+    def update_canvas(self, types=None, changed_tiles=None):
+        """Show a new board (types, or the current grid's) in the viewport
+
+        changed_tiles is the mask of density pyramid tiles that differ from
+        the board shown before, or None if any of them may.
+        """
+        if types is None:
+            types = self.grid.to_arrays()[0]
+        self.density_pyramid.mark_changed(changed_tiles)
+        self.draw_canvas(types)
+
+    def draw_canvas(self, types):
+        """Redraw the viewport onto a board's type array with the selected renderer"""
+        self.shown_types = types
+        renderer = "image"
+        if self.renderer == "vector" and self.grid_size <= self.max_vector_grid_size and self.cells_per_pixel == 1:
+            renderer = "vector"
+        if renderer != self.drawn_renderer:
+            self.reset_canvas()
+            self.drawn_renderer = renderer
+
+        # Boundary strips only change with the boundary modes or the viewport's size on screen
+        boundary = (tuple(self.boundary_modes), self.view_pixels())
+        if boundary != self.drawn_boundary:
+            self.canvas.delete("boundary")
+            self.draw_boundary_indicators()
+            self.canvas.tag_lower("boundary")
+            self.drawn_boundary = boundary
+
+        # Only the cells inside the viewport are rasterized
+        if renderer == "vector":
+            self.draw_vector_board(self.visible_types(types))
+        else:
+            self.draw_image_board(types)
+
+    def view_cells(self):
+        """Return how many board cells fit across the viewport at the current zoom"""
+        return min(self.grid_size, max(1, self.max_canvas_size // self.cell_size) * self.cells_per_pixel)
+
+    def view_pixels(self):
+        """Return the viewport's width (and height) on the canvas in pixels"""
+        return -(-self.view_cells() // self.cells_per_pixel) * self.cell_size
+
+    def visible_types(self, types):
+        """Return the viewport's window of a board's type array"""
+        view_cells = self.view_cells()
+        return types[self.view_row:self.view_row + view_cells, self.view_col:self.view_col + view_cells]
+
+    def clamp_view(self):
+        """Keep the viewport inside the board, aligned to whole pixels when zoomed out"""
+        limit = self.grid_size - self.view_cells()
+        self.view_row = max(0, min(limit, self.view_row))
+        self.view_col = max(0, min(limit, self.view_col))
+        self.view_row -= self.view_row % self.cells_per_pixel
+        self.view_col -= self.view_col % self.cells_per_pixel
+
+    def view_text(self):
+        """Describe the zoom and, when the board does not fit, which part of it is shown"""
+        view_cells = self.view_cells()
+        if self.cells_per_pixel > 1:
+            text = f"Zoom: {self.cells_per_pixel}x{self.cells_per_pixel} cells per pixel"
+        else:
+            text = f"Cell size: {self.cell_size}px"
+        if view_cells == self.grid_size:
+            return text
+        return (f"{text}, rows {self.view_row}-{self.view_row + view_cells - 1}, "
+                f"cols {self.view_col}-{self.view_col + view_cells - 1}")
+
+    def fit_cell_size(self):
+        """Pick a cell size that keeps the canvas manageable for the grid size and show the top-left corner"""
+        max_canvas_dimension = self.max_canvas_size
+        if self.grid_size * self.cell_size > max_canvas_dimension:
+            self.cell_size = max(1, max_canvas_dimension // self.grid_size)
+        else:
+            # Use default cell size for smaller grids
+            self.cell_size = min(15, max(3, max_canvas_dimension // self.grid_size))
+        self.cells_per_pixel = 1
+        self.view_row = self.view_col = 0
+
+    def resize_canvas(self):
+        """Size the canvas and its scrollable frame to the viewport plus the border margin"""
+        view_size = self.view_pixels()
+        new_canvas_width = view_size + (2 * self.border_margin)
+        new_canvas_height = view_size + (2 * self.border_margin)
+        self.canvas.configure(width=new_canvas_width, height=new_canvas_height)
+
+        scroll_width = min(new_canvas_width + 40, self.max_canvas_size)
+        scroll_height = min(new_canvas_height + 40, self.max_canvas_size)
+        self.canvas_scroll_frame.configure(width=scroll_width, height=scroll_height)
+        self.cell_size_label.configure(text=self.view_text())
+
+    def on_canvas_zoom(self, event):
+        """Zoom the viewport in or out by one step, keeping the cell under the pointer in place
+
+        Below one pixel per cell, zooming out doubles the cells per pixel
+        until the whole board fits.
+        """
+        zoom_in = event.num == 4 or getattr(event, "delta", 0) > 0
+        old_scale = self.cell_size / self.cells_per_pixel
+        if zoom_in:
+            if self.cells_per_pixel > 1:
+                self.cells_per_pixel //= 2
+            else:
+                self.cell_size = min(self.max_cell_size, max(self.cell_size + 1, round(self.cell_size * 1.25)))
+        elif self.cell_size > 1:
+            self.cell_size = max(1, min(self.cell_size - 1, round(self.cell_size / 1.25)))
+        elif self.view_cells() < self.grid_size and self.cells_per_pixel < self.density_pyramid.tile:
+            self.cells_per_pixel *= 2
+        new_scale = self.cell_size / self.cells_per_pixel
+        if new_scale != old_scale:
+            pointer_x = event.x - self.border_margin
+            pointer_y = event.y - self.border_margin
+            self.view_col = round(self.view_col + pointer_x / old_scale - pointer_x / new_scale)
+            self.view_row = round(self.view_row + pointer_y / old_scale - pointer_y / new_scale)
+            self.clamp_view()
+            self.resize_canvas()
+            self.draw_canvas(self.shown_types)
+        # Keep the scrollable frames from also scrolling
+        return "break"
+
+    def on_pan_start(self, event):
+        """Start dragging the viewport"""
+        self.pan_anchor = (event.x, event.y, self.view_row, self.view_col)
+
+    def on_pan_drag(self, event):
+        """Move the viewport with the pointer, one whole cell at a time"""
+        if self.pan_anchor is None:
+            return
+        anchor_x, anchor_y, anchor_row, anchor_col = self.pan_anchor
+        view = (self.view_row, self.view_col)
+        self.view_col = anchor_col + (anchor_x - event.x) // self.cell_size * self.cells_per_pixel
+        self.view_row = anchor_row + (anchor_y - event.y) // self.cell_size * self.cells_per_pixel
+        self.clamp_view()
+        if (self.view_row, self.view_col) != view:
+            self.cell_size_label.configure(text=self.view_text())
+            self.draw_canvas(self.shown_types)
+
+    def on_pan_end(self, event):
+        """Stop dragging the viewport"""
+        self.pan_anchor = None
+
+    def reset_canvas(self):
+        """Remove every canvas item so the next update_canvas draws from scratch"""
         self.canvas.delete("all")
+        self.board_photo = None
+        self.board_item = None
+        self.drawn_boundary = None
+        self.vector_items = None
+        self.vector_layout = None
+        self.drawn_types = None
+
+    def draw_image_board(self, types):
+        """Show the viewport onto a board as one image"""
+        frame = Image.fromarray(self.board_pixels(types))
+        if self.board_photo is not None and (self.board_photo.width(), self.board_photo.height()) == frame.size:
+            # Same size: update the existing image in place
+            self.board_photo.paste(frame)
+            return
+        self.board_photo = ImageTk.PhotoImage(frame)
+        if self.board_item is None:
+            self.board_item = self.canvas.create_image(self.border_margin, self.border_margin, anchor="nw",
+                                                       image=self.board_photo, tags="board")
+        else:
+            self.canvas.itemconfigure(self.board_item, image=self.board_photo)
+
+    def board_pixels(self, types):
+        """Rasterize the viewport onto a board's type array into an RGB array
+
+        At one or more pixels per cell each cell gets its atlas tile. Zoomed
+        out further, each pixel blends the types of the cells it covers,
+        counted by the density pyramid, which only recounts changed tiles.
+        """
+        if self.cells_per_pixel == 1:
+            return composite(self.visible_types(types), self.board_atlas())
+        self.density_pyramid.update(types)
+        view_cells = self.view_cells()
+        counts = self.density_pyramid.counts(self.cells_per_pixel, self.view_row, self.view_col, view_cells, view_cells)
+        return density_colors(counts, self.color_table)
+
+    def board_atlas(self):
+        """Return the tile atlas for the current cell size, building it on first use
+
+        The atlas holds one cell_size x cell_size tile per type code: the
+        cell sprites on a gray grid (small boards) or black background, or
+        flat colors when cells are too small for sprites.
+        """
+        grid_lines = self.grid_size <= 40
+        key = (self.cell_size, grid_lines)
+        atlas = self.sprite_atlases.get(key)
+        if atlas is not None:
+            return atlas
+        grid_color = (190, 190, 190) if grid_lines else None
+        if self.cell_size < self.min_sprite_size:
+            atlas = flat_atlas(self.color_table, self.cell_size, grid_color)
+        else:
+            sprite_size = (self.cell_size - 1, self.cell_size - 1)
+            if len(self.sprites) != len(self.cell_types) or any(sprite.size != sprite_size
+                                                                  for sprite in self.sprites.values()):
+                self.create_cell_sprites()
+            tiles = {code: np.asarray(self.sprites[name].convert("RGB")) for code, name in CELL_NAMES.items()}
+            atlas = sprite_atlas(tiles, self.cell_size, grid_color or (0, 0, 0))
+        self.sprite_atlases[key] = atlas
+        return atlas
+
+    def draw_vector_board(self, types):
+        """Draw the board as persistent canvas items, reconfiguring only the cells whose type changed"""
+        if self.vector_items is None or self.vector_layout != (self.grid_size, self.view_cells(), self.cell_size):
+            self.create_vector_items()
+
+        # Compare with what is on screen rather than the previous generation, since frames can skip generations
+        rows, cols = np.nonzero(types != self.drawn_types)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            self.configure_vector_cell(row, col, int(types[row, col]))
+        self.drawn_types = types.copy()
+
+    def create_vector_items(self):
+        """Create one rectangle plus hidden pattern items per viewport cell, all showing Dead cells"""
+        self.canvas.delete("cells")
+        small_grid = self.grid_size <= 40
+        outline_color = "gray" if small_grid else ""
+        dead_color = self.cell_types["Dead"][1]
+        # Dead cells are only drawn on small grids
+        dead_state = "normal" if small_grid else "hidden"
+        self.vector_items = []
+        view_cells = self.view_cells()
+        for row in range(view_cells):
+            row_items = []
+            for col in range(view_cells):
+                x1, y1, x2, y2 = self.cell_bounds(row, col)
+                rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill=dead_color, outline=outline_color,
+                                                    state=dead_state, tags="cells")
+                patterns = None
+                # Patterns only if cells are large enough
+                if self.cell_size >= 8:
+                    mid_x = (x1 + x2) // 2
+                    mid_y = (y1 + y2) // 2
+                    patterns = (
+                        self.canvas.create_line(x1+1, y1+1, x2-1, y2-1, fill="white", width=1,
+                                                state="hidden", tags="cells"),
+                        self.canvas.create_line(x1+1, y2-1, x2-1, y1+1, fill="white", width=1,
+                                                state="hidden", tags="cells"),
+                        self.canvas.create_oval(mid_x-1, mid_y-1, mid_x+1, mid_y+1, fill="white", outline="white",
+                                                state="hidden", tags="cells"),
+                    )
+                row_items.append((rect, patterns))
+            self.vector_items.append(row_items)
+        self.drawn_types = np.zeros((view_cells, view_cells), dtype=np.uint8)
+        self.vector_layout = (self.grid_size, view_cells, self.cell_size)
+
+    def cell_bounds(self, row, col):
+        """Return the canvas (x1, y1, x2, y2) of a viewport cell, offset by the border margin"""
+        x1 = col * self.cell_size + self.border_margin
+        y1 = row * self.cell_size + self.border_margin
+        return x1, y1, x1 + self.cell_size, y1 + self.cell_size
+
+    def configure_vector_cell(self, row, col, code):
+        """Recolor one viewport cell's persistent items for a new cell type"""
+        rect, patterns = self.vector_items[row][col]
+        _, color = self.cell_types[CELL_NAMES[code]]
+        shown = code != DEAD or self.grid_size <= 40
+        self.canvas.itemconfigure(rect, fill=color, state="normal" if shown else "hidden")
+        if patterns is None:
+            return
 
-        # First draw boundary indicators (background)
-        self.draw_boundary_indicators()
-
-        # Then draw cells on top, offset by border margin
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                x1 = col * self.cell_size + self.border_margin
-                y1 = row * self.cell_size + self.border_margin
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-
-                cell = self.grid.cells[row][col]
-                cell_type = type(cell).__name__.replace("Cell", "")
-
-                if cell_type in self.cell_types:
-                    _, color = self.cell_types[cell_type]
-
-                    # Only draw non-dead cells for better performance on large grids
-                    if cell_type != "Dead" or self.grid_size <= 40:
-                        outline_color = "gray" if self.grid_size <= 40 else ""
-                        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline=outline_color)
-
-                        # Simplified visual patterns for better performance
-                        if self.cell_size >= 8:  # Only add patterns if cells are large enough
-                            if cell_type == "Cancer":
-                                # Simple cross pattern
-                                self.canvas.create_line(x1+1, y1+1, x2-1, y2-1, fill="white", width=1)
-                                self.canvas.create_line(x1+1, y2-1, x2-1, y1+1, fill="white", width=1)
-                            elif cell_type == "Cure":
-                                # Simple plus pattern
-                                mid_x = (x1 + x2) // 2
-                                mid_y = (y1 + y2) // 2
-                                self.canvas.create_line(mid_x, y1+2, mid_x, y2-2, fill="white", width=1)
-                                self.canvas.create_line(x1+2, mid_y, x2-2, mid_y, fill="white", width=1)
-                            elif cell_type == "Alive":
-                                # Simple dot pattern
-                                mid_x = (x1 + x2) // 2
-                                mid_y = (y1 + y2) // 2
-                                self.canvas.create_oval(mid_x-1, mid_y-1, mid_x+1, mid_y+1, fill="white", outline="white")
+        first_line, second_line, dot = patterns
+        x1, y1, x2, y2 = self.cell_bounds(row, col)
+        if code == CANCER:
+            # Simple cross pattern
+            self.canvas.coords(first_line, x1+1, y1+1, x2-1, y2-1)
+            self.canvas.coords(second_line, x1+1, y2-1, x2-1, y1+1)
+        elif code == CURE:
+            # Simple plus pattern
+            mid_x = (x1 + x2) // 2
+            mid_y = (y1 + y2) // 2
+            self.canvas.coords(first_line, mid_x, y1+2, mid_x, y2-2)
+            self.canvas.coords(second_line, x1+2, mid_y, x2-2, mid_y)
+        line_state = "normal" if code in (CANCER, CURE) else "hidden"
+        self.canvas.itemconfigure(first_line, state=line_state)
+        self.canvas.itemconfigure(second_line, state=line_state)
+        # Simple dot pattern for Alive cells
+        self.canvas.itemconfigure(dot, state="normal" if code == ALIVE else "hidden")
 
     def draw_boundary_indicators(self):
         """Draw visual indicators around the canvas to show boundary conditions"""
-        grid_width = self.grid_size * self.cell_size
-        grid_height = self.grid_size * self.cell_size
+        grid_width = self.view_pixels()
+        grid_height = self.view_pixels()
 
         # Define colors for each boundary mode
         boundary_colors = {
@@ -959,65 +1223,121 @@ class ConwayGUI:
                                   fill=text_color, font=("Arial", font_size, "bold"),
                                   tags="boundary")
 
-    def update_charts(self):
-        """Update the pie chart and line graph"""
-        # Count cell types
-        counts = {"Dead": 0, "Alive": 0, "Cancer": 0, "Cure": 0}
+    def update_charts(self, frame=None):
+        """Update the pie chart, line graph and steady-state status
 
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                cell = self.grid.cells[row][col]
-                cell_type = type(cell).__name__.replace("Cell", "")
-                if cell_type in counts:
-                    counts[cell_type] += 1
+        Without a frame the current grid is counted and added to the
+        history; a frame from the simulation thread is already in it.
+        """
+        self.steady_state_label.configure(text=self.steady_state_text())
 
-        # Store history for line graph
-        self.cell_history.append(counts.copy())
+        if frame is None:
+            # Count cell types
+            counts = self.cell_counts()
+            iteration = self.iteration_count
 
-        # Clear previous plots
-        self.pie_ax.clear()
-        self.line_ax.clear()
+            # Store history for line graph
+            self.cell_history.append((iteration, counts.copy()))
+        else:
+            counts, iteration = frame.counts, frame.iteration
 
-        # Pie chart
+        # Redraw the pie chart
+        self.pie_ax.clear()
         non_zero_counts = {k: v for k, v in counts.items() if v > 0}
         if non_zero_counts:
             colors = [self.cell_types[cell_type][1] for cell_type in non_zero_counts.keys()]
             self.pie_ax.pie(non_zero_counts.values(), labels=non_zero_counts.keys(),
                            colors=colors, autopct='%1.1f%%', textprops={'color': 'white'})
-            self.pie_ax.set_title(f"Cell Distribution (Iteration {self.iteration_count})", color='white')
-
-        # Line graph
-        if len(self.cell_history) > 1:
-            iterations = range(len(self.cell_history))
-            for cell_type in counts.keys():
-                values = [h[cell_type] for h in self.cell_history]
-                color = self.cell_types[cell_type][1]
-                self.line_ax.plot(iterations, values, label=cell_type, color=color, linewidth=2)
-
-            self.line_ax.set_xlabel("Iteration", color='white')
-            self.line_ax.set_ylabel("Cell Count", color='white')
-            self.line_ax.set_title("Cell Population Over Time", color='white')
-            self.line_ax.legend()
-            self.line_ax.tick_params(colors='white')
-            self.line_ax.grid(True, alpha=0.3)
+            self.pie_ax.set_title(f"Cell Distribution (Iteration {iteration})", color='white')
+
+        # Extend the line graph with the generations added since the last tick
+        end = self.extend_chart_history()
+        latest, latest_counts = self.cell_history[end - 1]
+        for cell_type, line in self.history_lines.items():
+            iterations, values = self.chart_iterations, self.chart_values[cell_type]
+            if iterations and iterations[-1] != latest:
+                # Always end at the newest generation, even between strided points
+                iterations = iterations + [latest]
+                values = values + [latest_counts[cell_type]]
+            line.set_data(iterations, values)
+        self.line_ax.relim()
+        self.line_ax.autoscale_view()
 
         # Refresh the canvas
         self.chart_canvas.draw()
 
+    def extend_chart_history(self):
+        """Add the history entries not yet charted, thinning the plotted points once there are too many
+
+        Samples are plotted at their generation, so the lines join straight
+        across generations a jump skipped. Returns the history length that
+        was charted up to.
+        """
+        # A cleared or reloaded board starts a new history list
+        history = self.cell_history
+        if history is not self.charted_history or len(history) < self.next_chart_index:
+            self.charted_history = history
+            self.chart_stride = 1
+            self.next_chart_index = 0
+            self.chart_iterations = []
+            self.chart_values = {cell_type: [] for cell_type in self.history_lines}
+
+        # The simulation thread keeps appending, so chart up to the length seen now
+        end = len(history)
+        for index in range(self.next_chart_index, end, self.chart_stride):
+            generation, counts = history[index]
+            self.chart_iterations.append(generation)
+            for cell_type, values in self.chart_values.items():
+                values.append(counts[cell_type])
+            self.next_chart_index = index + self.chart_stride
+
+        # Keep every other sample and double the stride, so a long run plots in bounded time
+        while len(self.chart_iterations) > self.max_chart_points:
+            self.chart_iterations = self.chart_iterations[::2]
+            for cell_type in self.chart_values:
+                self.chart_values[cell_type] = self.chart_values[cell_type][::2]
+            self.chart_stride *= 2
+            self.next_chart_index = -(-self.next_chart_index // self.chart_stride) * self.chart_stride
+
+        return end
+
+    def cell_counts(self):
+        """Return the current grid's {cell type name: count}"""
+        type_counts = self.grid.count_types()
+        return {CELL_NAMES[code]: int(type_counts[code]) for code in CELL_NAMES}
+
+    def steady_state_text(self):
+        """Describe whether the board has died out or settled into a cycle"""
+        runner = self.game_runner
+        if runner.extinct:
+            return "Steady state: extinct"
+        if runner.period == 1:
+            return f"Steady state: still life since iteration {runner.cycle_start}"
+        if runner.period is not None:
+            return f"Steady state: period {runner.period} since iteration {runner.cycle_start}"
+        return "Steady state: none detected"
+
     def start_simulation(self):
         """Start the simulation"""
         if not self.running:
-            self.running = True
-            self.start_btn.configure(state="disabled")
-            self.stop_btn.configure(state="normal")
-            self.simulation_thread = threading.Thread(target=self.run_simulation, daemon=True)
-            self.simulation_thread.start()
+            self.start_worker(self.run_simulation)
+
+    def start_worker(self, loop, *args):
+        """Run a simulation loop on the worker thread while the render clock draws the frames it publishes"""
+        self.running = True
+        self.start_btn.configure(state="disabled")
+        self.stop_btn.configure(state="normal")
+        self.simulation_thread = threading.Thread(target=loop, args=args, daemon=True)
+        self.simulation_thread.start()
+        self.root.after(self.frame_interval_ms(), self.render_pending_frame)
 
     def stop_simulation(self):
         """Stop the simulation"""
         self.running = False
         self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
+        self.jump_target = None
+        self.jump_btn.configure(text="Jump to generation")
 
     def save_line_graph(self):
         """Save the line graph as a PNG image"""
@@ -1045,19 +1365,20 @@ class ConwayGUI:
                 save_ax.grid(True, alpha=0.3)
 
                 # Plot the data
-                iterations = list(range(len(self.cell_history)))
+                # Samples are plotted at their generation, joining across spans a jump skipped
+                iterations = [generation for generation, _ in self.cell_history]
                 for cell_type in ["Dead", "Alive", "Cancer", "Cure"]:
-                    counts = [data[cell_type] for data in self.cell_history]
+                    counts = [data[cell_type] for _, data in self.cell_history]
                     color = self.cell_types[cell_type][1]  # Get color from cell_types
                     save_ax.plot(iterations, counts, label=cell_type, color=color, linewidth=2)
 
                 save_ax.legend(fontsize=10)
-                save_ax.set_xlim(0, max(1, len(self.cell_history) - 1))
+                save_ax.set_xlim(0, max(1, iterations[-1]))
 
                 # Add metadata text
                 metadata_text = (
                     f"Grid Size: {self.grid_size}x{self.grid_size}\n"
-                    f"Total Iterations: {len(self.cell_history)}\n"
+                    f"Total Iterations: {iterations[-1]}\n"
                     f"Boundary Modes: L:{self.boundary_modes[0]}, R:{self.boundary_modes[1]}, "
                     f"T:{self.boundary_modes[2]}, B:{self.boundary_modes[3]}"
                 )
@@ -1119,8 +1440,8 @@ class ConwayGUI:
         # Force button state update
         self.root.update_idletasks()
 
-    def capture_gif_frame(self):
-        """Capture current canvas state as a frame for GIF"""
+    def capture_gif_frame(self, types=None):
+        """Capture current canvas state (or the given types) as a frame for GIF"""
         if not self.recording_gif or len(self.gif_frames) >= self.max_gif_frames:
             return
 
@@ -1134,24 +1455,11 @@ class ConwayGUI:
             frame = Image.new('RGB', (canvas_width, canvas_height), 'black')
             draw = ImageDraw.Draw(frame)
 
-            # Draw the grid state
-            for row in range(self.grid_size):
-                for col in range(self.grid_size):
-                    cell = self.grid.cells[row][col]
-                    cell_type = type(cell).__name__.replace("Cell", "")
-
-                    if cell_type in self.cell_types:
-                        color = self.cell_types[cell_type][1]
-
-                        # Calculate cell position with border margin
-                        x1 = col * self.cell_size + self.border_margin
-                        y1 = row * self.cell_size + self.border_margin
-                        x2 = x1 + self.cell_size - 1
-                        y2 = y1 + self.cell_size - 1
-
-                        # Only draw non-dead cells for cleaner GIF
-                        if cell_type != "Dead":
-                            draw.rectangle([x1, y1, x2, y2], fill=color)
+            # Draw the grid state with the image renderer's atlas
+            if types is None:
+                types = self.grid.to_arrays()[0]
+            board = Image.fromarray(self.board_pixels(types))
+            frame.paste(board, (self.border_margin, self.border_margin))
 
             # Add frame number overlay
             frame_text = f"Frame {len(self.gif_frames) + 1}"
@@ -1173,7 +1481,7 @@ class ConwayGUI:
         if filename:
             try:
                 # Save as animated GIF
-                duration = max(100, self.speed)  # Use simulation speed, minimum 100ms
+                duration = max(20, self.frame_interval_ms())  # Frames were captured by the render clock
 
                 self.gif_frames[0].save(
                     filename,
@@ -1207,28 +1515,174 @@ class ConwayGUI:
             if self.recording_gif:
                 self.capture_gif_frame()
 
+    def jump_to_generation(self):
+        """Fast-forward the simulation to the generation typed in the jump entry"""
+        if self.running:
+            return
+        try:
+            target = int(self.jump_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a whole generation number")
+            return
+        if target <= self.iteration_count:
+            messagebox.showerror("Error", f"Generation must be after the current one ({self.iteration_count})")
+            return
+
+        generations = target - self.iteration_count
+        if self.game_runner.advance_engine == "update" and generations > self.max_stepped_jump:
+            messagebox.showerror(
+                "Error",
+                "Boards with Cancer or Cure cells, or an unbounded universe, advance one generation "
+                f"at a time, so they can jump at most {self.max_stepped_jump} generations. Use Start instead."
+            )
+            return
+
+        # The jump runs on the simulation thread, so Stop cancels it and the render clock shows its progress
+        self.jump_target = target
+        self.jump_start = self.iteration_count
+        self.jump_btn.configure(text=self.jump_text())
+        self.start_worker(self.run_jump, target)
+
+    def run_jump(self, target):
+        """Jump loop: advance towards the target in chunks, publishing each one as a frame
+
+        Chunks are sized to take about one render clock period, except that
+        HashLife's chunks keep doubling since its cost grows with the log of
+        the generations. Stop is honored between chunks.
+        """
+        self.scheduler = DeadlineScheduler()
+        self.scheduler.record(self.iteration_count)
+        engine = self.game_runner.advance_engine
+        chunk = 1
+        while self.running and self.iteration_count < target:
+            generations = min(chunk, target - self.iteration_count)
+            chunk_start = time.perf_counter()
+            if engine == "update":
+                for _ in range(generations):
+                    self.game_runner.update()
+                    self.grid = self.game_runner.grid
+                    self.iteration_count += 1
+                    self.cell_history.append((self.iteration_count, self.cell_counts()))
+            else:
+                self.game_runner.advance(generations)
+                self.grid = self.game_runner.grid
+                self.iteration_count += generations
+                # Only the chunk's last generation is counted; the line graph joins across the others
+                self.cell_history.append((self.iteration_count, self.cell_counts()))
+            self.scheduler.record(self.iteration_count)
+
+            types = self.grid.to_arrays()[0].copy()
+            types.flags.writeable = False
+            self.mailbox.publish(Frame(types, self.iteration_count, self.cell_history[-1][1],
+                                       self.game_runner.take_changes()))
+
+            if engine == "hashlife":
+                chunk *= 2
+            else:
+                elapsed = max(time.perf_counter() - chunk_start, 1e-6)
+                chunk = max(1, min(2 * chunk, round(generations * self.frame_interval_ms() / 1000 / elapsed)))
+
+        self.root.after(0, self.stop_simulation)
+
+    def jump_text(self):
+        """Describe how far the running jump has got"""
+        done = self.iteration_count - self.jump_start
+        total = max(1, self.jump_target - self.jump_start)
+        return f"Jumping: {100 * done // total}% (Stop cancels)"
+
     def run_simulation(self):
-        """Main simulation loop"""
+        """Main simulation loop: step a batch of generations, publish it as one frame, then wait for its deadline
+
+        While the loop is behind schedule (or unlimited) it publishes at most
+        one frame per render clock period and skips the rest, so slow
+        generations cost renders instead of stalling the simulation.
+        """
+        self.scheduler = DeadlineScheduler()
+        self.scheduler.record(self.iteration_count)
+        last_publish = None
         while self.running:
-            self.game_runner.update()
-            self.grid = self.game_runner.grid
-            self.iteration_count += 1
+            generations = self.generations_per_frame
+            steady = False
+            for _ in range(generations):
+                self.game_runner.update()
+                self.grid = self.game_runner.grid
+                self.iteration_count += 1
+
+                # Every generation goes into the history; the UI shows only the latest frame
+                self.cell_history.append((self.iteration_count, self.cell_counts()))
 
-            # Update UI in main thread
-            self.root.after(0, self.update_canvas)
-            self.root.after(0, self.update_charts)
+                # Nothing new can happen once the board is extinct or cycling
+                steady = self.stop_on_steady_state and self.game_runner.steady_state
+                if steady:
+                    break
+
+            self.scheduler.record(self.iteration_count)
+
+            if self.unlimited_rate:
+                behind = True
+            else:
+                behind = self.scheduler.advance(generations, self.generations_per_second) > 0
+            now = time.perf_counter()
+            if steady or not behind or last_publish is None or now - last_publish >= self.frame_interval_ms() / 1000:
+                types = self.grid.to_arrays()[0].copy()
+                types.flags.writeable = False
+                self.mailbox.publish(Frame(types, self.iteration_count, self.cell_history[-1][1],
+                                           self.game_runner.take_changes()))
+                last_publish = now
+            else:
+                self.frames_skipped += 1
+
+            if steady:
+                self.root.after(0, self.stop_simulation)
+                break
+
+            if not behind:
+                self.scheduler.wait()
+
+    def render_pending_frame(self):
+        """Render clock tick while running: draw the latest published frame, if any, then schedule the next tick"""
+        tick_start = time.perf_counter()
+        frame = self.mailbox.take()
+        if frame is not None:
+            self.frames_shown += 1
+            self.update_canvas(frame.types, frame.changed_tiles)
+            self.update_charts(frame)
+            self.frame_label.configure(text=self.frame_text())
+            self.rate_stats_label.configure(text=self.rate_stats_text())
+            if self.jump_target is not None:
+                self.jump_btn.configure(text=self.jump_text())
 
             # Capture frame for GIF if recording
             if self.recording_gif:
-                self.root.after(0, self.capture_gif_frame)
-
-            time.sleep(self.speed / 1000.0)
+                self.capture_gif_frame(frame.types)
+
+        # Keep ticking until the simulation thread has published its last frame; the time
+        # spent drawing comes out of the wait so the cadence stays at frames_per_second
+        if self.running or self.simulation_thread.is_alive():
+            elapsed_ms = int((time.perf_counter() - tick_start) * 1000)
+            self.root.after(max(1, self.frame_interval_ms() - elapsed_ms), self.render_pending_frame)
+
+    def frame_interval_ms(self):
+        """Return the render clock period in milliseconds"""
+        return max(1, round(1000 / self.frames_per_second))
+
+    def frame_text(self):
+        """Describe how many frames were shown, dropped as stale, and skipped while behind schedule"""
+        return (f"Frames shown: {self.frames_shown}, dropped: {self.mailbox.dropped}, "
+                f"skipped: {self.frames_skipped}")
+
+    def rate_stats_text(self):
+        """Describe the achieved simulation rate against the requested one"""
+        achieved = self.scheduler.achieved_rate
+        if self.unlimited_rate:
+            return f"Rate: {achieved:.1f} gens/s (unlimited)"
+        return f"Rate: {achieved:.1f} of {self.generations_per_second} gens/s"
 
     def clear_grid(self):
         """Clear the grid"""
         if not self.running:
-            self.grid = Grid(self.grid_size, self.grid_size)
-            self.game_runner = GameRunner(self.grid)
+            self.grid = self.create_grid()
+            self.game_runner = self.create_runner()
             self.iteration_count = 0
             self.cell_history = []
 
@@ -1243,6 +1697,68 @@ class ConwayGUI:
         """Handle cell type selection change"""
         self.selected_cell_type = value
 
+    def on_engine_change(self, value):
+        """Handle stepping engine selection change"""
+        self.engine = value
+        self.game_runner.engine = value
+
+        # The NumPy engine works directly on array-backed storage
+        self.grid = self.grid.with_storage(self.grid_storage())
+        self.game_runner.grid = self.grid
+
+    def on_renderer_change(self, value):
+        """Handle renderer selection change"""
+        self.renderer = value
+        self.update_canvas()
+
+    def on_active_set_change(self):
+        """Handle active-region stepping toggle"""
+        self.active_set = self.active_set_var.get()
+        self.game_runner.active_set = self.active_set
+
+    def on_seed_change(self, event=None):
+        """Restart the random draws from the seed in the seed entry"""
+        text = self.seed_var.get().strip()
+        try:
+            seed = int(text) if text else None
+        except ValueError:
+            messagebox.showerror("Error", "Seed must be a whole number (or blank for no seed)")
+            return
+        self.seed = seed
+        self.game_runner.set_seed(seed)
+
+    def on_counter_rng_change(self):
+        """Handle counter-based RNG toggle"""
+        self.counter_rng = self.counter_rng_var.get()
+        self.game_runner.counter_rng = self.counter_rng
+        self.game_runner.set_seed(self.seed)
+
+    def on_unbounded_change(self):
+        """Handle unbounded universe toggle"""
+        self.unbounded = self.unbounded_var.get()
+        self.game_runner.set_unbounded(self.unbounded)
+        self.update_charts()
+
+    def on_stop_on_steady_change(self):
+        """Handle stop-on-cycle toggle"""
+        self.stop_on_steady_state = self.stop_on_steady_var.get()
+
+    def create_runner(self):
+        """Create a GameRunner for the current grid with the selected options"""
+        runner = GameRunner(self.grid, self.engine, active_set=self.active_set, seed=self.seed,
+                            counter_rng=self.counter_rng, unbounded=self.unbounded)
+        # Published frames carry the tiles that changed, so the density pyramid recounts only those
+        runner.track_changes(PYRAMID_TILE)
+        return runner
+
+    def grid_storage(self):
+        """Return the grid storage mode that suits the current engine"""
+        return "array" if self.engine in GameRunner.array_engines else "objects"
+
+    def create_grid(self):
+        """Create an empty grid with the current size, boundaries and storage"""
+        return Grid(self.grid_size, self.grid_size, self.boundary_modes.copy(), self.grid_storage())
+
     def on_cancer_weight_change(self, event=None):
         """Handle cancer weight change"""
         try:
@@ -1251,11 +1767,9 @@ class ConwayGUI:
             weight = max(0.0001, min(1.0, weight))
 
             # Update all existing cancer cells
-            for row in range(self.grid_size):
-                for col in range(self.grid_size):
-                    cell = self.grid.cells[row][col]
-                    if isinstance(cell, CancerCell):
-                        cell.cancer_weighting = weight
+            self.grid.set_type_weighting(CANCER, weight)
+            # Carry the new weights into the runner and restart cycle detection
+            self.game_runner.grid_edited()
 
             # Update the display value if it was clamped
             if weight != float(self.cancer_weight_var.get()):
@@ -1273,11 +1787,9 @@ class ConwayGUI:
             weight = max(0.0001, min(1.0, weight))
 
             # Update all existing cure cells
-            for row in range(self.grid_size):
-                for col in range(self.grid_size):
-                    cell = self.grid.cells[row][col]
-                    if isinstance(cell, CureCell):
-                        cell.cure_weighting = weight
+            self.grid.set_type_weighting(CURE, weight)
+            # Carry the new weights into the runner and restart cycle detection
+            self.game_runner.grid_edited()
 
             # Update the display value if it was clamped
             if weight != float(self.cure_weight_var.get()):
@@ -1287,53 +1799,80 @@ class ConwayGUI:
             # Invalid input, ignore
             pass
 
-    def on_speed_change(self, value):
-        """Handle speed slider change"""
-        self.speed = int(value)
-        self.speed_label.configure(text=f"{self.speed}ms")
+    def on_rate_change(self, value):
+        """Handle generations-per-second slider change"""
+        self.generations_per_second = int(value)
+        self.rate_label.configure(text=self.rate_text())
+
+    def on_unlimited_rate_change(self):
+        """Handle unlimited simulation rate toggle"""
+        self.unlimited_rate = self.unlimited_rate_var.get()
+        self.rate_label.configure(text=self.rate_text())
+
+    def rate_text(self):
+        """Describe the target simulation rate"""
+        return "Unlimited" if self.unlimited_rate else f"{self.generations_per_second} gens/s"
+
+    def on_fps_change(self, value):
+        """Handle frames-per-second slider change"""
+        self.frames_per_second = int(value)
+        self.fps_label.configure(text=f"{self.frames_per_second} FPS")
+
+    def on_batch_change(self, value):
+        """Handle generations-per-frame change"""
+        self.generations_per_frame = int(value)
 
     def on_size_change(self, value):
-        """Handle grid size change with adaptive scaling"""
+        """Show the dragged grid size and rebuild the board once the slider settles"""
         if not self.running:
-            new_size = int(value)
-            if new_size != self.grid_size:
-                self.grid_size = new_size
-                self.size_label.configure(text=f"{self.grid_size}x{self.grid_size}")
-
-                # Calculate adaptive cell size to keep canvas manageable
-                max_canvas_dimension = self.max_canvas_size
-                if self.grid_size * self.cell_size > max_canvas_dimension:
-                    self.cell_size = max(1, max_canvas_dimension // self.grid_size)
-                else:
-                    # Use default cell size for smaller grids
-                    self.cell_size = min(15, max(3, max_canvas_dimension // self.grid_size))
+            self.size_label.configure(text=f"{int(value)}x{int(value)}")
+
+            # Every intermediate slider value would otherwise rebuild the grid and runner
+            if self.size_change_job is not None:
+                self.root.after_cancel(self.size_change_job)
+            self.size_change_job = self.root.after(self.size_change_delay_ms, self.apply_size_change)
+
+    def apply_size_change(self):
+        """Rebuild the board at the size slider's value with adaptive scaling"""
+        self.size_change_job = None
+        new_size = int(self.size_slider.get())
+        if self.running or new_size == self.grid_size:
+            self.size_label.configure(text=f"{self.grid_size}x{self.grid_size}")
+            self.size_slider.set(self.grid_size)
+            return
 
-                # Update cell size label
-                self.cell_size_label.configure(text=f"Cell size: {self.cell_size}px")
+        self.grid_size = new_size
+        self.size_label.configure(text=f"{self.grid_size}x{self.grid_size}")
+        self.use_array_engine_if_large()
 
-                # Calculate new canvas size including border margin
-                grid_size = self.grid_size * self.cell_size
-                new_canvas_width = grid_size + (2 * self.border_margin)
-                new_canvas_height = grid_size + (2 * self.border_margin)
+        # Calculate adaptive cell size to keep canvas manageable, then resize the canvas
+        self.fit_cell_size()
+        self.resize_canvas()
 
-                # Update canvas size
-                self.canvas.configure(width=new_canvas_width, height=new_canvas_height)
+        # Recreate cell sprites with new size
+        self.create_cell_sprites()
 
-                # Update scrollable frame size
-                scroll_width = min(new_canvas_width + 40, self.max_canvas_size)
-                scroll_height = min(new_canvas_height + 40, self.max_canvas_size)
-                self.canvas_scroll_frame.configure(width=scroll_width, height=scroll_height)
+        # Create new grid
+        self.grid = self.create_grid()
+        self.game_runner = self.create_runner()
+        self.iteration_count = 0
+        self.cell_history = []
+        self.update_canvas()
+        self.update_charts()
 
-                # Recreate cell sprites with new size
-                self.create_cell_sprites()
+    def use_array_engine_if_large(self):
+        """Switch from the object engine to the NumPy engine for boards too large for one object per cell"""
+        if self.grid_size > self.max_object_grid_size and self.engine not in GameRunner.array_engines:
+            self.engine = "numpy"
+            self.engine_var.set(self.engine)
+        self.update_engine_choices()
 
-                # Create new grid
-                self.grid = Grid(self.grid_size, self.grid_size)
-                self.game_runner = GameRunner(self.grid)
-                self.iteration_count = 0
-                self.cell_history = []
-                self.update_canvas()
-                self.update_charts()
+    def update_engine_choices(self):
+        """Offer only the engines that can hold a board of the current size"""
+        engines = list(GameRunner.engines)
+        if self.grid_size > self.max_object_grid_size:
+            engines = [engine for engine in engines if engine in GameRunner.array_engines]
+        self.engine_menu.configure(values=engines)
 
     def set_boundary(self, index, mode):
         """Set boundary condition for a specific edge"""
@@ -1355,27 +1894,16 @@ class ConwayGUI:
 
             if filename:
                 try:
-                    with open(filename, 'w', newline='') as csvfile:
-                        writer = csv.writer(csvfile)
-
-                        # Write settings
-                        writer.writerow(["Settings"])
-                        writer.writerow(["grid_size", self.grid_size])
-                        writer.writerow(["speed", self.speed])
-                        writer.writerow(["boundary_modes"] + self.boundary_modes)
-                        writer.writerow(["cancer_weight", self.cancer_weight_var.get()])
-                        writer.writerow(["cure_weight", self.cure_weight_var.get()])
-                        writer.writerow([])  # Empty row separator
-
-                        # Write grid data
-                        writer.writerow(["Grid"])
-                        for row in range(self.grid_size):
-                            grid_row = []
-                            for col in range(self.grid_size):
-                                cell = self.grid.cells[row][col]
-                                cell_type = type(cell).__name__.replace("Cell", "")
-                                grid_row.append(cell_type)
-                            writer.writerow(grid_row)
+                    settings = {
+                        "grid_size": self.grid_size,
+                        "generations_per_second": 0 if self.unlimited_rate else self.generations_per_second,
+                        "fps": self.frames_per_second,
+                        "generations_per_frame": self.generations_per_frame,
+                        "boundary_modes": self.boundary_modes,
+                        "cancer_weight": self.cancer_weight_var.get(),
+                        "cure_weight": self.cure_weight_var.get(),
+                    }
+                    write_grid_file(filename, self.grid.to_arrays()[0], settings)
 
                     messagebox.showinfo("Success", f"Grid saved to {filename}")
                 except Exception as e:
@@ -1390,113 +1918,69 @@ class ConwayGUI:
 
             if filename:
                 try:
-                    with open(filename, 'r') as csvfile:
-                        reader = csv.reader(csvfile)
-                        rows = list(reader)
-
-                    # Parse settings
-                    settings_start = 0
-                    for i, row in enumerate(rows):
-                        if row and row[0] == "Settings":
-                            settings_start = i + 1
-                            break
+                    types, settings = read_grid_file(filename, self.grid_size)
 
                     # Load settings
-                    for i in range(settings_start, len(rows)):
-                        row = rows[i]
-                        if not row:  # Empty row - end of settings
-                            break
-
-                        if row[0] == "grid_size":
-                            self.grid_size = int(row[1])
-                            self.size_slider.set(self.grid_size)
-                            self.size_label.configure(text=f"{self.grid_size}x{self.grid_size}")
-
-                            # Update cell size based on loaded grid size
-                            max_canvas_dimension = self.max_canvas_size
-                            if self.grid_size * self.cell_size > max_canvas_dimension:
-                                self.cell_size = max(1, max_canvas_dimension // self.grid_size)
-                            else:
-                                # Use default cell size for smaller grids
-                                self.cell_size = min(15, max(3, max_canvas_dimension // self.grid_size))
-
-                            # Update cell size label
-                            self.cell_size_label.configure(text=f"Cell size: {self.cell_size}px")
-                        elif row[0] == "speed":
-                            self.speed = int(row[1])
-                            self.speed_slider.set(self.speed)
-                            self.speed_label.configure(text=f"{self.speed}ms")
-                        elif row[0] == "boundary_modes":
-                            self.boundary_modes = row[1:5]
-                            # Update boundary option menus
-                            self.left_boundary.set(self.boundary_modes[0])
-                            self.right_boundary.set(self.boundary_modes[1])
-                            self.top_boundary.set(self.boundary_modes[2])
-                            self.bottom_boundary.set(self.boundary_modes[3])
-                        elif row[0] == "cancer_weight":
-                            try:
-                                weight = float(row[1])
-                                weight = max(0.0001, min(1.0, weight))  # Clamp to valid range
-                                self.cancer_weight_var.set(str(weight))
-                            except (ValueError, IndexError):
-                                self.cancer_weight_var.set("0.01")  # Default
-                        elif row[0] == "cure_weight":
-                            try:
-                                weight = float(row[1])
-                                weight = max(0.0001, min(1.0, weight))  # Clamp to valid range
-                                self.cure_weight_var.set(str(weight))
-                            except (ValueError, IndexError):
-                                self.cure_weight_var.set("0.1")  # Default
-
-                    # Find grid data
-                    grid_start = 0
-                    for i, row in enumerate(rows):
-                        if row and row[0] == "Grid":
-                            grid_start = i + 1
-                            break
-
-                    # Create new grid
-                    self.grid = Grid(self.grid_size, self.grid_size)
-
-                    # Load grid data
-                    for row_idx in range(self.grid_size):
-                        if grid_start + row_idx < len(rows):
-                            row_data = rows[grid_start + row_idx]
-                            for col_idx in range(min(len(row_data), self.grid_size)):
-                                cell_type = row_data[col_idx]
-                                if cell_type in self.cell_types:
-                                    cell_class, _ = self.cell_types[cell_type]
-                                    new_cell = cell_class(row_idx, col_idx, self.grid)
-
-                                    # Apply loaded weight settings for special cells
-                                    if isinstance(new_cell, CancerCell):
-                                        try:
-                                            new_cell.cancer_weighting = float(self.cancer_weight_var.get())
-                                        except (ValueError, AttributeError):
-                                            new_cell.cancer_weighting = 0.01
-                                    elif isinstance(new_cell, CureCell):
-                                        try:
-                                            new_cell.cure_weighting = float(self.cure_weight_var.get())
-                                        except (ValueError, AttributeError):
-                                            new_cell.cure_weighting = 0.1
-
-                                    self.grid.cells[row_idx][col_idx] = new_cell
+                    if "grid_size" in settings:
+                        self.grid_size = settings["grid_size"]
+                        self.size_slider.set(self.grid_size)
+                        self.size_label.configure(text=f"{self.grid_size}x{self.grid_size}")
+                        self.use_array_engine_if_large()
+
+                        # Update cell size based on loaded grid size
+                        self.fit_cell_size()
+                    if "speed" in settings:
+                        # Older files store milliseconds between generations
+                        self.generations_per_second = max(1, min(1000, round(1000 / max(1, settings["speed"]))))
+                    if "generations_per_second" in settings:
+                        self.unlimited_rate = settings["generations_per_second"] == 0
+                        if not self.unlimited_rate:
+                            self.generations_per_second = max(1, min(1000, settings["generations_per_second"]))
+                    self.rate_slider.set(self.generations_per_second)
+                    self.unlimited_rate_var.set(self.unlimited_rate)
+                    self.rate_label.configure(text=self.rate_text())
+                    if "fps" in settings:
+                        self.frames_per_second = max(1, min(60, settings["fps"]))
+                        self.fps_slider.set(self.frames_per_second)
+                        self.fps_label.configure(text=f"{self.frames_per_second} FPS")
+                    if "generations_per_frame" in settings:
+                        self.generations_per_frame = max(1, settings["generations_per_frame"])
+                        self.batch_var.set(str(self.generations_per_frame))
+                    if "boundary_modes" in settings:
+                        self.boundary_modes = settings["boundary_modes"]
+                        # Update boundary option menus
+                        self.left_boundary.set(self.boundary_modes[0])
+                        self.right_boundary.set(self.boundary_modes[1])
+                        self.top_boundary.set(self.boundary_modes[2])
+                        self.bottom_boundary.set(self.boundary_modes[3])
+                    if "cancer_weight" in settings:
+                        self.cancer_weight_var.set(str(settings["cancer_weight"]))
+                    if "cure_weight" in settings:
+                        self.cure_weight_var.set(str(settings["cure_weight"]))
+
+                    # Apply loaded weight settings for special cells
+                    try:
+                        cancer_weight = float(self.cancer_weight_var.get())
+                    except ValueError:
+                        cancer_weight = BASE_CANCER_WEIGHT
+                    try:
+                        cure_weight = float(self.cure_weight_var.get())
+                    except ValueError:
+                        cure_weight = BASE_CURE_WEIGHT
+
+                    # Create new grid from the loaded cell types
+                    self.grid = self.create_grid()
+                    self.grid.set_arrays(types,
+                                         np.where(types == CANCER, cancer_weight, 0.0),
+                                         np.where(types == CURE, cure_weight, 0.0))
 
                     # Update game runner and UI
-                    self.game_runner = GameRunner(self.grid)
+                    self.game_runner = self.create_runner()
                     if hasattr(self.grid, 'mode_list'):
                         self.grid.mode_list = self.boundary_modes.copy()
 
                     # Resize canvas including border margin
-                    grid_size = self.grid_size * self.cell_size
-                    new_canvas_width = grid_size + (2 * self.border_margin)
-                    new_canvas_height = grid_size + (2 * self.border_margin)
-                    self.canvas.configure(width=new_canvas_width, height=new_canvas_height)
-
-                    # Update scrollable frame size
-                    scroll_width = min(new_canvas_width + 40, self.max_canvas_size)
-                    scroll_height = min(new_canvas_height + 40, self.max_canvas_size)
-                    self.canvas_scroll_frame.configure(width=scroll_width, height=scroll_height)
+                    self.resize_canvas()
 
                     # Recreate cell sprites with new size
                     self.create_cell_sprites()
@@ -1533,21 +2017,10 @@ class ConwayGUI:
             if abs(new_max_size - self.max_canvas_size) > 50:  # Only update if significant change
                 self.max_canvas_size = new_max_size
 
-                # Recalculate cell size if needed
-                if self.grid_size * self.cell_size > self.max_canvas_size:
-                    self.cell_size = max(1, self.max_canvas_size // self.grid_size)
-
-                    # Update canvas and scroll frame
-                    new_canvas_size = self.grid_size * self.cell_size
-                    self.canvas.configure(width=new_canvas_size, height=new_canvas_size)
-
-                    scroll_width = min(new_canvas_size + 40, self.max_canvas_size)
-                    scroll_height = min(new_canvas_size + 40, self.max_canvas_size)
-                    self.canvas_scroll_frame.configure(width=scroll_width, height=scroll_height)
-
-                    # Recreate sprites and update display
-                    self.create_cell_sprites()
-                    self.update_canvas()
+                # The viewport grows or shrinks with the canvas; the cell size is kept
+                self.clamp_view()
+                self.resize_canvas()
+                self.draw_canvas(self.shown_types)
 
     def run(self):
         """Start the GUI main loop"""
@@ -0,0 +1,245 @@
+"""HashLife engine for fast-forwarding pure Conway boards.
+
+The board is stored as a memoized quadtree of canonical nodes. A level-k
+node covers a 2**k x 2**k square, and its successor is its centre half
+advanced 2**j generations (j <= k - 2). Identical squares share one node,
+so a successor is computed once and reused wherever and whenever that
+square appears again.
+
+HashLife works on an unbounded plane, so a finite board is mapped onto a
+periodic plane. That mapping is exact when each axis either wraps on both
+sides ("periodic") or clamps on both sides ("mirror"). A mirror axis of n
+cells behaves like a periodic axis of 2n cells in which the board is
+followed by its reflection.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+# Quadtree levels that are converted straight to and from NumPy blocks
+BLOCK_LEVEL = 4
+
+
+class Node:
+    """Canonical quadtree node; level-0 nodes are single cells"""
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "results")
+
+    def __init__(self, level, nw=None, ne=None, sw=None, se=None, population=0):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+        # Successor cache: step exponent j -> result node
+        self.results = {}
+
+
+DEAD_LEAF = Node(0, population=0)
+ALIVE_LEAF = Node(0, population=1)
+
+
+def fold_index(index, n, mode):
+    """Map plane coordinates onto board coordinates for a periodic or mirror axis"""
+    if mode == "periodic":
+        return index % n
+    index = index % (2 * n)
+    return np.where(index < n, index, 2 * n - 1 - index)
+
+
+class HashLifeEngine:
+    """Jumps pure Conway boards forward in 2**j generation strides"""
+
+    def __init__(self, max_nodes=1000000):
+        self.max_nodes = max_nodes
+        # Canonical node table in least-recently-used order, keyed on the child nodes
+        self.nodes = OrderedDict()
+        self.empty_nodes = [DEAD_LEAF]
+
+    def supports(self, mode_list):
+        """Return whether a board with these boundary modes maps exactly onto a periodic plane"""
+        left, right, up, down = mode_list
+        return (left == right and left in ("periodic", "mirror")
+                and up == down and up in ("periodic", "mirror"))
+
+    def advance(self, alive, mode_list, generations):
+        """Return a boolean Alive board advanced by the given number of generations"""
+        if not self.supports(mode_list):
+            raise ValueError(f"HashLife needs periodic or mirror pairs of boundaries, got {mode_list}")
+        board = np.asarray(alive, dtype=bool)
+        # One stride per set bit of generations
+        for j in range(generations.bit_length()):
+            if generations >> j & 1:
+                board = self.stride(board, mode_list, j)
+        return board
+
+    def stride(self, board, mode_list, j):
+        """Advance a boolean board exactly 2**j generations"""
+        # Only trim the table between strides: mid-recursion it would drop successors still being built on
+        if len(self.nodes) > self.max_nodes:
+            self.collect()
+        rows, cols = board.shape
+        # The root's successor must cover the board: 2**(level - 1) >= max(rows, cols)
+        level = max(j + 2, (max(rows, cols) - 1).bit_length() + 1, BLOCK_LEVEL + 1)
+        origin = -(1 << (level - 2))
+        root = self.build_plane(board, mode_list, level, origin)
+        result = self.successor(root, j)
+        # The successor's top-left corner lands on board cell (0, 0)
+        out = np.zeros((rows, cols), dtype=bool)
+        self.read_window(result, 0, 0, out, {})
+        return out
+
+    def build_plane(self, board, mode_list, level, origin):
+        """Return the level node whose top-left corner is plane cell (origin, origin)"""
+        rows, cols = board.shape
+        left, _, up, _ = mode_list
+        period_rows = rows if up == "periodic" else 2 * rows
+        period_cols = cols if left == "periodic" else 2 * cols
+        size = 1 << BLOCK_LEVEL
+        tiles = {}
+        blocks = {}
+
+        def build(node_level, y, x):
+            key = (node_level, y % period_rows, x % period_cols)
+            node = tiles.get(key)
+            if node is not None:
+                return node
+            if node_level == BLOCK_LEVEL:
+                block_rows = fold_index(np.arange(y, y + size), rows, up)
+                block_cols = fold_index(np.arange(x, x + size), cols, left)
+                block = board[np.ix_(block_rows, block_cols)]
+                block_key = block.tobytes()
+                node = blocks.get(block_key)
+                if node is None:
+                    node = self.from_block(block)
+                    blocks[block_key] = node
+            else:
+                half = 1 << (node_level - 1)
+                node = self.join(build(node_level - 1, y, x), build(node_level - 1, y, x + half),
+                                 build(node_level - 1, y + half, x), build(node_level - 1, y + half, x + half))
+            tiles[key] = node
+            return node
+
+        return build(level, origin, origin)
+
+    def from_block(self, block):
+        """Build a node from a square boolean block whose side is a power of two"""
+        if block.shape[0] == 1:
+            return ALIVE_LEAF if block[0, 0] else DEAD_LEAF
+        if not block.any():
+            return self.empty(block.shape[0].bit_length() - 1)
+        half = block.shape[0] // 2
+        return self.join(self.from_block(block[:half, :half]), self.from_block(block[:half, half:]),
+                         self.from_block(block[half:, :half]), self.from_block(block[half:, half:]))
+
+    def read_window(self, node, y, x, out, blocks):
+        """Copy the part of a node at plane (y, x) that overlaps out into out"""
+        rows, cols = out.shape
+        size = 1 << node.level
+        if node.population == 0 or y >= rows or x >= cols or y + size <= 0 or x + size <= 0:
+            return
+        if node.level <= BLOCK_LEVEL:
+            block = blocks.get(node)
+            if block is None:
+                block = self.to_block(node)
+                blocks[node] = block
+            out[y:y + size, x:x + size] = block[:rows - y, :cols - x]
+            return
+        half = size // 2
+        self.read_window(node.nw, y, x, out, blocks)
+        self.read_window(node.ne, y, x + half, out, blocks)
+        self.read_window(node.sw, y + half, x, out, blocks)
+        self.read_window(node.se, y + half, x + half, out, blocks)
+
+    def to_block(self, node):
+        """Expand a small node into a square boolean block"""
+        if node.level == 0:
+            return np.array([[node.population == 1]])
+        size = 1 << node.level
+        if node.population == 0:
+            return np.zeros((size, size), dtype=bool)
+        return np.block([[self.to_block(node.nw), self.to_block(node.ne)],
+                         [self.to_block(node.sw), self.to_block(node.se)]])
+
+    def join(self, nw, ne, sw, se):
+        """Return the canonical node with the given four children"""
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is not None:
+            self.nodes.move_to_end(key)
+            return node
+        node = Node(nw.level + 1, nw, ne, sw, se,
+                    nw.population + ne.population + sw.population + se.population)
+        self.nodes[key] = node
+        return node
+
+    def collect(self):
+        """Evict the least recently used half of the node table"""
+        # Evicted nodes stay valid for anything still holding them, they just stop being shared
+        for _ in range(len(self.nodes) - self.max_nodes // 2):
+            _, node = self.nodes.popitem(last=False)
+            node.results = {}
+
+    def empty(self, level):
+        """Return the canonical all-Dead node of a level"""
+        while len(self.empty_nodes) <= level:
+            child = self.empty_nodes[-1]
+            self.empty_nodes.append(self.join(child, child, child, child))
+        return self.empty_nodes[level]
+
+    def centre(self, node):
+        """Return the centre half of a node"""
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def successor(self, node, j):
+        """Return the centre half of a node advanced 2**j generations"""
+        if node.population == 0:
+            return self.empty(node.level - 1)
+        result = node.results.get(j)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self.life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # The nine overlapping half-size squares
+            squares = (
+                nw,
+                self.join(nw.ne, ne.nw, nw.se, ne.sw),
+                ne,
+                self.join(nw.sw, nw.se, sw.nw, sw.ne),
+                self.join(nw.se, ne.sw, sw.ne, se.nw),
+                self.join(ne.sw, ne.se, se.nw, se.ne),
+                sw,
+                self.join(sw.ne, se.nw, sw.se, se.sw),
+                se,
+            )
+            if j == node.level - 2:
+                # Full speed: both halves of the step advance 2**(level - 3)
+                inner = node.level - 3
+                parts = [self.successor(square, inner) for square in squares]
+            else:
+                # Slower strides take the first half with no time step
+                inner = j
+                parts = [self.centre(square) for square in squares]
+            result = self.join(
+                self.successor(self.join(parts[0], parts[1], parts[3], parts[4]), inner),
+                self.successor(self.join(parts[1], parts[2], parts[4], parts[5]), inner),
+                self.successor(self.join(parts[3], parts[4], parts[6], parts[7]), inner),
+                self.successor(self.join(parts[4], parts[5], parts[7], parts[8]), inner),
+            )
+
+        node.results[j] = result
+        return result
+
+    def life_4x4(self, node):
+        """Return the centre 2x2 of a 4x4 node after one B3/S23 generation"""
+        cells = self.to_block(node)
+        leaves = []
+        for row in (1, 2):
+            for col in (1, 2):
+                alive = cells[row, col]
+                neighbors = cells[row - 1:row + 2, col - 1:col + 2].sum() - alive
+                leaves.append(ALIVE_LEAF if neighbors == 3 or (alive and neighbors == 2) else DEAD_LEAF)
+        return self.join(*leaves)
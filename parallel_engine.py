@@ -0,0 +1,178 @@
+"""Multi-process stepping engine built on the NumPy engine's rules.
+
+The board is split into row bands that a multiprocessing pool steps in
+parallel. The input board, the output board, the neighbor histogram and the
+random draws live in multiprocessing.shared_memory blocks that every worker
+maps at start-up, so a generation only sends (row_start, row_stop,
+mode_list) to each worker.
+
+Each worker reads its band plus the one-row halo above and below straight
+from the shared input. The halo rows are found through the same boundary
+index tables as the single-process engine, so periodic and mirror edges
+wrap across band edges exactly as they do there.
+"""
+import os
+import weakref
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from vectorized_engine import (HISTOGRAM_CHANNELS, CounterStream, UniformStream, VectorizedEngine,
+                               neighbor_histogram, random_candidates)
+
+# Shared arrays per board: (name, dtype, leading dimensions)
+SHARED_ARRAYS = (
+    ("types", np.uint8, ()),
+    ("cancer_weighting", np.float64, ()),
+    ("cure_weighting", np.float64, ()),
+    ("next_types", np.uint8, ()),
+    ("next_cancer_weighting", np.float64, ()),
+    ("next_cure_weighting", np.float64, ()),
+    ("histogram", np.float64, (HISTOGRAM_CHANNELS,)),
+    ("candidates", np.bool_, ()),
+    ("rand", np.float64, (2,)),
+)
+
+# Per-process state of a pool worker, set up by attach_worker
+_worker = {}
+
+
+def shared_views(blocks, shape):
+    """Return a name -> ndarray mapping over a list of shared memory blocks"""
+    views = {}
+    for block, (name, dtype, leading) in zip(blocks, SHARED_ARRAYS):
+        views[name] = np.ndarray(leading + shape, dtype=dtype, buffer=block.buf)
+    return views
+
+
+def attach_worker(block_names, shape):
+    """Pool initializer: map the shared board into this worker process"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in block_names]
+    _worker["blocks"] = blocks
+    _worker["arrays"] = shared_views(blocks, shape)
+    _worker["rules"] = VectorizedEngine()
+
+
+def count_band(task):
+    """Pool task: write the histogram and random candidates of rows [row_start, row_stop)"""
+    row_start, row_stop, mode_list, _ = task
+    arrays = _worker["arrays"]
+    types = arrays["types"]
+    band = np.s_[row_start:row_stop]
+
+    histogram = neighbor_histogram(types, arrays["cancer_weighting"], arrays["cure_weighting"], mode_list,
+                                   window=(row_start, row_stop, 0, types.shape[1]))
+    arrays["histogram"][:, band] = histogram
+    arrays["candidates"][band] = random_candidates(types[band], histogram)
+
+
+def step_band(task):
+    """Pool task: write the next generation of rows [row_start, row_stop)
+
+    With a (seed, generation) counter key the band draws its own pairs from
+    a CounterStream, so no counting round is needed first.
+    """
+    row_start, row_stop, mode_list, counter_key = task
+    arrays = _worker["arrays"]
+    band = np.s_[row_start:row_stop]
+    if counter_key is not None:
+        count_band(task)
+        stream = CounterStream(counter_key[0])
+        stream.generation = counter_key[1]
+        stream.fill(arrays["candidates"][band], arrays["rand"][:, band], origin=(row_start, 0))
+
+    out = (arrays["next_types"][band], arrays["next_cancer_weighting"][band],
+           arrays["next_cure_weighting"][band])
+    _worker["rules"].apply_rules(arrays["types"][band], arrays["cancer_weighting"][band],
+                                 arrays["cure_weighting"][band], arrays["histogram"][:, band],
+                                 arrays["rand"][:, band], out)
+
+
+def release(pool, blocks):
+    """Shut down a pool and free its shared memory blocks"""
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class ParallelEngine:
+    """Steps a whole board per call across a pool of worker processes
+
+    A generation takes two rounds: the workers first count neighbors and
+    mark random candidates, then the parent hands out the candidates' draws
+    from one UniformStream in row-major order, exactly like
+    VectorizedEngine.step, and the workers apply the rules. Both engines
+    therefore produce bit-identical generations from the same seed. With a
+    CounterStream the bands draw their own pairs in a single round.
+    """
+
+    def __init__(self, seed=None, workers=None):
+        self.stream = UniformStream(seed)
+        self.workers = workers or os.cpu_count() or 1
+        self.shape = None
+        self.pool = None
+        self.blocks = []
+        self.arrays = None
+        self.finalizer = None
+
+    def start(self, shape):
+        """(Re)create the shared buffers and worker pool for a board shape"""
+        self.close()
+        for name, dtype, leading in SHARED_ARRAYS:
+            size = int(np.prod(leading + shape)) * np.dtype(dtype).itemsize
+            self.blocks.append(shared_memory.SharedMemory(create=True, size=max(size, 1)))
+        self.arrays = shared_views(self.blocks, shape)
+        self.pool = Pool(self.workers, initializer=attach_worker,
+                         initargs=([block.name for block in self.blocks], shape))
+        self.shape = shape
+        # Free the pool and shared memory even if close() is never called
+        self.finalizer = weakref.finalize(self, release, self.pool, self.blocks)
+
+    def close(self):
+        """Stop the worker pool and release the shared memory"""
+        if self.finalizer is not None:
+            self.finalizer()
+        self.shape = None
+        self.pool = None
+        self.blocks = []
+        self.arrays = None
+        self.finalizer = None
+
+    def bands(self, rows):
+        """Return the (row_start, row_stop) band handled by each task"""
+        edges = np.linspace(0, rows, min(self.workers, rows) + 1).astype(int)
+        return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+    def step(self, types, cancer_weighting, cure_weighting, mode_list, out=None):
+        """Compute the next generation and return (types, cancer, cure) arrays
+
+        Accepts the same arguments as VectorizedEngine.step.
+        """
+        if self.shape != types.shape:
+            self.start(types.shape)
+        arrays = self.arrays
+        arrays["types"][...] = types
+        arrays["cancer_weighting"][...] = cancer_weighting
+        arrays["cure_weighting"][...] = cure_weighting
+
+        mode_list = list(mode_list)
+        if self.stream.keyed:
+            # Counter-based pairs: each band draws its own in a single round
+            counter_key = (self.stream.seed, self.stream.generation)
+            tasks = [(start, stop, mode_list, counter_key) for start, stop in self.bands(types.shape[0])]
+        else:
+            tasks = [(start, stop, mode_list, None) for start, stop in self.bands(types.shape[0])]
+            self.pool.map(count_band, tasks)
+            self.stream.fill(arrays["candidates"], arrays["rand"])
+        self.pool.map(step_band, tasks)
+
+        if out is None:
+            return (arrays["next_types"].copy(), arrays["next_cancer_weighting"].copy(),
+                    arrays["next_cure_weighting"].copy())
+        out[0][...] = arrays["next_types"]
+        out[1][...] = arrays["next_cancer_weighting"]
+        out[2][...] = arrays["next_cure_weighting"]
+        return out
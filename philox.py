@@ -0,0 +1,70 @@
+"""Vectorized Philox4x32-10 counter-based random number generator.
+
+Philox maps a 128-bit counter and a 64-bit key to 128 random bits with no
+internal state (Salmon et al., "Parallel Random Numbers: As Easy as 1, 2,
+3", SC 2011). The same (counter, key) always gives the same bits, so a
+cell's random draw can be derived from its coordinates instead of from its
+position in a shared sequence.
+"""
+import numpy as np
+
+MASK32 = np.uint64(0xFFFFFFFF)
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = np.uint64(0x9E3779B9)
+PHILOX_W1 = np.uint64(0xBB67AE85)
+PHILOX_ROUNDS = 10
+
+
+def philox4x32(counter, key):
+    """Return the four 32-bit output words for (c0, c1, c2, c3) counter arrays and a (k0, k1) key
+
+    Counter and key words may be scalars or broadcastable arrays, so cells
+    keyed on different seeds can share one call. Each word is reduced to its
+    low 32 bits, so negative coordinates wrap instead of overflowing the
+    products. Results are uint64 arrays holding 32-bit values.
+    """
+    c0, c1, c2, c3 = np.broadcast_arrays(*(as_word(word) for word in counter))
+    k0, k1 = as_word(key[0]), as_word(key[1])
+    for round_index in range(PHILOX_ROUNDS):
+        if round_index:
+            k0 = (k0 + PHILOX_W0) & MASK32
+            k1 = (k1 + PHILOX_W1) & MASK32
+        # 32x32 -> 64-bit products fit in uint64
+        product0 = PHILOX_M0 * c0
+        product1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = ((product1 >> np.uint64(32)) ^ c1 ^ k0, product1 & MASK32,
+                          (product0 >> np.uint64(32)) ^ c3 ^ k1, product0 & MASK32)
+    return c0, c1, c2, c3
+
+
+def as_word(value):
+    """Return value as uint64 holding its low 32 bits; negative values wrap two's-complement style"""
+    return np.asarray(value).astype(np.uint64) & MASK32
+
+
+def seed_key(seed):
+    """Split a non-negative integer seed into a (k0, k1) Philox key"""
+    seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+    return seed & 0xFFFFFFFF, seed >> 32
+
+
+def words_to_uniform(high, low):
+    """Combine two 32-bit words into doubles in [0, 1) with 53 random bits"""
+    bits = ((high >> np.uint64(5)) << np.uint64(26)) | (low >> np.uint64(6))
+    return bits * (1.0 / 9007199254740992.0)
+
+
+def uniform_pairs(seed, generation, rows, cols):
+    """Return (u0, u1) uniform arrays for cells (rows[k], cols[k]) in a generation
+
+    Each cell uses one Philox block with counter (generation, row, col, 0)
+    and the seed as key, so its pair depends only on those values.
+    """
+    return keyed_uniform_pairs(seed_key(seed), generation, rows, cols)
+
+
+def keyed_uniform_pairs(key, generation, rows, cols):
+    """Return uniform_pairs for a (k0, k1) key whose words may be per-cell arrays"""
+    words = philox4x32((generation, rows, cols, 0), key)
+    return words_to_uniform(words[0], words[1]), words_to_uniform(words[2], words[3])
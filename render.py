@@ -0,0 +1,199 @@
+"""NumPy rasterizer for the GUI's board view.
+
+Turns a board's type codes into an RGB pixel array in one vectorized pass,
+so the GUI can show a whole generation as a single Tk image instead of one
+canvas item per cell. Below one pixel per cell, DensityPyramid and
+density_colors show each pixel as a blend of the cell types it covers.
+Nothing here imports Tk.
+"""
+import numpy as np
+
+from vectorized_engine import DEAD
+
+# Edge length of the tiles DensityPyramid recounts; also its coarsest reduction factor
+PYRAMID_TILE = 64
+
+
+def hex_to_rgb(color):
+    """Convert a "#RRGGBB" color to an (r, g, b) tuple"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def color_table(colors):
+    """Return a (codes, 3) uint8 lookup table from a {type code: "#RRGGBB"} mapping"""
+    table = np.zeros((max(colors) + 1, 3), dtype=np.uint8)
+    for code, color in colors.items():
+        table[code] = hex_to_rgb(color)
+    return table
+
+
+def flat_atlas(table, cell_size, grid_color=None):
+    """Return a (codes, cell_size, cell_size, 3) atlas of solid tiles, one per row of table
+
+    With grid_color the top and left pixel lines of every tile are drawn in
+    that color to outline the cells.
+    """
+    atlas = np.empty((len(table), cell_size, cell_size, 3), dtype=np.uint8)
+    atlas[...] = table[:, np.newaxis, np.newaxis, :]
+    if grid_color is not None and cell_size > 2:
+        atlas[:, 0] = grid_color
+        atlas[:, :, 0] = grid_color
+    return atlas
+
+
+def sprite_atlas(sprites, cell_size, gap_color=(0, 0, 0)):
+    """Return a (codes, cell_size, cell_size, 3) atlas from a {type code: (h, w, 3) RGB array} mapping
+
+    Each sprite is placed in the top-left corner of its tile and cropped to
+    it; whatever the sprite leaves uncovered (the one-pixel gap around
+    cell_size - 1 sprites) is gap_color.
+    """
+    atlas = np.empty((max(sprites) + 1, cell_size, cell_size, 3), dtype=np.uint8)
+    atlas[...] = gap_color
+    for code, sprite in sprites.items():
+        height, width = min(sprite.shape[0], cell_size), min(sprite.shape[1], cell_size)
+        atlas[code, :height, :width] = sprite[:height, :width, :3]
+    return atlas
+
+
+def composite(types, atlas):
+    """Return the (rows * size, cols * size, 3) image that tiles atlas[code] for every cell"""
+    rows, cols = types.shape
+    size = atlas.shape[1]
+    # (rows, cols, size, size, 3) tiles -> interleave the tile rows and columns with the board's
+    return atlas[types].transpose(0, 2, 1, 3, 4).reshape(rows * size, cols * size, 3)
+
+
+def rasterize(types, table, cell_size, grid_color=None):
+    """Return the (rows * cell_size, cols * cell_size, 3) RGB image of a board in flat colors
+
+    Each cell becomes a cell_size x cell_size block of its type's color from
+    table, outlined in grid_color if given.
+    """
+    return composite(types, flat_atlas(table, cell_size, grid_color))
+
+
+def line_cells(row0, col0, row1, col1):
+    """Return the (row, col) cells of the Bresenham line from (row0, col0) to (row1, col1), both included"""
+    cells = []
+    d_col, d_row = abs(col1 - col0), -abs(row1 - row0)
+    step_col = 1 if col0 < col1 else -1
+    step_row = 1 if row0 < row1 else -1
+    error = d_col + d_row
+    while True:
+        cells.append((row0, col0))
+        if (row0, col0) == (row1, col1):
+            return cells
+        double_error = 2 * error
+        if double_error >= d_row:
+            error += d_row
+            col0 += step_col
+        if double_error <= d_col:
+            error += d_col
+            row0 += step_row
+
+
+def pool_2x2(blocks):
+    """Sum each 2x2 block of the last two axes"""
+    return blocks[..., ::2, ::2] + blocks[..., 1::2, ::2] + blocks[..., ::2, 1::2] + blocks[..., 1::2, 1::2]
+
+
+def density_colors(counts, table, gamma=0.5):
+    """Return the (h, w, 3) RGB image of (codes, h, w) per-pixel cell counts
+
+    Each pixel mixes the table colors of its non-Dead cells in proportion
+    to their counts, over the Dead color by the pixel's non-Dead fraction
+    raised to gamma, so sparse regions stay visible when zoomed out.
+    """
+    counts = counts.astype(np.float32)
+    live = np.arange(len(counts)) != DEAD
+    total = counts.sum(axis=0)
+    occupied = total - counts[DEAD]
+    mix = np.einsum("chw,cd->hwd", counts[live], table[live].astype(np.float32))
+    mix /= np.maximum(occupied, 1)[..., np.newaxis]
+    coverage = (occupied / np.maximum(total, 1))[..., np.newaxis] ** gamma
+    return (table[DEAD] * (1 - coverage) + mix * coverage).round().astype(np.uint8)
+
+
+def merge_changes(first, second):
+    """Return the union of two changed-tile masks, or None (anything may have changed) if either is"""
+    if first is None or second is None or first.shape != second.shape:
+        return None
+    return first | second
+
+
+class DensityPyramid:
+    """Per-type cell counts of a board summed over 2x2, 4x4, ... tile x tile blocks
+
+    The board is split into tile x tile tiles (tile a power of two) and every
+    level is stored tile by tile. Callers report which tiles changed with
+    mark_changed(), for instance from GameRunner.take_changes(), and update()
+    recounts only those. Only non-Dead codes are counted; Dead is whatever is
+    left of each block.
+    """
+
+    def __init__(self, codes=4, tile=PYRAMID_TILE):
+        self.codes = codes
+        self.tile = tile
+        # Tiles to recount on the next update(); None recounts all of them
+        self.dirty = None
+        # factor -> (tile_rows, tile_cols, non-Dead codes, tile // factor, tile // factor) counts
+        self.levels = {}
+
+    def factors(self):
+        """Return the reduction factors kept: 2, 4, ..., tile"""
+        return [2 ** power for power in range(1, self.tile.bit_length())]
+
+    def mark_changed(self, changed_tiles=None):
+        """Note the (tile_rows, tile_cols) mask of tiles changed since the board last counted; None marks all"""
+        if self.dirty is not None:
+            self.dirty = merge_changes(self.dirty, changed_tiles)
+
+    def update(self, types):
+        """Recount the marked tiles of a board's type codes; returns how many tiles were recounted"""
+        tile = self.tile
+        rows, cols = types.shape
+        tile_rows, tile_cols = -(-rows // tile), -(-cols // tile)
+        if not self.levels or self.levels[tile].shape[:2] != (tile_rows, tile_cols):
+            self.levels = {factor: np.zeros((tile_rows, tile_cols, self.codes - 1, tile // factor, tile // factor),
+                                            dtype=np.uint16)
+                           for factor in self.factors()}
+            self.dirty = None
+        dirty = np.ones((tile_rows, tile_cols), dtype=bool) if self.dirty is None else self.dirty
+        self.dirty = np.zeros((tile_rows, tile_cols), dtype=bool)
+
+        tile_index = np.nonzero(dirty)
+        if tile_index[0].size:
+            # Gather the (n, tile, tile) cells of the marked tiles; cells past the board's edge count as Dead
+            offsets = np.arange(tile)
+            cell_rows = tile_index[0][:, np.newaxis, np.newaxis] * tile + offsets[:, np.newaxis]
+            cell_cols = tile_index[1][:, np.newaxis, np.newaxis] * tile + offsets
+            changed_tiles = types[np.minimum(cell_rows, rows - 1), np.minimum(cell_cols, cols - 1)]
+            changed_tiles[(cell_rows >= rows) | (cell_cols >= cols)] = DEAD
+            live_codes = [code for code in range(self.codes) if code != DEAD]
+            for channel, code in enumerate(live_codes):
+                # Halve each side once per level, starting from the (n, tile, tile) cells of this type
+                counts = pool_2x2((changed_tiles == code).view(np.uint8)).astype(np.uint16)
+                for factor in self.factors():
+                    if factor > 2:
+                        counts = pool_2x2(counts)
+                    self.levels[factor][tile_index + (channel,)] = counts
+        return int(tile_index[0].size)
+
+    def counts(self, factor, row, col, rows, cols):
+        """Return the (codes, ceil(rows / factor), ceil(cols / factor)) counts of a block of the board
+
+        row and col must be multiples of factor.
+        """
+        tile = self.tile
+        # Only the tiles overlapping the block are laid out as one array
+        first_row, first_col = row // tile, col // tile
+        level = self.levels[factor][first_row:-(-(row + rows) // tile), first_col:-(-(col + cols) // tile)]
+        tile_rows, tile_cols, channels, size, _ = level.shape
+        block = level.transpose(2, 0, 3, 1, 4).reshape(channels, tile_rows * size, tile_cols * size)
+        row, col = row - first_row * tile, col - first_col * tile
+        live = block[:, row // factor:-(-(row + rows) // factor), col // factor:-(-(col + cols) // factor)]
+        counts = np.empty((self.codes,) + live.shape[1:], dtype=np.uint16)
+        counts[np.arange(self.codes) != DEAD] = live
+        counts[DEAD] = factor ** 2 - live.sum(axis=0, dtype=np.uint16)
+        return counts
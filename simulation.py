@@ -0,0 +1,938 @@
+"""Simulation model for Conway's Game of Life with cancer and cure cells.
+
+Holds the cell classes, the Grid and the GameRunner that steps it with any
+of the stepping engines, plus reading and writing the grid CSV files the
+GUI saves. Nothing here imports a GUI toolkit, so it can be used headless
+(see batch.py).
+"""
+import csv
+from collections import deque
+
+import numpy as np
+
+from vectorized_engine import (VectorizedEngine, UniformStream, CounterStream, EnsembleStream, DEAD, ALIVE, CANCER, CURE,
+                               BASE_CANCER_WEIGHT, BASE_CURE_WEIGHT, neighbor_table,
+                               zobrist_key, zobrist_keys, xor_keys)
+from bitpacked_engine import BitpackedEngine
+from hashlife_engine import HashLifeEngine
+from parallel_engine import ParallelEngine
+from chunked_universe import ChunkedUniverse
+
+
+class Location:
+    def __init__(self, i: int, j: int):
+        self.i = i
+        self.j = j
+
+class ImplCell:
+    def __init__(self, location, grid):
+        self.location = location
+        self.grid = grid
+
+    def process(self):
+        pass
+
+    def clone(self, grid):
+        pass
+
+    def __str__(self):
+        return " "
+
+class DeadCell(ImplCell):
+    def __init__(self, row, col, grid):
+        super().__init__(Location(row, col), grid)
+
+    def clone(self, grid):
+        return DeadCell(self.location.i, self.location.j, grid)
+
+    def process(self):
+        # One pass over the neighbors gives every count and weight sum below
+        neighborhood = self.grid.neighborhood(self.location.i, self.location.j)
+
+        # Standard Conway's Game of Life rule
+        neighbors = neighborhood.counts[ALIVE]
+        if neighbors == 3:
+            return AliveCell(self.location.i, self.location.j, self.grid)
+
+        # Cancer spread - use weight as probability multiplier
+        cancer_neighbors = neighborhood.counts[CANCER]
+        if cancer_neighbors >= 1:
+            # This cell may change at random: take its pair of draws
+            spread_draw, spawn_draw = self.grid.random_pair(self.location.i, self.location.j)
+
+            # Get the average cancer weight from neighboring cancer cells
+            cancer_count = neighborhood.cancer_count
+            if cancer_count > 0:
+                avg_cancer_weight = neighborhood.cancer_total / cancer_count
+                # Original cancer_chance was 0.1, now scale by weight
+                cancer_chance = 0.1 * (avg_cancer_weight / 0.01)  # 0.01 is baseline
+                cancer_chance = min(1.0, cancer_chance)  # Cap at 100%
+                if spread_draw < cancer_chance:
+                    new_cancer = CancerCell(self.location.i, self.location.j, self.grid)
+                    new_cancer.cancer_weighting = avg_cancer_weight
+                    return new_cancer
+
+        # Cure generation when many cancer cells present
+        if cancer_neighbors >= 5:
+            # Get average cure weight from nearby cure cells, or use default
+            cure_count = neighborhood.cure_count
+
+            # Use cure weight for spontaneous cure generation
+            if cure_count > 0:
+                avg_cure_weight = neighborhood.cure_total / cure_count
+            else:
+                avg_cure_weight = 0.1  # Default cure weight
+
+            # Original curechance was 0.5, now scale by weight
+            cure_chance = 0.5 * (avg_cure_weight / 0.1)  # 0.1 is baseline
+            cure_chance = min(1.0, cure_chance)  # Cap at 100%
+            if spawn_draw < cure_chance:
+                new_cure = CureCell(self.location.i, self.location.j, self.grid)
+                new_cure.cure_weighting = avg_cure_weight
+                return new_cure
+
+        return DeadCell(self.location.i, self.location.j, self.grid)
+
+    def __str__(self):
+        return "🟥"
+
+class AliveCell(ImplCell):
+    def __init__(self, row, col, grid):
+        super().__init__(Location(row, col), grid)
+
+    def process(self):
+        neighbors = self.grid.neighborhood(self.location.i, self.location.j).counts[ALIVE]
+        if neighbors in [2, 3]:
+            return AliveCell(self.location.i, self.location.j, self.grid)
+        return DeadCell(self.location.i, self.location.j, self.grid)
+
+    def clone(self, grid):
+        return AliveCell(self.location.i, self.location.j, grid)
+
+    def __str__(self):
+        return "🟩"
+
+class CancerCell(ImplCell):
+    def __init__(self, row, col, grid):
+        self.cancer_weighting = 0.01
+        super().__init__(Location(row, col), grid)
+
+    def process(self):
+        loc = self.location
+        neighborhood = self.grid.neighborhood(loc.i, loc.j)
+        cure_neighbors = neighborhood.counts[CURE]
+        cancer_neighbors = neighborhood.counts[CANCER]
+
+        # Original rule: die if cure_neighbors >= 1 OR cancer_neighbors >= 7
+        # Now make it weight-dependent
+
+        # Cure effectiveness vs cancer resistance
+        if cure_neighbors >= 1:
+            # Get average cure strength
+            cure_count = neighborhood.cure_count
+            avg_cure_strength = neighborhood.cure_total / cure_count if cure_count > 0 else 0.1
+
+            # Calculate cure effectiveness vs cancer resistance
+            # Higher cure weight = more likely to kill cancer
+            # Higher cancer weight = more resistant to cure
+            cure_kill_chance = (avg_cure_strength / 0.1) * 0.5  # Base 50% chance at weight 0.1
+            cancer_resistance = (self.cancer_weighting / 0.01) * 0.1  # Base 10% resistance at weight 0.01
+
+            effective_cure_chance = max(0.3, cure_kill_chance - cancer_resistance)
+            cure_draw, _ = self.grid.random_pair(loc.i, loc.j)
+            if cure_draw < effective_cure_chance:
+                return AliveCell(loc.i, loc.j, self.grid)
+
+        # Overcrowding death - weight affects threshold
+        # Original threshold was 7, now make it weight-dependent
+        base_threshold = 7
+        weight_modifier = (self.cancer_weighting / 0.01) - 1  # How much above baseline weight
+        overcrowd_threshold = max(5, int(base_threshold - weight_modifier))  # Higher weight = lower threshold
+
+        if cancer_neighbors >= overcrowd_threshold:
+            return DeadCell(loc.i, loc.j, self.grid)
+
+        # Cancer persists
+        new_cancer = CancerCell(loc.i, loc.j, self.grid)
+        new_cancer.cancer_weighting = self.cancer_weighting
+        return new_cancer
+
+    def clone(self, grid):
+        new_cancer = CancerCell(self.location.i, self.location.j, grid)
+        new_cancer.cancer_weighting = self.cancer_weighting
+        return new_cancer
+
+    def __str__(self):
+        return "⬜"
+
+class CureCell(ImplCell):
+    def __init__(self, row, col, grid):
+        self.cure_weighting = 0.1
+        super().__init__(Location(row, col), grid)
+
+    def process(self):
+        loc = self.location
+        neighborhood = self.grid.neighborhood(loc.i, loc.j)
+        cure_neighbors = neighborhood.counts[CURE]
+        dead_neighbors = neighborhood.counts[DEAD]
+
+        # Original rules: die if dead_neighbors >= 6 OR cure_neighbors >= 3
+        # Now make it weight-dependent
+
+        # Death from isolation - weight affects threshold
+        # Original threshold was 6, now make it weight-dependent
+        base_dead_threshold = 6
+        weight_modifier = (self.cure_weighting / 0.1) - 1  # How much above baseline weight
+        dead_threshold = max(4, int(base_dead_threshold + weight_modifier))  # Higher weight = higher threshold (more resistant)
+
+        if dead_neighbors >= dead_threshold:
+            return DeadCell(loc.i, loc.j, self.grid)
+
+        # Death from overcrowding - weight affects threshold
+        # Original threshold was 3, now make it weight-dependent
+        base_cure_threshold = 3
+        cure_threshold = max(2, int(base_cure_threshold + weight_modifier))  # Higher weight = higher threshold (more resistant)
+
+        if cure_neighbors >= cure_threshold:
+            return DeadCell(loc.i, loc.j, self.grid)
+
+        # Cure persists
+        new_cure = CureCell(loc.i, loc.j, self.grid)
+        new_cure.cure_weighting = self.cure_weighting
+        return new_cure
+
+    def __str__(self):
+        return "🟦"
+
+    def clone(self, grid):
+        new_cure = CureCell(self.location.i, self.location.j, grid)
+        new_cure.cure_weighting = self.cure_weighting
+        return new_cure
+
+class Neighborhood:
+    """Fused summary of a cell's 8 neighbors, gathered in a single pass.
+
+    counts holds the number of neighbors of each type code and honors the
+    boundary modes. The weight totals and counts only include in-bounds
+    CancerCell/CureCell neighbors, which is what the weight averages use.
+    """
+    def __init__(self):
+        self.counts = [0, 0, 0, 0]
+        self.cancer_total = 0
+        self.cancer_count = 0
+        self.cure_total = 0
+        self.cure_count = 0
+
+class CellRow:
+    """Row view of an array-backed grid that builds cell objects on access"""
+    def __init__(self, grid, row):
+        self.grid = grid
+        self.row = row
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.cols:
+            raise IndexError(col)
+        return self.grid.get_cell(self.row, col)
+
+    def __setitem__(self, col, cell):
+        self.grid.write_cell(self.row, col, cell)
+
+class CellRows:
+    """Row-of-rows view so array-backed grids still support grid.cells[row][col]"""
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __len__(self):
+        return self.grid.rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.grid.rows:
+            raise IndexError(row)
+        return CellRow(self.grid, row)
+
+class Grid:
+    # Storage modes: a list of lists of cell objects, or compact NumPy arrays
+    # (uint8 type codes plus float32 cancer/cure weights)
+    storages = ("objects", "array")
+
+    def __init__(self, rows, cols, mode_list=["normal", "normal", "normal", "normal"], storage="objects"):
+        self.rows = rows
+        self.cols = cols
+        self.mode_list = mode_list
+        self.storage = storage
+        # Source of the random draws used by process(); GameRunner shares its own
+        self.stream = None
+        # Zobrist hash and per-type counts of the board, kept up to date from the
+        # cells that change (None until recomputed after a bulk overwrite)
+        self._state_hash = 0
+        self._counts = np.zeros(4, dtype=np.int64)
+        self._counts[DEAD] = rows * cols
+        if storage == "array":
+            self.types = np.zeros((rows, cols), dtype=np.uint8)
+            self.cancer_weighting = np.zeros((rows, cols), dtype=np.float32)
+            self.cure_weighting = np.zeros((rows, cols), dtype=np.float32)
+            self.cells = CellRows(self)
+        else:
+            self.cells = [[DeadCell(j, i, self) for i in range(cols)] for j in range(rows)]
+
+    @property
+    def mode_list(self):
+        return self._mode_list
+
+    @mode_list.setter
+    def mode_list(self, value):
+        # A boundary change invalidates the precomputed neighbor table
+        if getattr(self, "_mode_list", None) != value:
+            self._neighbor_table = None
+        self._mode_list = value
+
+    def random_pair(self, row, col):
+        """Return the (u0, u1) pair of uniform draws for the cell at (row, col)"""
+        if self.stream is None:
+            self.stream = UniformStream()
+        return self.stream.pair(row, col)
+
+    def neighbor_table(self):
+        """Return the neighbor positions of every cell for the current boundary modes
+
+        Built once per (rows, cols, mode_list) combination and rebuilt only
+        after mode_list is assigned a different value (as set_boundary does).
+        """
+        if self._neighbor_table is None:
+            self._neighbor_table = neighbor_table(self.rows, self.cols, tuple(self.mode_list))
+        return self._neighbor_table
+
+    def set_cell(self, cell):
+        self.write_cell(cell.location.i, cell.location.j, cell)
+
+    def write_cell(self, row, col, cell):
+        """Store a cell object at (row, col)"""
+        code = CELL_CODES[type(cell)]
+        if self.storage != "array":
+            self.track_change(row, col, CELL_CODES[type(self.cells[row][col])], code)
+            self.cells[row][col] = cell
+            return
+        self.track_change(row, col, int(self.types[row, col]), code)
+        self.types[row, col] = code
+        self.cancer_weighting[row, col] = cell.cancer_weighting if code == CANCER else 0.0
+        self.cure_weighting[row, col] = cell.cure_weighting if code == CURE else 0.0
+
+    def track_change(self, row, col, old_code, new_code):
+        """Update the state hash and type counts for one cell changing type"""
+        if old_code == new_code or self._state_hash is None:
+            return
+        self._state_hash ^= zobrist_key(old_code, row, col) ^ zobrist_key(new_code, row, col)
+        self._counts[old_code] -= 1
+        self._counts[new_code] += 1
+
+    def state_hash(self):
+        """Return the Zobrist hash of the cell types on the board (0 when every cell is Dead)"""
+        if self._state_hash is None:
+            self.rehash()
+        return self._state_hash
+
+    def rehash(self, previous=None):
+        """Bring the state hash and type counts up to date after the board was overwritten
+
+        Given the grid this board was computed from, only the cells that
+        differ from it are hashed and their (rows, cols) indices are returned;
+        otherwise every non-Dead cell is and None is returned.
+        """
+        types = self.to_arrays()[0]
+        if previous is None:
+            changed = np.nonzero(types)
+            self._state_hash = xor_keys(zobrist_keys(types[changed], *changed))
+            self._counts = np.bincount(types.ravel(), minlength=len(CELL_CLASSES))
+            return None
+        before = previous.to_arrays()[0]
+        changed = np.nonzero(before != types)
+        old, new = before[changed], types[changed]
+        self._state_hash = previous.state_hash() ^ xor_keys(zobrist_keys(old, *changed) ^ zobrist_keys(new, *changed))
+        self._counts = (previous.count_types() + np.bincount(new, minlength=len(CELL_CLASSES))
+                        - np.bincount(old, minlength=len(CELL_CLASSES)))
+        return changed
+
+    def clone(self):
+        new_grid = Grid(self.rows, self.cols, self.mode_list, self.storage)
+        if self.storage == "array":
+            new_grid.set_arrays(self.types, self.cancer_weighting, self.cure_weighting)
+            return new_grid
+        for i in range(len(self.cells)):
+            for j in range(len(self.cells[0])):
+                new_grid.cells[i][j] = self.cells[i][j].clone(new_grid)
+        new_grid._state_hash = self._state_hash
+        new_grid._counts = None if self._counts is None else self._counts.copy()
+        return new_grid
+
+    def get_cell(self, row, col):
+        if self.storage != "array":
+            return self.cells[row][col]
+        code = self.types[row, col]
+        cell = CELL_CLASSES[code](row, col, self)
+        if code == CANCER:
+            cell.cancer_weighting = float(self.cancer_weighting[row, col])
+        elif code == CURE:
+            cell.cure_weighting = float(self.cure_weighting[row, col])
+        return cell
+
+    def check_left(self, col, mode="normal"):
+        if mode == "periodic":
+            return col % len(self.cells[0])
+        elif mode == "mirror" and col < 0:
+            return 0
+        elif col < 0:
+            return None
+        return col
+
+    def check_right(self, col, mode="normal"):
+        if mode == "periodic":
+            return col % len(self.cells[0])
+        elif mode == "mirror" and col > len(self.cells[0]) - 1:
+            return len(self.cells[0]) - 1
+        elif col > len(self.cells[0]) - 1:
+            return None
+        return col
+
+    def check_up(self, row, mode="normal"):
+        if mode == "periodic":
+            return row % len(self.cells)
+        elif mode == "mirror" and row < 0:
+            return 0
+        elif row < 0:
+            return None
+        return row
+
+    def check_down(self, row, mode="normal"):
+        if mode == "periodic":
+            return row % len(self.cells)
+        elif mode == "mirror" and row > len(self.cells) - 1:
+            return len(self.cells) - 1
+        elif row > len(self.cells) - 1:
+            return None
+        return row
+
+    def row_processor(self, row, i, mode_list):
+        if i < row:
+            return self.check_up(i, mode_list[2])
+        elif i > row:
+            return self.check_down(i, mode_list[3])
+        else:
+            return i
+
+    def col_processor(self, col, j, mode_list):
+        if j < col:
+            return self.check_left(j, mode_list[0])
+        elif j > col:
+            return self.check_right(j, mode_list[1])
+        else:
+            return j
+
+    def count_neighbors(self, row, col, cell_type=AliveCell, mode_list=None):
+        if mode_list is None:
+            probes = self.neighbor_table().probes(row, col)
+        else:
+            probes = neighbor_table(self.rows, self.cols, tuple(mode_list)).probes(row, col)
+        if self.storage == "array":
+            code = CELL_CODES[cell_type]
+            types = self.types
+            return sum(1 for r, c, _ in probes if types[r, c] == code)
+        cells = self.cells
+        return sum(1 for r, c, _ in probes if isinstance(cells[r][c], cell_type))
+
+    def neighborhood(self, row, col):
+        """Count every neighbor type and sum the in-bounds weights in one pass"""
+        neighborhood = Neighborhood()
+        counts = neighborhood.counts
+        array_storage = self.storage == "array"
+        for r, c, inside in self.neighbor_table().probes(row, col):
+            if array_storage:
+                code = int(self.types[r, c])
+            else:
+                cell = self.cells[r][c]
+                code = CELL_CODES[type(cell)]
+            counts[code] += 1
+            if not inside:
+                continue
+            if code == CANCER:
+                neighborhood.cancer_total += float(self.cancer_weighting[r, c]) if array_storage else cell.cancer_weighting
+                neighborhood.cancer_count += 1
+            elif code == CURE:
+                neighborhood.cure_total += float(self.cure_weighting[r, c]) if array_storage else cell.cure_weighting
+                neighborhood.cure_count += 1
+        return neighborhood
+
+    def to_arrays(self):
+        """Return the board as (types, cancer_weighting, cure_weighting) arrays
+
+        Array-backed grids return their live arrays; copy them before mutating.
+        """
+        if self.storage == "array":
+            return self.types, self.cancer_weighting, self.cure_weighting
+        types = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        cancer_weighting = np.zeros((self.rows, self.cols))
+        cure_weighting = np.zeros((self.rows, self.cols))
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell = self.cells[row][col]
+                code = CELL_CODES[type(cell)]
+                types[row, col] = code
+                if code == CANCER:
+                    cancer_weighting[row, col] = cell.cancer_weighting
+                elif code == CURE:
+                    cure_weighting[row, col] = cell.cure_weighting
+        return types, cancer_weighting, cure_weighting
+
+    @classmethod
+    def from_arrays(cls, types, cancer_weighting, cure_weighting, mode_list=None, storage="objects"):
+        """Build a grid from type and weight arrays"""
+        rows, cols = types.shape
+        if mode_list is None:
+            mode_list = ["normal", "normal", "normal", "normal"]
+        grid = cls(rows, cols, mode_list, storage)
+        grid.set_arrays(types, cancer_weighting, cure_weighting)
+        return grid
+
+    def set_arrays(self, types, cancer_weighting=None, cure_weighting=None):
+        """Replace the whole board from type and (optional) weight arrays"""
+        if cancer_weighting is None:
+            cancer_weighting = np.where(types == CANCER, BASE_CANCER_WEIGHT, 0.0)
+        if cure_weighting is None:
+            cure_weighting = np.where(types == CURE, BASE_CURE_WEIGHT, 0.0)
+        self._state_hash = self._counts = None
+        if self.storage == "array":
+            self.types[...] = types
+            self.cancer_weighting[...] = cancer_weighting
+            self.cure_weighting[...] = cure_weighting
+            return
+        for row in range(self.rows):
+            for col in range(self.cols):
+                code = types[row, col]
+                cell = CELL_CLASSES[code](row, col, self)
+                if code == CANCER:
+                    cell.cancer_weighting = float(cancer_weighting[row, col])
+                elif code == CURE:
+                    cell.cure_weighting = float(cure_weighting[row, col])
+                self.cells[row][col] = cell
+
+    def set_types(self, rows, cols, code, weighting=None):
+        """Set every (rows[k], cols[k]) cell to the given type code in one call"""
+        if weighting is None:
+            weighting = {CANCER: BASE_CANCER_WEIGHT, CURE: BASE_CURE_WEIGHT}.get(code, 0.0)
+        self._state_hash = self._counts = None
+        if self.storage == "array":
+            self.types[rows, cols] = code
+            self.cancer_weighting[rows, cols] = weighting if code == CANCER else 0.0
+            self.cure_weighting[rows, cols] = weighting if code == CURE else 0.0
+            return
+        for row, col in zip(np.ravel(rows), np.ravel(cols)):
+            cell = CELL_CLASSES[code](int(row), int(col), self)
+            if code == CANCER:
+                cell.cancer_weighting = weighting
+            elif code == CURE:
+                cell.cure_weighting = weighting
+            self.cells[row][col] = cell
+
+    def set_type_weighting(self, code, weighting):
+        """Set the weight of every CancerCell (code CANCER) or CureCell (code CURE)"""
+        if self.storage == "array":
+            target = self.cancer_weighting if code == CANCER else self.cure_weighting
+            target[self.types == code] = weighting
+            return
+        cell_class = CELL_CLASSES[code]
+        for row in self.cells:
+            for cell in row:
+                if isinstance(cell, cell_class):
+                    if code == CANCER:
+                        cell.cancer_weighting = weighting
+                    else:
+                        cell.cure_weighting = weighting
+
+    def occupied_cells(self):
+        """Return the set of (row, col) positions holding a non-Dead cell"""
+        if self.storage == "array":
+            return set(zip(*(index.tolist() for index in np.nonzero(self.types))))
+        return {(row, col) for row in range(self.rows) for col in range(self.cols)
+                if not isinstance(self.cells[row][col], DeadCell)}
+
+    def count_types(self):
+        """Return the number of Dead, Alive, Cancer and Cure cells as an array"""
+        if self._counts is None:
+            self.rehash()
+        return self._counts.copy()
+
+    def with_storage(self, storage):
+        """Return this board converted to the given storage mode"""
+        if storage == self.storage:
+            return self
+        return Grid.from_arrays(*self.to_arrays(), mode_list=self.mode_list, storage=storage)
+
+# Mapping between cell classes and the type codes used by the array engines
+CELL_CODES = {DeadCell: DEAD, AliveCell: ALIVE, CancerCell: CANCER, CureCell: CURE}
+CELL_CLASSES = {code: cell_class for cell_class, code in CELL_CODES.items()}
+CELL_NAMES = {code: cell_class.__name__.replace("Cell", "") for code, cell_class in CELL_CLASSES.items()}
+
+class GameRunner:
+    """Steps a grid through generations using two preallocated buffers.
+
+    ``grid`` is the front buffer. It always holds the most recently completed
+    generation, and update() never writes to it. update() reads the front
+    buffer, writes the next generation into the back buffer, then swaps the
+    two. Readers such as ConwayGUI.update_canvas therefore always see a
+    complete generation. A grid reference taken after update N stays intact
+    through update N+1. Update N+2 reuses it as its write target.
+
+    Every stochastic transition draws from one seeded UniformStream, one
+    pair of uniforms per candidate cell in row-major order, so a run is
+    reproducible from its seed and initial grid. With counter_rng each pair
+    is instead derived from (seed, generation, row, col) by a CounterStream,
+    which makes the result independent of how the board is partitioned.
+
+    With active_set enabled only cells (or NumPy engine tiles) with a
+    non-Dead cell in their neighborhood are evaluated. Every other cell is
+    Dead with no living, cancer or cure neighbor, so it provably stays Dead.
+    The parallel engine always steps the whole board.
+
+    The NumPy engine switches to the bit-packed B3/S23 engine whenever the
+    board holds no Cancer or Cure cell, and back as soon as one appears.
+
+    advance(n) fast-forwards such pure Conway boards with HashLife when both
+    edges of each axis are periodic or both are mirror.
+
+    Every generation's Zobrist hash (Grid.state_hash) goes into a bounded
+    history. Once the board holds no Cancer cell it evolves
+    deterministically, so a repeated hash means it has entered a cycle:
+    ``period`` is then set to the cycle length (1 for a still life) and
+    ``extinct`` is set once every cell is Dead. Editing the board between
+    updates restarts the history.
+
+    With unbounded enabled the grid is a window onto a ChunkedUniverse that
+    covers rows [0, grid.rows) and columns [0, grid.cols) of an infinite
+    board. Cells may leave the window and keep evolving outside it, the
+    boundary modes are ignored, and every engine choice steps the universe's
+    chunks with the NumPy rules. Edits made to the window are copied into
+    the universe before the next update.
+
+    After track_changes(tile) the runner also marks which tile x tile
+    blocks of the board change, for a renderer to collect with
+    take_changes() and recount only those.
+    """
+    # Available stepping engines: per-cell process() calls, NumPy arrays, or
+    # NumPy arrays split into row bands across worker processes
+    engines = ("object", "numpy", "parallel")
+    array_engines = ("numpy", "parallel")
+    # Number of recent generation hashes kept; longer cycles go undetected
+    history_size = 1024
+
+    def __init__(self, grid, engine="object", active_set=False, seed=None, counter_rng=False, unbounded=False):
+        self.grid = grid
+        self.engine = engine
+        self.active_set = active_set
+        self.counter_rng = counter_rng
+        # Number of generations computed so far
+        self.generation = 0
+        self.vectorized_engine = VectorizedEngine()
+        self.bitpacked_engine = BitpackedEngine()
+        self.hashlife_engine = HashLifeEngine()
+        self.parallel_engine = ParallelEngine()
+        # Edge length of the blocks marked in changed_tiles; None while changes are not tracked
+        self.change_tile = None
+        # Blocks changed since the last take_changes(); None if any cell may have
+        self.changed_tiles = None
+        self.set_seed(seed)
+        self.back_grid = None
+        self.back_buffer()
+        self.set_unbounded(unbounded)
+
+    def set_seed(self, seed=None):
+        """Restart the random draws from a seed (None picks a fresh random seed)"""
+        self.seed = seed
+        # One stream shared by every engine, so switching engines keeps the sequence
+        self.stream = CounterStream(seed) if self.counter_rng else UniformStream(seed)
+        self.stream.generation = self.generation
+        self.vectorized_engine.stream = self.stream
+        self.parallel_engine.stream = self.stream
+
+    def back_buffer(self):
+        """Return the preallocated grid the next generation is written into"""
+        grid = self.grid
+        back = self.back_grid
+        # Reallocate only if the front buffer was replaced by a different shape or storage
+        if back is None or back is grid or (back.rows, back.cols, back.storage) != (grid.rows, grid.cols, grid.storage):
+            back = Grid(grid.rows, grid.cols, grid.mode_list, grid.storage)
+            self.back_grid = back
+        back.mode_list = grid.mode_list
+        return back
+
+    def swap_buffers(self, generations=1):
+        """Make the freshly written back buffer the new front buffer"""
+        self.grid, self.back_grid = self.back_grid, self.grid
+        self.generation += generations
+        self.stream.generation = self.generation
+        if generations == 1:
+            self.record_state()
+        else:
+            # The skipped generations were never hashed, so a repeat could not give the shortest period
+            self.reset_history()
+
+    def track_changes(self, tile):
+        """Start marking the tile x tile blocks of the board that change"""
+        self.change_tile = tile
+        self.changed_tiles = None
+
+    def take_changes(self):
+        """Return the mask of blocks changed since the last call, or None if any cell may have"""
+        changed = self.changed_tiles
+        tile = self.change_tile
+        self.changed_tiles = np.zeros((-(-self.grid.rows // tile), -(-self.grid.cols // tile)), dtype=bool)
+        return changed
+
+    def note_changes(self, changed=None):
+        """Mark the blocks holding the changed (rows, cols) cells; None means any cell may have changed"""
+        if self.changed_tiles is None:
+            return
+        if changed is None:
+            self.changed_tiles = None
+            return
+        rows, cols = changed
+        self.changed_tiles[rows // self.change_tile, cols // self.change_tile] = True
+
+    def set_unbounded(self, unbounded):
+        """Switch between stepping the grid itself and an unbounded universe seen through it"""
+        self.universe = ChunkedUniverse.from_arrays(*self.grid.to_arrays()) if unbounded else None
+        self.reset_history()
+
+    def grid_edited(self):
+        """Note that the front grid was changed outside update(), e.g. painted or reweighted"""
+        if self.universe is not None:
+            self.universe.set_window(0, 0, *self.grid.to_arrays())
+        self.note_changes()
+        self.reset_history()
+
+    def reset_history(self):
+        """Forget the recorded generations and start a new history at the current board"""
+        # (generation, hash) pairs, oldest first, and the latest generation of each hash
+        self.history = deque(maxlen=self.history_size)
+        self.history_generations = {}
+        self.period = None
+        self.cycle_start = None
+        self.extinct = False
+        self.record_state()
+
+    def record_state(self):
+        """Add the board's hash to the history and check for extinction or a cycle"""
+        board = self.grid if self.universe is None else self.universe
+        state = board.state_hash()
+        counts = board.count_types()
+        self.extinct = not counts[ALIVE:].any()
+        # Cancer transitions are random, so a repeated board only proves a cycle without Cancer
+        if self.period is None and counts[CANCER] == 0:
+            seen = self.history_generations.get(state)
+            if seen is not None:
+                self.period = self.generation - seen
+                self.cycle_start = seen
+        if len(self.history) == self.history.maxlen:
+            generation, oldest = self.history[0]
+            if self.history_generations.get(oldest) == generation:
+                del self.history_generations[oldest]
+        self.history.append((self.generation, state))
+        self.history_generations[state] = self.generation
+        self.recorded = (self.grid.state_hash(), list(self.grid.mode_list))
+
+    @property
+    def steady_state(self):
+        """Whether the board has died out or entered a cycle"""
+        return self.extinct or self.period is not None
+
+    def check_edits(self):
+        """Pick up edits if the grid or its boundaries changed since the last generation"""
+        if (self.grid.state_hash(), list(self.grid.mode_list)) != self.recorded:
+            self.grid_edited()
+
+    def update(self):
+        self.check_edits()
+        if self.universe is not None:
+            self.update_unbounded()
+            return
+        if self.engine in self.array_engines:
+            self.update_vectorized()
+            return
+
+        back = self.back_buffer()
+        self.grid.stream = self.stream
+        if self.active_set:
+            self.update_active_cells(back)
+        else:
+            for row in self.grid.cells:
+                for cell in row:
+                    next_cell = cell.process()
+                    next_cell.grid = back
+                    back.set_cell(next_cell)
+        self.note_changes()
+        self.swap_buffers()
+
+    def advance(self, generations):
+        """Advance the grid by a number of generations in as few steps as possible"""
+        self.check_edits()
+        engine = self.advance_engine
+        if engine == "update":
+            for _ in range(generations):
+                self.update()
+            return
+
+        mode_list = self.grid.mode_list
+        alive = self.grid.to_arrays()[0] == ALIVE
+        if engine == "hashlife":
+            alive = self.hashlife_engine.advance(alive, mode_list, generations)
+        else:
+            alive = self.bitpacked_engine.run(alive, mode_list, generations)
+        back = self.back_buffer()
+        back.set_arrays(alive.astype(np.uint8) * ALIVE)
+        self.note_changes()
+        self.swap_buffers(generations)
+
+    @property
+    def advance_engine(self):
+        """How advance() steps the board: "hashlife", "bitpacked", or "update" one generation at a time"""
+        # Cancer and Cure cells are stochastic and the jump engines need a bounded board
+        if self.universe is not None or (self.grid.to_arrays()[0] >= CANCER).any():
+            return "update"
+        # HashLife cannot express "normal" or mixed edges; those step bit-packed instead
+        if self.hashlife_engine.supports(self.grid.mode_list):
+            return "hashlife"
+        return "bitpacked"
+
+    def update_unbounded(self):
+        """Advance the unbounded universe one generation and show its window in the back buffer"""
+        back = self.back_buffer()
+        self.universe.step(self.stream)
+        back.set_arrays(*self.universe.window(0, 0, back.rows, back.cols))
+        self.note_changes(back.rehash(self.grid))
+        self.swap_buffers()
+
+    def update_active_cells(self, back):
+        """Process only the cells that have a non-Dead cell in their neighborhood"""
+        grid = self.grid
+        occupied = np.zeros(grid.rows * grid.cols, dtype=bool)
+        occupied[[row * grid.cols + col for row, col in grid.occupied_cells()]] = True
+        active_cells = np.flatnonzero(occupied | grid.neighbor_table().probing(occupied))
+        active = set(zip(*(index.tolist() for index in np.divmod(active_cells, grid.cols))))
+
+        # The back buffer still holds the generation before last; clear what is left of it
+        for row, col in back.occupied_cells() - active:
+            back.set_cell(DeadCell(row, col, back))
+
+        # Row-major order keeps the random draws in the same order as a full pass
+        for row, col in sorted(active):
+            next_cell = grid.get_cell(row, col).process()
+            next_cell.grid = back
+            back.set_cell(next_cell)
+
+    def update_vectorized(self):
+        """Advance one generation with the NumPy or parallel engine"""
+        back = self.back_buffer()
+        engine = self.parallel_engine if self.engine == "parallel" else self.vectorized_engine
+        types, cancer_weighting, cure_weighting = self.grid.to_arrays()
+        if not (types >= CANCER).any():
+            # Pure Conway board: no weights or random draws are involved
+            alive = self.bitpacked_engine.step(types == ALIVE, self.grid.mode_list)
+            back.set_arrays(alive.astype(np.uint8) * ALIVE)
+        elif back.storage == "array" and self.active_set and engine is self.vectorized_engine:
+            self.vectorized_engine.step_active(types, cancer_weighting, cure_weighting, self.grid.mode_list,
+                                               back.to_arrays())
+        elif back.storage == "array":
+            engine.step(types, cancer_weighting, cure_weighting, self.grid.mode_list, out=back.to_arrays())
+        else:
+            back.set_arrays(*engine.step(types, cancer_weighting, cure_weighting, self.grid.mode_list))
+        # The engines write the back arrays directly; hash only the cells that changed
+        self.note_changes(back.rehash(self.grid))
+        self.swap_buffers()
+
+def run_ensemble(grid, seeds, generations, counter_rng=False):
+    """Run one replica of grid per seed in a single batched array
+
+    All replicas advance together, one NumPy step per generation, each with
+    its own random stream. Replica k follows the same history as a
+    GameRunner run of grid with seed=seeds[k]. Returns a
+    (len(seeds), generations, 4) array of Dead/Alive/Cancer/Cure counts
+    after each generation.
+    """
+    replicas = len(seeds)
+    types, cancer_weighting, cure_weighting = (np.repeat(array[np.newaxis], replicas, axis=0)
+                                               for array in grid.to_arrays())
+    engine = VectorizedEngine()
+    engine.stream = EnsembleStream.from_seeds(seeds, counter_rng)
+    _, trajectories = engine.run_ensemble(types, cancer_weighting, cure_weighting, grid.mode_list, generations)
+    return trajectories
+
+# Weight range accepted from grid files
+MIN_WEIGHT = 0.0001
+MAX_WEIGHT = 1.0
+
+# Cell names used in grid files -> type codes
+CELL_NAME_CODES = {name: code for code, name in CELL_NAMES.items()}
+
+def read_grid_file(filename, grid_size=None):
+    """Read a grid CSV written by write_grid_file (or the GUI's Save Grid)
+
+    Returns (types, settings): a square uint8 array of cell type codes and
+    a dict with whichever of grid_size, speed (older files),
+    generations_per_second, fps, generations_per_frame, boundary_modes,
+    cancer_weight and cure_weight the file sets. grid_size is used when the file does not
+    set one; without either, the number of grid rows is used.
+    """
+    with open(filename, 'r') as csvfile:
+        rows = list(csv.reader(csvfile))
+
+    # Settings run from the "Settings" row to the first empty row
+    settings = {}
+    settings_start = next((i + 1 for i, row in enumerate(rows) if row and row[0] == "Settings"), 0)
+    for row in rows[settings_start:]:
+        if not row:
+            break
+        if row[0] == "grid_size":
+            settings["grid_size"] = int(row[1])
+        elif row[0] in ("speed", "generations_per_second", "fps", "generations_per_frame"):
+            settings[row[0]] = int(row[1])
+        elif row[0] == "boundary_modes":
+            settings["boundary_modes"] = row[1:5]
+        elif row[0] in ("cancer_weight", "cure_weight"):
+            try:
+                weight = max(MIN_WEIGHT, min(MAX_WEIGHT, float(row[1])))  # Clamp to valid range
+            except (ValueError, IndexError):
+                weight = BASE_CANCER_WEIGHT if row[0] == "cancer_weight" else BASE_CURE_WEIGHT  # Default
+            settings[row[0]] = weight
+
+    # Grid rows hold one cell name per column; unknown names load as Dead
+    grid_start = next((i + 1 for i, row in enumerate(rows) if row and row[0] == "Grid"), 0)
+    grid_rows = rows[grid_start:]
+    size = settings.get("grid_size", grid_size)
+    if size is None:
+        size = next((i for i, row in enumerate(grid_rows) if not row), len(grid_rows))
+    types = np.zeros((size, size), dtype=np.uint8)
+    for row_idx, row_data in enumerate(grid_rows[:size]):
+        for col_idx, name in enumerate(row_data[:size]):
+            types[row_idx, col_idx] = CELL_NAME_CODES.get(name, DEAD)
+    return types, settings
+
+def write_grid_file(filename, types, settings):
+    """Write a grid CSV: a Settings block, an empty row, then one row of cell names per grid row
+
+    settings maps setting names to a value or a list of values, e.g.
+    {"grid_size": 30, "boundary_modes": ["normal", ...], "cancer_weight": 0.01}.
+    """
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Write settings
+        writer.writerow(["Settings"])
+        for name, value in settings.items():
+            writer.writerow([name] + list(value) if isinstance(value, (list, tuple)) else [name, value])
+        writer.writerow([])  # Empty row separator
+
+        # Write grid data
+        writer.writerow(["Grid"])
+        for row in types:
+            writer.writerow([CELL_NAMES[code] for code in row])
@@ -0,0 +1,196 @@
+"""Parameter sweeps over cancer/cure weights, boundary modes and seeds.
+
+Every combination of the given values is one run of a grid file. Runs are
+fanned out over a process pool and each finished run's summary is appended
+to a results CSV as soon as it arrives. The results file doubles as the
+checkpoint: rerunning the same sweep skips every run already recorded, so a
+killed sweep resumes where it stopped.
+
+Example:
+    python sweep.py start.csv --cancer-weights 0.005 0.01 0.02 --cure-weights 0.05 0.1 \\
+        --boundaries normal,normal,normal,normal periodic,periodic,periodic,periodic \\
+        --seeds 0-31 -n 500 --workers 8 --results sweep.csv
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from batch import BOUNDARY_MODES, load_grid
+from simulation import GameRunner, DEAD, ALIVE, CANCER, CURE, read_grid_file
+
+RESULT_FIELDS = [
+    "run_id", "cancer_weight", "cure_weight", "boundary_modes", "seed", "generations",
+    "extinction_generation", "cancer_extinction_generation", "peak_cancer", "peak_cancer_generation",
+    "final_dead", "final_alive", "final_cancer", "final_cure",
+]
+
+# Engines that can run inside a pool worker (the parallel engine needs its own pool)
+SWEEP_ENGINES = ("object", "numpy")
+
+
+def grid_digest(grid_file):
+    """Return a short digest of a grid file's contents"""
+    with open(grid_file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def sweep_runs(cancer_weights, cure_weights, boundary_modes, seeds, generations, grid_file_digest="",
+               engine="numpy", counter_rng=False):
+    """Return one run dict per combination of weights, boundary modes and seed
+
+    Every setting that affects a run's result is part of its run_id: the
+    grid file's contents, the run length, the engine and the random stream.
+    Resuming with any of them changed reruns everything instead of keeping
+    results computed under the old settings.
+    """
+    runs = []
+    for cancer_weight, cure_weight, modes, seed in itertools.product(cancer_weights, cure_weights,
+                                                                      boundary_modes, seeds):
+        modes = list(modes)
+        run_id = (f"cancer={cancer_weight}|cure={cure_weight}|boundary={'-'.join(modes)}|seed={seed}"
+                  f"|generations={generations}|grid={grid_file_digest}|engine={engine}"
+                  f"|counter_rng={int(counter_rng)}")
+        runs.append({"run_id": run_id, "cancer_weight": cancer_weight, "cure_weight": cure_weight,
+                     "boundary_modes": modes, "seed": seed})
+    return runs
+
+
+def run_summary(grid_file, run, generations, engine="numpy", counter_rng=False):
+    """Run one sweep point and return its row of summary metrics
+
+    The run stops early once every cell is Dead, since nothing can change
+    after that.
+    """
+    grid, _ = load_grid(grid_file, engine, run["boundary_modes"], run["cancer_weight"], run["cure_weight"])
+    runner = GameRunner(grid, engine, seed=run["seed"], counter_rng=counter_rng)
+
+    counts = runner.grid.count_types()
+    extinction = None
+    cancer_extinction = 0 if counts[CANCER] == 0 else None
+    peak_cancer, peak_generation = int(counts[CANCER]), 0
+    for generation in range(1, generations + 1):
+        runner.update()
+        counts = runner.grid.count_types()
+        if counts[CANCER] > peak_cancer:
+            peak_cancer, peak_generation = int(counts[CANCER]), generation
+        if cancer_extinction is None and counts[CANCER] == 0:
+            cancer_extinction = generation
+        if counts[DEAD] == counts.sum():
+            extinction = generation
+            break
+
+    return {
+        "run_id": run["run_id"],
+        "cancer_weight": run["cancer_weight"],
+        "cure_weight": run["cure_weight"],
+        "boundary_modes": " ".join(run["boundary_modes"]),
+        "seed": run["seed"],
+        "generations": generations,
+        "extinction_generation": "" if extinction is None else extinction,
+        "cancer_extinction_generation": "" if cancer_extinction is None else cancer_extinction,
+        "peak_cancer": peak_cancer,
+        "peak_cancer_generation": peak_generation,
+        "final_dead": int(counts[DEAD]),
+        "final_alive": int(counts[ALIVE]),
+        "final_cancer": int(counts[CANCER]),
+        "final_cure": int(counts[CURE]),
+    }
+
+
+def completed_run_ids(results_file):
+    """Return the run ids already recorded in a results file
+
+    A row cut short by a killed sweep (no trailing newline) is removed so
+    that run is simply done again.
+    """
+    if not os.path.exists(results_file):
+        return set()
+    with open(results_file, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+    with open(results_file, 'r', newline='') as f:
+        return {row["run_id"] for row in csv.DictReader(f)}
+
+
+def run_sweep(grid_file, runs, results_file, generations, engine="numpy", workers=None, counter_rng=False):
+    """Run every sweep point not yet in results_file, appending rows as runs finish
+
+    Returns the number of runs performed by this call.
+    """
+    done = completed_run_ids(results_file)
+    pending = [run for run in runs if run["run_id"] not in done]
+    if not pending:
+        return 0
+
+    new_file = not os.path.exists(results_file) or os.path.getsize(results_file) == 0
+    with open(results_file, 'a', newline='') as out, ProcessPoolExecutor(workers) as pool:
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        if new_file:
+            writer.writeheader()
+        futures = [pool.submit(run_summary, grid_file, run, generations, engine, counter_rng) for run in pending]
+        for future in as_completed(futures):
+            writer.writerow(future.result())
+            # Each finished run is on disk before the next one is reported
+            out.flush()
+    return len(pending)
+
+
+def parse_seeds(values):
+    """Expand seed arguments such as ["1", "5-8"] into [1, 5, 6, 7, 8]"""
+    seeds = []
+    for value in values:
+        start, _, stop = value.partition("-")
+        seeds.extend(range(int(start), int(stop) + 1) if stop else [int(start)])
+    return seeds
+
+
+def parse_boundary(value):
+    """Parse a comma-separated left,right,top,bottom boundary spec"""
+    modes = value.split(",")
+    if len(modes) != 4 or any(mode not in BOUNDARY_MODES for mode in modes):
+        raise argparse.ArgumentTypeError(f"expected LEFT,RIGHT,TOP,BOTTOM from {BOUNDARY_MODES}, got {value!r}")
+    return modes
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep cancer/cure weights, boundaries and seeds over a grid file.")
+    parser.add_argument("grid_file", help="grid CSV every run starts from")
+    parser.add_argument("--cancer-weights", type=float, nargs="+", required=True, help="cancer weights to try")
+    parser.add_argument("--cure-weights", type=float, nargs="+", required=True, help="cure weights to try")
+    parser.add_argument("--boundaries", type=parse_boundary, nargs="+",
+                        help="boundary specs such as periodic,periodic,mirror,mirror; defaults to the grid file's")
+    parser.add_argument("--seeds", nargs="+", default=["0"], help="seeds or inclusive ranges such as 0-31")
+    parser.add_argument("-n", "--generations", type=int, default=100, help="generations per run (default 100)")
+    parser.add_argument("--engine", choices=SWEEP_ENGINES, default="numpy", help="stepping engine (default numpy)")
+    parser.add_argument("--counter-rng", action="store_true",
+                        help="derive draws from (seed, generation, row, col) with Philox")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--results", default="sweep_results.csv",
+                        help="results CSV, also used to resume (default sweep_results.csv)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    boundaries = args.boundaries
+    if boundaries is None:
+        # Like batch.py, use the grid file's own edge modes unless told otherwise
+        _, settings = read_grid_file(args.grid_file)
+        boundaries = [settings.get("boundary_modes", ["normal"] * 4)]
+    runs = sweep_runs(args.cancer_weights, args.cure_weights, boundaries, parse_seeds(args.seeds), args.generations,
+                      grid_digest(args.grid_file), args.engine, args.counter_rng)
+    performed = run_sweep(args.grid_file, runs, args.results, args.generations, args.engine,
+                          args.workers, args.counter_rng)
+    print(f"{performed} of {len(runs)} runs performed, results in {args.results}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
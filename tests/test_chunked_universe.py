@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from chunked_universe import ChunkedUniverse
+from simulation import GameRunner, Grid
+from vectorized_engine import ALIVE, UniformStream
+
+# A glider heading up and to the left
+GLIDER_UP_LEFT = np.array([[1, 1, 1],
+                           [1, 0, 0],
+                           [0, 1, 0]], dtype=np.uint8) * ALIVE
+
+
+@pytest.mark.parametrize("origin", [(0, 0), (5, 5), (-40, 70)])
+def test_moving_glider_never_repeats_a_hash(origin):
+    types = GLIDER_UP_LEFT
+    zeros = np.zeros(types.shape, dtype=np.float32)
+    universe = ChunkedUniverse.from_arrays(types, zeros, zeros, origin=origin, chunk_size=16)
+    stream = UniformStream(0)
+    seen = {universe.state_hash()}
+    # 200 generations carry the glider 50 cells across negative rows and columns and several chunks
+    for _ in range(200):
+        universe.step(stream)
+        assert universe.state_hash() not in seen
+        seen.add(universe.state_hash())
+
+
+def test_unbounded_glider_is_not_reported_as_steady():
+    grid = Grid(10, 10, storage="array")
+    types = np.zeros((10, 10), dtype=np.uint8)
+    types[4:7, 4:7] = GLIDER_UP_LEFT
+    grid.set_arrays(types)
+    runner = GameRunner(grid, "numpy", unbounded=True)
+    for _ in range(100):
+        runner.update()
+        assert not runner.steady_state
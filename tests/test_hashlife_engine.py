@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from bitpacked_engine import BitpackedEngine
+from hashlife_engine import HashLifeEngine
+
+
+@pytest.mark.parametrize("modes", [["periodic"] * 4, ["mirror"] * 4, ["periodic", "periodic", "mirror", "mirror"]])
+def test_capped_engine_matches_bitpacked_over_a_long_jump(modes):
+    alive = np.random.default_rng(3).random((30, 30)) < 0.35
+    # A cap far below the working set makes the table collect between strides
+    engine = HashLifeEngine(max_nodes=1000)
+    collections = []
+    collect = engine.collect
+    engine.collect = lambda: collections.append(len(engine.nodes)) or collect()
+    jumped = engine.advance(alive, modes, 1023)
+    assert collections
+    np.testing.assert_array_equal(jumped, BitpackedEngine().run(alive, modes, 1023))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from chunked_universe import ChunkedUniverse
+from philox import uniform_pairs
+from vectorized_engine import CANCER, CounterStream
+
+
+@pytest.mark.parametrize("generation", [0, 7, 2 ** 40])
+def test_negative_coordinates_draw_in_unit_interval(generation):
+    rows, cols = np.meshgrid(np.arange(-300, 300, 7), np.arange(-300, 300, 11), indexing="ij")
+    for draws in uniform_pairs(12345, generation, rows.ravel(), cols.ravel()):
+        assert ((draws >= 0.0) & (draws < 1.0)).all()
+
+
+def test_negative_coordinates_wrap_to_32_bits():
+    rows = np.array([-1, -2, -1000])
+    cols = np.array([-5, 3, -1])
+    wrapped = uniform_pairs(9, 4, rows + 2 ** 32, np.where(cols < 0, cols + 2 ** 32, cols))
+    for draws, expected in zip(uniform_pairs(9, 4, rows, cols), wrapped):
+        np.testing.assert_array_equal(draws, expected)
+
+
+def test_counter_stream_steps_chunks_at_negative_origin():
+    rng = np.random.default_rng(3)
+    types = rng.choice([0, 1, CANCER], (20, 20)).astype(np.uint8)
+    cancer_weighting = np.where(types == CANCER, 0.01, 0.0).astype(np.float32)
+    zeros = np.zeros(types.shape, dtype=np.float32)
+    universe = ChunkedUniverse.from_arrays(types, cancer_weighting, zeros, origin=(-50, -70), chunk_size=8)
+    stream = CounterStream(1)
+    for _ in range(10):
+        universe.step(stream)
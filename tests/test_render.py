@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from render import DensityPyramid
+from simulation import GameRunner, Grid
+from vectorized_engine import CANCER, CURE
+
+
+@pytest.mark.parametrize("active_set", [False, True])
+def test_pyramid_recounting_changed_tiles_matches_a_full_count(active_set):
+    rng = np.random.default_rng(4)
+    # Life only in one corner, so most tiles never change
+    types = np.zeros((150, 200), dtype=np.uint8)
+    types[:40, :50] = rng.choice([0, 0, 0, 0, 1, 1, CANCER, CURE], (40, 50))
+    cancer_weighting = np.where(types == CANCER, 0.01, 0.0)
+    cure_weighting = np.where(types == CURE, 0.1, 0.0)
+    runner = GameRunner(Grid.from_arrays(types, cancer_weighting, cure_weighting, storage="array"), "numpy",
+                        active_set=active_set, seed=1)
+    pyramid = DensityPyramid(tile=16)
+    runner.track_changes(pyramid.tile)
+    recounted = []
+    for generation in range(12):
+        runner.update()
+        # Only every third board is drawn; the changes of the others accumulate
+        if generation % 3 == 2:
+            pyramid.mark_changed(runner.take_changes())
+            board = runner.grid.to_arrays()[0]
+            recounted.append(pyramid.update(board))
+            full = DensityPyramid(tile=16)
+            full.update(board)
+            for factor in pyramid.factors():
+                for row, col in [(0, 0), (16, 32), (factor * 5, factor * 3)]:
+                    np.testing.assert_array_equal(pyramid.counts(factor, row, col, 70, 90),
+                                                  full.counts(factor, row, col, 70, 90))
+    # The first board is counted in full, the later ones only where they changed
+    assert recounted[0] == 130
+    assert all(count < 130 for count in recounted[1:])
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from simulation import GameRunner, Grid
+from vectorized_engine import CANCER, CURE
+
+# (engine, grid storage, active set) combinations that must agree draw for draw
+ENGINES = [("object", "objects", False), ("object", "objects", True), ("numpy", "array", False),
+           ("numpy", "array", True), ("parallel", "array", False)]
+
+
+def random_board(seed, size=24):
+    rng = np.random.default_rng(seed)
+    types = rng.choice([0, 0, 0, 1, CANCER, CANCER, CURE], (size, size)).astype(np.uint8)
+    cancer_weighting = np.where(types == CANCER, 0.01 * rng.choice([0.5, 1, 2], types.shape), 0.0)
+    cure_weighting = np.where(types == CURE, 0.1 * rng.choice([0.5, 1, 2], types.shape), 0.0)
+    return types, cancer_weighting, cure_weighting
+
+
+def history(board, engine, storage, active_set, seed, modes, generations=15):
+    """Return the Zobrist hash of every generation of a seeded run"""
+    runner = GameRunner(Grid.from_arrays(*board, mode_list=list(modes), storage=storage), engine,
+                        active_set=active_set, seed=seed)
+    runner.vectorized_engine.tile_size = 8
+    runner.parallel_engine.workers = 3
+    try:
+        hashes = []
+        for _ in range(generations):
+            runner.update()
+            hashes.append(runner.grid.state_hash())
+        return hashes
+    finally:
+        runner.parallel_engine.close()
+
+
+@pytest.mark.parametrize("modes", [["normal"] * 4, ["periodic"] * 4, ["mirror", "periodic", "normal", "mirror"]])
+def test_same_seed_gives_the_same_history_on_every_engine(modes):
+    board = random_board(1)
+    histories = [history(board, *engine, seed=7, modes=modes) for engine in ENGINES]
+    for engine, hashes in zip(ENGINES[1:], histories[1:]):
+        assert hashes == histories[0], engine
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_different_seeds_diverge(engine):
+    board = random_board(2)
+    modes = ["periodic"] * 4
+    assert history(board, *engine, seed=7, modes=modes) != history(board, *engine, seed=8, modes=modes)
+
+
+def test_set_seed_matches_seeding_the_runner():
+    board = random_board(3)
+    runner = GameRunner(Grid.from_arrays(*board, storage="array"), "numpy")
+    runner.set_seed(7)
+    hashes = []
+    for _ in range(15):
+        runner.update()
+        hashes.append(runner.grid.state_hash())
+    assert hashes == history(board, "numpy", "array", False, seed=7, modes=["normal"] * 4)
@@ -0,0 +1,106 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from bitpacked_engine import BitpackedEngine
+from simulation import GameRunner, Grid
+from vectorized_engine import ALIVE, CANCER, CURE, CounterStream, VectorizedEngine
+
+# Every left, right, up, down combination of boundary modes
+MODE_LISTS = [list(modes) for modes in itertools.product(["normal", "periodic", "mirror"], repeat=4)]
+
+
+def random_board(seed, codes, weight_scale=1.0, size=12):
+    rng = np.random.default_rng(seed)
+    types = rng.choice(codes, (size, size)).astype(np.uint8)
+    cancer_weighting = np.where(types == CANCER, 0.01 * weight_scale * rng.choice([0.5, 1, 2, 4], types.shape), 0.0)
+    cure_weighting = np.where(types == CURE, 0.1 * weight_scale * rng.choice([0.5, 1, 2], types.shape), 0.0)
+    return types, cancer_weighting, cure_weighting
+
+
+def object_generations(board, modes, seed, generations):
+    """Return (types, cancer, cure) after each generation of per-cell process() stepping"""
+    runner = GameRunner(Grid.from_arrays(*board, mode_list=list(modes)), "object", seed=seed)
+    steps = []
+    for _ in range(generations):
+        runner.update()
+        steps.append(runner.grid.to_arrays())
+    return steps
+
+
+def vectorized_generations(board, modes, seed, generations):
+    """Return (types, cancer, cure) after each generation of VectorizedEngine.step"""
+    engine = VectorizedEngine(seed)
+    steps = []
+    for _ in range(generations):
+        board = engine.step(*board, modes)
+        engine.stream.generation += 1
+        steps.append(board)
+    return steps
+
+
+def assert_same_generations(expected, actual):
+    # Array storage keeps float32 weights, so weights only agree to float32 precision
+    for generation, (want, got) in enumerate(zip(expected, actual)):
+        label = f"after generation {generation + 1}"
+        np.testing.assert_array_equal(got[0], want[0], err_msg=f"types {label}")
+        np.testing.assert_allclose(got[1], want[1], rtol=1e-6, err_msg=f"cancer weights {label}")
+        np.testing.assert_allclose(got[2], want[2], rtol=1e-6, err_msg=f"cure weights {label}")
+
+
+@pytest.mark.parametrize("modes", MODE_LISTS)
+def test_conway_board_matches_object_stepping(modes):
+    board = random_board(1, [0, 0, ALIVE])
+    assert_same_generations(object_generations(board, modes, 0, 12), vectorized_generations(board, modes, 0, 12))
+
+
+@pytest.mark.parametrize("weight_scale", [1.0, 1e-6])
+@pytest.mark.parametrize("modes", MODE_LISTS)
+def test_stochastic_board_matches_object_stepping(modes, weight_scale):
+    board = random_board(2, [0, 0, 0, ALIVE, CANCER, CANCER, CURE], weight_scale)
+    assert_same_generations(object_generations(board, modes, 5, 10), vectorized_generations(board, modes, 5, 10))
+
+
+@pytest.mark.parametrize("modes", MODE_LISTS)
+def test_bitpacked_engine_matches_object_stepping(modes):
+    board = random_board(3, [0, 0, ALIVE], size=13)
+    alive = board[0] == ALIVE
+    engine = BitpackedEngine()
+    for generation, (types, _, _) in enumerate(object_generations(board, modes, 0, 12)):
+        alive = engine.step(alive, modes)
+        np.testing.assert_array_equal(alive, types == ALIVE, err_msg=f"generation {generation + 1}")
+
+
+def test_counter_stream_draws_do_not_depend_on_order():
+    stream = CounterStream(11)
+    stream.generation = 3
+    rows, cols = np.divmod(np.arange(400), 20)
+    pairs = stream.draw(rows, cols)
+    order = np.random.default_rng(0).permutation(400)
+    np.testing.assert_array_equal(stream.draw(rows[order], cols[order]), pairs[order])
+    halves = np.concatenate([stream.draw(rows[200:], cols[200:]), stream.draw(rows[:200], cols[:200])])
+    np.testing.assert_array_equal(halves, np.concatenate([pairs[200:], pairs[:200]]))
+
+
+@pytest.mark.parametrize("modes", [["normal"] * 4, ["periodic"] * 4, ["mirror", "periodic", "normal", "mirror"]])
+def test_counter_rng_runs_match_across_partitions(modes):
+    board = random_board(4, [0, 0, 0, ALIVE, CANCER, CANCER, CURE], size=30)
+    histories = []
+    # Whole board, 4x4 active tiles, row bands in three processes, and cell by cell
+    for engine, storage, active_set in [("numpy", "array", False), ("numpy", "array", True),
+                                        ("parallel", "array", False), ("object", "objects", True)]:
+        runner = GameRunner(Grid.from_arrays(*board, mode_list=list(modes), storage=storage), engine,
+                            active_set=active_set, seed=9, counter_rng=True)
+        runner.vectorized_engine.tile_size = 4
+        runner.parallel_engine.workers = 3
+        try:
+            steps = []
+            for _ in range(10):
+                runner.update()
+                steps.append(runner.grid.with_storage("objects").to_arrays())
+            histories.append(steps)
+        finally:
+            runner.parallel_engine.close()
+    for steps in histories[1:]:
+        assert_same_generations(histories[0], steps)
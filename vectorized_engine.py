@@ -0,0 +1,700 @@
+"""NumPy vectorized stepping engine for the Conway / cancer / cure rule set.
+
+The board is held as three arrays of the same shape:
+
+- ``types``: uint8 cell type codes (DEAD, ALIVE, CANCER, CURE)
+- ``cancer_weighting``: weight of each CancerCell (ignored elsewhere)
+- ``cure_weighting``: weight of each CureCell (ignored elsewhere)
+
+Each generation is computed with whole-array operations that reproduce the
+DeadCell/AliveCell/CancerCell/CureCell ``process()`` rules in conway_gui.py.
+"""
+import functools
+
+import numpy as np
+
+from philox import keyed_uniform_pairs, seed_key, uniform_pairs
+
+# Cell type codes
+DEAD = 0
+ALIVE = 1
+CANCER = 2
+CURE = 3
+
+# Baseline weights used by the cell rules
+BASE_CANCER_WEIGHT = 0.01
+BASE_CURE_WEIGHT = 0.1
+
+# Neighbor offsets in the same order Grid.count_neighbors probes them
+NEIGHBOR_OFFSETS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+
+# Channels of the fused neighbor histogram after the four per-type counts
+HIST_CANCER_TOTAL = 4
+HIST_CANCER_COUNT = 5
+HIST_CURE_TOTAL = 6
+HIST_CURE_COUNT = 7
+HISTOGRAM_CHANNELS = 8
+# Histogram channels built from small integer counts and from float weight sums
+COUNT_CHANNELS = (DEAD, ALIVE, CANCER, CURE, HIST_CANCER_COUNT, HIST_CURE_COUNT)
+WEIGHT_CHANNELS = (HIST_CANCER_TOTAL, HIST_CURE_TOTAL)
+
+
+def boundary_index(n, low_mode, high_mode):
+    """Return the source index of each of the n+2 padded positions along one axis.
+
+    Position 0 is the ghost before the first cell and position n+1 the ghost
+    after the last one. "periodic" wraps to the opposite edge, "mirror"
+    repeats the edge cell and anything else ("normal") gives -1 (outside),
+    matching Grid.check_left/right/up/down.
+    """
+    index = np.arange(-1, n + 1)
+    index[0] = {"periodic": n - 1, "mirror": 0}.get(low_mode, -1)
+    index[-1] = {"periodic": 0, "mirror": n - 1}.get(high_mode, -1)
+    return index
+
+
+@functools.lru_cache(maxsize=32)
+def boundary_indices(rows, cols, modes):
+    """Return the cached (row_index, col_index) boundary_index arrays for a board"""
+    row_index = boundary_index(rows, modes[2], modes[3])
+    col_index = boundary_index(cols, modes[0], modes[1])
+    row_index.flags.writeable = False
+    col_index.flags.writeable = False
+    return row_index, col_index
+
+
+@functools.lru_cache(maxsize=32)
+def ghost_layout(rows, cols, modes):
+    """Precompute how to fill the ghost ring of a (rows+2, cols+2) padded board.
+
+    modes is a [left, right, up, down] tuple like Grid.mode_list. Returns
+    (ring_dst, ring_src, ring_valid): flat indices of the ring positions,
+    flat indices of the cells they copy, and whether each ghost lies inside
+    the boundary at all (ghosts outside a "normal" edge are zero). Built once
+    per (rows, cols, modes) combination.
+    """
+    row_index, col_index = boundary_indices(rows, cols, modes)
+    width = cols + 2
+
+    ring = np.ones((rows + 2, width), dtype=bool)
+    ring[1:-1, 1:-1] = False
+    ring_rows, ring_cols = np.nonzero(ring)
+    # Corners combine the row and column modes the same way count_neighbors
+    # combines row_processor and col_processor
+    src_rows = row_index[ring_rows]
+    src_cols = col_index[ring_cols]
+    ring_valid = (src_rows >= 0) & (src_cols >= 0)
+    ring_src = np.where(ring_valid, (src_rows + 1) * width + src_cols + 1, 0)
+    ring_dst = ring_rows * width + ring_cols
+    for array in (ring_dst, ring_src, ring_valid):
+        array.flags.writeable = False
+    return ring_dst, ring_src, ring_valid
+
+
+class NeighborTable:
+    """Boundary-resolved neighbors of every cell of a board, as compact arrays
+
+    index holds the flat (row * cols + col) index of each of a cell's eight
+    probes, one row per cell in row-major order; valid marks the probes
+    that land on the board at all, and inside those that needed no
+    wrapping or mirroring. Mirrored probes can appear more than once.
+    """
+
+    def __init__(self, rows, cols, modes):
+        self.rows = rows
+        self.cols = cols
+        row_index, col_index = boundary_indices(rows, cols, modes)
+        offsets = np.array(NEIGHBOR_OFFSETS)
+        cell_rows = np.repeat(np.arange(rows), cols)[:, np.newaxis] + offsets[:, 0]
+        cell_cols = np.tile(np.arange(cols), rows)[:, np.newaxis] + offsets[:, 1]
+        probe_rows = row_index[cell_rows + 1]
+        probe_cols = col_index[cell_cols + 1]
+        self.valid = (probe_rows >= 0) & (probe_cols >= 0)
+        self.inside = (self.valid & (cell_rows >= 0) & (cell_rows < rows)
+                       & (cell_cols >= 0) & (cell_cols < cols))
+        self.index = np.where(self.valid, probe_rows * cols + probe_cols, 0).astype(np.int32)
+        # (row << 17 | col << 1 | inside), or -1 for probes off the board, so probes() converts
+        # one row per call and decodes it with shifts
+        self.packed = np.where(self.valid, (probe_rows << 17) | (probe_cols << 1) | self.inside, -1).astype(np.int32)
+        for array in (self.index, self.valid, self.inside, self.packed):
+            array.flags.writeable = False
+
+    def probes(self, row, col):
+        """Return a (row, col, inside) tuple per in-bounds neighbor of a cell (the cell itself excluded)"""
+        return [(packed >> 17, (packed >> 1) & 0xFFFF, packed & 1 == 1)
+                for packed in self.packed[row * self.cols + col].tolist() if packed >= 0]
+
+    def probing(self, cells):
+        """Return a flat bool mask of the cells that probe at least one cell in a flat bool mask"""
+        return (self.valid & cells[self.index]).any(axis=1)
+
+
+@functools.lru_cache(maxsize=2)
+def neighbor_table(rows, cols, modes):
+    """Return the NeighborTable of a board, built once per (rows, cols, modes) combination
+
+    This is the boundary resolution count_neighbors used to redo for every
+    probe. Only the two most recent tables are kept.
+    """
+    return NeighborTable(rows, cols, modes)
+
+
+def fill_ghost_ring(padded, mode_list):
+    """Fill the ghost ring on the last two axes of a C-contiguous padded array in place"""
+    rows, cols = padded.shape[-2] - 2, padded.shape[-1] - 2
+    ring_dst, ring_src, ring_valid = ghost_layout(rows, cols, tuple(mode_list))
+    flat = padded.reshape(padded.shape[:-2] + (-1,))
+    flat[..., ring_dst] = np.where(ring_valid, flat[..., ring_src], 0)
+
+
+def neighbor_histogram(types, cancer_weighting, cure_weighting, mode_list, window=None):
+    """Gather every neighbor count and weight sum of the board in one fused sweep.
+
+    Returns a float64 array of shape (HISTOGRAM_CHANNELS, rows, cols).
+    Channels DEAD/ALIVE/CANCER/CURE count the neighbors of each type and honor
+    mode_list. The HIST_* channels hold the in-bounds cancer/cure weight
+    totals and counts behind the weight averages. Those ghosts stay zero
+    whatever the boundary modes, like the in-bounds checks in process().
+
+    window=(row_start, row_stop, col_start, col_stop) restricts the histogram
+    to that block of cells; its halo is gathered from the rest of the board.
+
+    Without a window the board may carry leading ensemble axes, e.g.
+    (replicas, rows, cols); the histogram is then (HISTOGRAM_CHANNELS,
+    replicas, rows, cols).
+    """
+    rows, cols = types.shape[-2:]
+    if window is None:
+        lead = types.shape[:-2]
+        counts = np.zeros((len(COUNT_CHANNELS),) + lead + (rows + 2, cols + 2), dtype=np.uint8)
+        weights = np.zeros((len(WEIGHT_CHANNELS),) + lead + (rows + 2, cols + 2))
+        interior = counts[..., 1:-1, 1:-1]
+        for code in (DEAD, ALIVE, CANCER, CURE):
+            interior[code] = types == code
+        interior[4] = interior[CANCER]
+        interior[5] = interior[CURE]
+        weights[0, ..., 1:-1, 1:-1] = np.where(types == CANCER, cancer_weighting, 0.0)
+        weights[1, ..., 1:-1, 1:-1] = np.where(types == CURE, cure_weighting, 0.0)
+        fill_ghost_ring(counts[:4], mode_list)
+        return assemble_histogram(counts, weights)
+
+    row_start, row_stop, col_start, col_stop = window
+    row_index, col_index = boundary_indices(rows, cols, tuple(mode_list))
+    # Padded position p along an axis holds board position p - 1
+    row_index = row_index[row_start:row_stop + 2]
+    col_index = col_index[col_start:col_stop + 2]
+    block = np.ix_(row_index, col_index)
+    valid = np.outer(row_index >= 0, col_index >= 0)
+    raw_rows = np.arange(row_start - 1, row_stop + 1)
+    raw_cols = np.arange(col_start - 1, col_stop + 1)
+    inside = np.outer((raw_rows >= 0) & (raw_rows < rows), (raw_cols >= 0) & (raw_cols < cols))
+
+    block_types = np.where(valid, types[block], 255)
+    counts = np.empty((len(COUNT_CHANNELS),) + block_types.shape, dtype=np.uint8)
+    for code in (DEAD, ALIVE, CANCER, CURE):
+        counts[code] = block_types == code
+    counts[4] = counts[CANCER] & inside
+    counts[5] = counts[CURE] & inside
+    weights = np.empty((len(WEIGHT_CHANNELS),) + block_types.shape)
+    weights[0] = np.where(counts[4] > 0, cancer_weighting[block], 0.0)
+    weights[1] = np.where(counts[5] > 0, cure_weighting[block], 0.0)
+    return assemble_histogram(counts, weights)
+
+
+def assemble_histogram(counts, weights):
+    """Combine padded count and weight channels into the float64 neighbor histogram"""
+    count_sums = count_neighbors(counts)
+    histogram = np.empty((HISTOGRAM_CHANNELS,) + count_sums.shape[1:])
+    histogram[list(COUNT_CHANNELS)] = count_sums
+    histogram[list(WEIGHT_CHANNELS)] = sum_neighbors(weights)
+    return histogram
+
+
+def count_neighbors(padded):
+    """Count the 8 neighbors of a padded integer (channels, rows+2, cols+2) stack exactly
+
+    Uses a separable 3x3 box sum minus the centre, which is exact for
+    integers and much cheaper than adding 8 shifted slices.
+    """
+    horizontal = padded[..., :-2] + padded[..., 1:-1] + padded[..., 2:]
+    box = horizontal[..., :-2, :] + horizontal[..., 1:-1, :] + horizontal[..., 2:, :]
+    return box - padded[..., 1:-1, 1:-1]
+
+
+def sum_neighbors(padded):
+    """Sum the 8 shifted neighbor slices of a padded (channels, rows+2, cols+2) stack"""
+    rows, cols = padded.shape[-2] - 2, padded.shape[-1] - 2
+    histogram = np.zeros(padded.shape[:-2] + (rows, cols))
+    for di, dj in NEIGHBOR_OFFSETS:
+        histogram += padded[..., 1 + di:1 + di + rows, 1 + dj:1 + dj + cols]
+    return histogram
+
+
+def tile_occupancy(types, tile):
+    """Return a (tile rows, tile cols) mask of the tiles holding any non-Dead cell"""
+    rows, cols = types.shape
+    # DEAD is 0, so the largest code in a tile is non-zero iff the tile is occupied
+    per_row_tile = np.maximum.reduceat(types, np.arange(0, rows, tile), axis=0)
+    return np.maximum.reduceat(per_row_tile, np.arange(0, cols, tile), axis=1) > 0
+
+
+def active_tiles(types, tile, mode_list):
+    """Return the mask of tiles whose cells can change in the next generation.
+
+    A Dead cell with no non-Dead neighbor stays Dead, so only occupied tiles
+    and the tiles around them (across periodic edges too) need evaluating.
+    """
+    occupied = tile_occupancy(types, tile)
+    tile_rows, tile_cols = occupied.shape
+    padded = np.zeros((tile_rows + 2, tile_cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = occupied
+    fill_ghost_ring(padded, mode_list)
+    active = occupied.copy()
+    for di, dj in NEIGHBOR_OFFSETS:
+        active |= padded[1 + di:1 + di + tile_rows, 1 + dj:1 + dj + tile_cols]
+    return active
+
+
+def random_candidates(types, histogram):
+    """Return the mask of cells whose transition may consume random draws.
+
+    These are Dead cells that are not born and have a cancer neighbor
+    (cancer spread and cure generation), and Cancer cells with a cure
+    neighbor (cure kill).
+    """
+    dead_candidates = (types == DEAD) & (histogram[ALIVE] != 3) & (histogram[CANCER] >= 1)
+    return dead_candidates | ((types == CANCER) & (histogram[CURE] >= 1))
+
+
+# SplitMix64 constants used to derive the Zobrist keys
+ZOBRIST_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+ZOBRIST_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+ZOBRIST_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def splitmix64(z):
+    """Apply the SplitMix64 finalizer to a uint64 array (wrapping arithmetic)"""
+    z = z + ZOBRIST_GAMMA
+    z = (z ^ (z >> np.uint64(30))) * ZOBRIST_MIX1
+    z = (z ^ (z >> np.uint64(27))) * ZOBRIST_MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def zobrist_keys(codes, rows, cols):
+    """Return the 64-bit Zobrist keys of type codes at (rows, cols) as a uint64 array
+
+    Each key is a SplitMix64 hash of (row, col, code) instead of an entry in
+    a stored table, so boards of any size need no per-cell memory. Rows and
+    columns (which may be negative in an unbounded universe) are each taken
+    modulo 2**32 and packed into separate halves of the hashed position.
+    Dead cells key to 0, so an all-Dead board hashes to 0.
+    """
+    codes, rows, cols = np.broadcast_arrays(np.atleast_1d(codes), rows, cols)
+    mask = np.uint64(0xFFFFFFFF)
+    rows = np.asarray(rows, dtype=np.int64).astype(np.uint64) & mask
+    cols = np.asarray(cols, dtype=np.int64).astype(np.uint64) & mask
+    codes = np.asarray(codes, dtype=np.uint64)
+    z = splitmix64(splitmix64((rows << np.uint64(32)) | cols) + codes)
+    return np.where(codes == DEAD, np.uint64(0), z)
+
+
+def splitmix64_int(z):
+    """Apply the SplitMix64 finalizer to one Python int, matching splitmix64()"""
+    z = (z + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+def zobrist_key(code, row, col):
+    """Return the Zobrist key of one cell as an int, equal to zobrist_keys() for it
+
+    Pure Python, for code that changes cells one at a time, where a NumPy
+    call per cell would cost far more than the hash itself.
+    """
+    if code == DEAD:
+        return 0
+    position = ((row & 0xFFFFFFFF) << 32) | (col & 0xFFFFFFFF)
+    return splitmix64_int((splitmix64_int(position) + code) & 0xFFFFFFFFFFFFFFFF)
+
+
+def xor_keys(keys):
+    """XOR an array of Zobrist keys together into one int hash"""
+    return int(np.bitwise_xor.reduce(keys, axis=None)) if keys.size else 0
+
+
+class UniformStream:
+    """Seeded source of uniform draws, handed out as one (u0, u1) pair per cell.
+
+    Pairs come out in the same order however they are requested, so an
+    engine that takes a whole generation's pairs in one batch and one that
+    takes them a cell at a time see identical values for the same seed.
+    """
+
+    # Pairs drawn at a time when pairs are requested one by one
+    batch_size = 1024
+    # Pairs depend only on the order they are requested in, not on cell positions
+    keyed = False
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.buffer = np.empty((0, 2))
+        self.position = 0
+        self.generation = 0
+
+    def take(self, count):
+        """Return the next count pairs as a (count, 2) array"""
+        available = len(self.buffer) - self.position
+        if available >= count:
+            pairs = self.buffer[self.position:self.position + count]
+            self.position += count
+            return pairs
+        # Drain what is buffered, then draw the rest in one batch
+        pairs = np.concatenate([self.buffer[self.position:], self.rng.random((count - available, 2))])
+        self.buffer = np.empty((0, 2))
+        self.position = 0
+        return pairs
+
+    def pair(self, row, col):
+        """Return the next pair as two floats (the cell position is not used)"""
+        if self.position == len(self.buffer):
+            self.buffer = self.rng.random((self.batch_size, 2))
+            self.position = 0
+        u0, u1 = self.buffer[self.position]
+        self.position += 1
+        return float(u0), float(u1)
+
+    def draw(self, rows, cols):
+        """Return (len(rows), 2) pairs for cells listed in row-major order (positions are not used)"""
+        return self.take(len(rows))
+
+    def fill(self, candidates, rand, origin=(0, 0)):
+        """Write the next pairs into rand[:, candidates] in row-major order (origin is not used)"""
+        rand[:, candidates] = self.take(int(np.count_nonzero(candidates))).T
+        return rand
+
+
+class CounterStream:
+    """Counter-based source of uniform pairs keyed on (seed, generation, row, col).
+
+    A cell's pair comes from Philox4x32-10 and depends only on the seed, the
+    generation being computed and the cell's position. Any split of the
+    board across tiles, processes or active subsets, evaluated in any order,
+    therefore reproduces the serial result exactly.
+    """
+
+    keyed = True
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int(np.random.default_rng().integers(2 ** 63))
+        self.seed = seed
+        self.generation = 0
+
+    def pairs_at(self, rows, cols):
+        """Return (u0, u1) arrays for the cells (rows[k], cols[k]) of the current generation"""
+        return uniform_pairs(self.seed, self.generation, rows, cols)
+
+    def draw(self, rows, cols):
+        """Return the (len(rows), 2) pairs of the cells (rows[k], cols[k])"""
+        return np.stack(self.pairs_at(rows, cols), axis=-1)
+
+    def pair(self, row, col):
+        """Return the pair of one cell as two floats"""
+        u0, u1 = self.pairs_at(row, col)
+        return float(u0), float(u1)
+
+    def fill(self, candidates, rand, origin=(0, 0)):
+        """Write the candidates' pairs into rand; origin is the board position of rand[:, 0, 0]"""
+        rows, cols = np.nonzero(candidates)
+        rand[0, rows, cols], rand[1, rows, cols] = self.pairs_at(rows + origin[0], cols + origin[1])
+        return rand
+
+
+class EnsembleStream:
+    """One uniform stream per replica of a (replicas, rows, cols) ensemble board.
+
+    Replica k draws exactly what a single board run with streams[k] would,
+    so an ensemble built from seeds reproduces one separate run per seed.
+
+    Every replica's pairs for a generation come out of one vectorized call.
+    CounterStream replicas evaluate Philox with per-cell keys. UniformStream
+    replicas are served from a pooled (replicas, pool_size, 2) buffer that
+    each stream's generator tops up in large batches; a generator yields
+    the same values however its draws are batched, so this matches taking
+    the pairs one generation at a time. Once the ensemble has drawn from
+    them, the streams themselves should not be used directly.
+    """
+
+    # Pairs per replica drawn into the pool at a time
+    pool_size = 4096
+
+    def __init__(self, streams):
+        self.streams = list(streams)
+        self.keyed = all(stream.keyed for stream in self.streams)
+        if all(isinstance(stream, CounterStream) for stream in self.streams):
+            keys = [seed_key(stream.seed) for stream in self.streams]
+            self.keys = tuple(np.array(words, dtype=np.uint64) for words in zip(*keys))
+        else:
+            self.keys = None
+        self.pool = None
+        self.pool_position = None
+
+    @classmethod
+    def from_seeds(cls, seeds, counter_rng=False):
+        """Create one UniformStream (or CounterStream) per seed"""
+        stream_class = CounterStream if counter_rng else UniformStream
+        return cls(stream_class(seed) for seed in seeds)
+
+    @property
+    def generation(self):
+        return self.streams[0].generation
+
+    @generation.setter
+    def generation(self, value):
+        for stream in self.streams:
+            stream.generation = value
+
+    def fill(self, candidates, rand, origin=(0, 0)):
+        """Fill each replica's candidates from its own stream; rand must be C-contiguous"""
+        # Flat indices list the candidates replica by replica, each in row-major order
+        cells = np.flatnonzero(candidates)
+        replicas, position = np.divmod(cells, candidates.shape[-2] * candidates.shape[-1])
+        flat = rand.reshape(2, -1)
+        if self.keys is not None:
+            rows, cols = np.divmod(position, candidates.shape[-1])
+            key = (self.keys[0][replicas], self.keys[1][replicas])
+            u0, u1 = keyed_uniform_pairs(key, self.generation, rows + origin[0], cols + origin[1])
+            flat[0, cells], flat[1, cells] = u0, u1
+        elif all(isinstance(stream, UniformStream) for stream in self.streams):
+            flat[:, cells] = self.take(replicas).T
+        else:
+            # Mixed stream kinds: draw replica by replica
+            rows, cols = np.divmod(position, candidates.shape[-1])
+            bounds = np.searchsorted(replicas, np.arange(len(self.streams) + 1))
+            pairs = np.concatenate([stream.draw(rows[start:stop] + origin[0], cols[start:stop] + origin[1])
+                                    for stream, start, stop in zip(self.streams, bounds[:-1], bounds[1:])])
+            flat[:, cells] = pairs.T
+        return rand
+
+    def take(self, replicas):
+        """Return the next pair of each listed replica's UniformStream, for replicas sorted ascending"""
+        counts = np.bincount(replicas, minlength=len(self.streams))
+        if self.pool is None or (self.pool_position + counts > self.pool.shape[1]).any():
+            self.refill_pool(counts)
+        # nonzero lists the candidates replica by replica, so each one's rank is its offset in its replica
+        starts = np.cumsum(counts) - counts
+        index = (self.pool_position - starts)[replicas] + np.arange(len(replicas))
+        self.pool_position += counts
+        return self.pool.reshape(-1, 2)[replicas * self.pool.shape[1] + index]
+
+    def refill_pool(self, counts):
+        """Top up every replica's pooled pairs so each holds at least counts[k] unused ones"""
+        if self.pool is None:
+            # Start from whatever the streams had buffered
+            left = [stream.buffer[stream.position:] for stream in self.streams]
+            for stream in self.streams:
+                stream.buffer = np.empty((0, 2))
+                stream.position = 0
+        else:
+            left = [pool[position:] for pool, position in zip(self.pool, self.pool_position)]
+        size = max(self.pool_size, max(len(pairs) for pairs in left) + int(counts.max()))
+        pool = np.empty((len(self.streams), size, 2))
+        for replica, stream in enumerate(self.streams):
+            pool[replica, :len(left[replica])] = left[replica]
+            pool[replica, len(left[replica]):] = stream.rng.random((size - len(left[replica]), 2))
+        self.pool = pool
+        self.pool_position = np.zeros(len(self.streams), dtype=np.int64)
+
+
+def weight_average(total, count, empty):
+    """Return total / count, or empty where count is zero"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, total / count, empty)
+
+
+def type_counts(types):
+    """Return Dead/Alive/Cancer/Cure counts over the last two axes as a (..., 4) array"""
+    return np.stack([np.count_nonzero(types == code, axis=(-2, -1)) for code in (DEAD, ALIVE, CANCER, CURE)],
+                    axis=-1)
+
+
+class VectorizedEngine:
+    """Steps a whole board per call using NumPy array operations"""
+
+    # Edge length of the square tiles used by step_active
+    tile_size = 32
+    # step_active falls back to a whole-board step above this active fraction
+    max_active_fraction = 0.5
+
+    def __init__(self, seed=None):
+        self.stream = UniformStream(seed)
+        self.last_active_tiles = None
+
+    def step(self, types, cancer_weighting, cure_weighting, mode_list, out=None):
+        """Compute the next generation and return (types, cancer, cure) arrays
+
+        When out is a (types, cancer, cure) tuple of preallocated arrays the
+        generation is written into them instead of into new arrays. The out
+        arrays must not overlap the inputs. Arrays may have leading ensemble
+        axes when the engine's stream is an EnsembleStream.
+        """
+        # Grids may store float32 weights; the rules are evaluated in float64
+        cancer_weighting = np.asarray(cancer_weighting, dtype=np.float64)
+        cure_weighting = np.asarray(cure_weighting, dtype=np.float64)
+        if out is None:
+            out = (np.empty(types.shape, dtype=np.uint8),
+                   np.empty(types.shape, dtype=np.float64),
+                   np.empty(types.shape, dtype=np.float64))
+
+        # One sweep gathers the counts (which honor the boundary modes) and
+        # the in-bounds weight sums that every rule below consumes
+        histogram = neighbor_histogram(types, cancer_weighting, cure_weighting, mode_list)
+        # One batch of draws per generation, only for the cells that can use them
+        rand = self.stream.fill(random_candidates(types, histogram), np.zeros((2,) + types.shape))
+        self.apply_rules(types, cancer_weighting, cure_weighting, histogram, rand, out)
+        return out
+
+    def run_ensemble(self, types, cancer_weighting, cure_weighting, mode_list, generations):
+        """Advance a (replicas, rows, cols) ensemble and record its populations
+
+        Every generation is one step() over the whole ensemble. Returns
+        ((types, cancer, cure), trajectories) where trajectories[k, g] holds
+        replica k's Dead/Alive/Cancer/Cure counts after generation g + 1.
+        """
+        board = (types, np.asarray(cancer_weighting, dtype=np.float64),
+                 np.asarray(cure_weighting, dtype=np.float64))
+        # Two buffers alternate as the written generation
+        buffers = [tuple(np.empty_like(array) for array in board) for _ in range(2)]
+        trajectories = np.zeros((types.shape[0], generations, 4), dtype=np.int64)
+        for generation in range(generations):
+            board = self.step(*board, mode_list, out=buffers[generation % 2])
+            self.stream.generation += 1
+            trajectories[:, generation] = type_counts(board[0])
+        return board, trajectories
+
+    def step_active(self, types, cancer_weighting, cure_weighting, mode_list, out):
+        """Advance only the tiles near non-Dead cells, writing into out in place.
+
+        out must be a previous generation of the same board, such as the back
+        buffer of a GameRunner. Tiles that are skipped are cleared to Dead
+        wherever out still holds cells from that older generation. Returns
+        the number of tiles evaluated.
+        """
+        cancer_weighting = np.asarray(cancer_weighting, dtype=np.float64)
+        cure_weighting = np.asarray(cure_weighting, dtype=np.float64)
+        rows, cols = types.shape
+        tile = self.tile_size
+
+        active = active_tiles(types, tile, mode_list)
+        self.last_active_tiles = active
+        if active.mean() > self.max_active_fraction:
+            self.step(types, cancer_weighting, cure_weighting, mode_list, out)
+            return active.size
+
+        for tile_row, tile_col in zip(*np.nonzero(tile_occupancy(out[0], tile) & ~active)):
+            block = np.s_[tile_row * tile:(tile_row + 1) * tile, tile_col * tile:(tile_col + 1) * tile]
+            out[0][block] = DEAD
+            out[1][block] = 0.0
+            out[2][block] = 0.0
+
+        # Gather every active tile's histogram and candidates first, so the
+        # draws are handed out in the same row-major order as a full step
+        candidates = np.zeros(types.shape, dtype=bool)
+        blocks = []
+        for tile_row, tile_col in zip(*np.nonzero(active)):
+            row_start, col_start = tile_row * tile, tile_col * tile
+            row_stop, col_stop = min(row_start + tile, rows), min(col_start + tile, cols)
+            block = np.s_[row_start:row_stop, col_start:col_stop]
+            histogram = neighbor_histogram(types, cancer_weighting, cure_weighting, mode_list,
+                                           window=(row_start, row_stop, col_start, col_stop))
+            candidates[block] = random_candidates(types[block], histogram)
+            blocks.append((block, histogram))
+
+        rand = self.stream.fill(candidates, np.zeros((2,) + types.shape))
+        for block, histogram in blocks:
+            self.apply_rules(types[block], cancer_weighting[block], cure_weighting[block],
+                             histogram, rand[(slice(None),) + block], tuple(array[block] for array in out))
+        return int(active.sum())
+
+    def apply_rules(self, types, cancer_weighting, cure_weighting, histogram, rand, out):
+        """Write the next state of a block of cells into the out arrays
+
+        histogram is the neighbor_histogram of the block and rand holds two
+        uniform draws per cell: rand[0] for cancer spread or cure kill,
+        rand[1] for cure generation. Only cells in random_candidates read them.
+        """
+        new_types, new_cancer, new_cure = out
+        new_cancer.fill(0.0)
+        new_cure.fill(0.0)
+
+        # Births and AliveCell survival are plain B3/S23; ALIVE is 1 and DEAD is 0
+        is_dead = types == DEAD
+        alive_n = histogram[ALIVE]
+        born = is_dead & (alive_n == 3)
+        np.copyto(new_types, born | ((types == ALIVE) & ((alive_n == 2) | (alive_n == 3))))
+
+        # The weighted rules are evaluated only over the cells each one applies to. Those
+        # cells and the histogram channels each rule reads are gathered by flat index,
+        # which is much cheaper than boolean-mask indexing
+        histogram = histogram.reshape(HISTOGRAM_CHANNELS, -1)
+        rand = rand.reshape(2, -1)
+        dead = np.flatnonzero(is_dead & ~born & (histogram[CANCER].reshape(types.shape) >= 1))
+        if dead.size:
+            self.apply_dead_rules(histogram, rand, dead, out)
+        cancer = np.flatnonzero(types == CANCER)
+        if cancer.size:
+            self.apply_cancer_rules(np.ravel(cancer_weighting).take(cancer), histogram, rand, cancer, out)
+        cure = np.flatnonzero(types == CURE)
+        if cure.size:
+            self.apply_cure_rules(np.ravel(cure_weighting).take(cure), histogram, cure, out)
+
+    def apply_dead_rules(self, histogram, rand, cells, out):
+        """DeadCell that is not born but has a cancer neighbor: cancer spread, then cure generation
+
+        histogram and rand are flattened to (channels, cells); cells are the
+        flat indices of the cells this rule applies to.
+        """
+        new_types, new_cancer, new_cure = out
+        cancer_count = histogram[HIST_CANCER_COUNT].take(cells)
+        avg_cancer = weight_average(histogram[HIST_CANCER_TOTAL].take(cells), cancer_count, 0.0)
+        avg_cure = weight_average(histogram[HIST_CURE_TOTAL].take(cells), histogram[HIST_CURE_COUNT].take(cells),
+                                  BASE_CURE_WEIGHT)
+
+        cancer_chance = np.minimum(1.0, 0.1 * (avg_cancer / BASE_CANCER_WEIGHT))
+        spread = (cancer_count > 0) & (rand[0].take(cells) < cancer_chance)
+        cure_chance = np.minimum(1.0, 0.5 * (avg_cure / BASE_CURE_WEIGHT))
+        spawn = ~spread & (histogram[CANCER].take(cells) >= 5) & (rand[1].take(cells) < cure_chance)
+
+        np.put(new_types, cells, np.where(spread, CANCER, np.where(spawn, CURE, DEAD)))
+        np.put(new_cancer, cells, np.where(spread, avg_cancer, 0.0))
+        np.put(new_cure, cells, np.where(spawn, avg_cure, 0.0))
+
+    def apply_cancer_rules(self, cancer_weighting, histogram, rand, cells, out):
+        """CancerCell: cure kill chance vs resistance, then overcrowding"""
+        new_types, new_cancer, _ = out
+        avg_cure = weight_average(histogram[HIST_CURE_TOTAL].take(cells), histogram[HIST_CURE_COUNT].take(cells),
+                                  BASE_CURE_WEIGHT)
+
+        cancer_ratio = cancer_weighting / BASE_CANCER_WEIGHT
+        cure_kill_chance = (avg_cure / BASE_CURE_WEIGHT) * 0.5
+        cancer_resistance = cancer_ratio * 0.1
+        effective_cure_chance = np.maximum(0.3, cure_kill_chance - cancer_resistance)
+        cured = (histogram[CURE].take(cells) >= 1) & (rand[0].take(cells) < effective_cure_chance)
+        overcrowd_threshold = np.maximum(5, np.trunc(7 - (cancer_ratio - 1)))
+        survives = ~cured & (histogram[CANCER].take(cells) < overcrowd_threshold)
+
+        np.put(new_types, cells, np.where(cured, ALIVE, np.where(survives, CANCER, DEAD)))
+        np.put(new_cancer, cells, np.where(survives, cancer_weighting, 0.0))
+
+    def apply_cure_rules(self, cure_weighting, histogram, cells, out):
+        """CureCell: isolation and overcrowding thresholds scale with weight"""
+        new_types, _, new_cure = out
+        cure_modifier = (cure_weighting / BASE_CURE_WEIGHT) - 1
+        dead_threshold = np.maximum(4, np.trunc(6 + cure_modifier))
+        cure_threshold = np.maximum(2, np.trunc(3 + cure_modifier))
+        persists = (histogram[DEAD].take(cells) < dead_threshold) & (histogram[CURE].take(cells) < cure_threshold)
+
+        np.put(new_types, cells, np.where(persists, CURE, DEAD))
+        np.put(new_cure, cells, np.where(persists, cure_weighting, 0.0))